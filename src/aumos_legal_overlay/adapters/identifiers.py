@@ -0,0 +1,24 @@
+"""Identifier generation shared by the adapters.
+
+Bulk paths (batch collection, bulk registration, hold creation) need many
+UUID4s at once; drawing them from one entropy read avoids a system call per id.
+"""
+
+import os
+import uuid
+
+
+def uuid4_batch(count: int) -> list[str]:
+    """Generate UUID4 strings from a single entropy read.
+
+    Args:
+        count: Number of ids to generate.
+
+    Returns:
+        Canonical UUID4 strings.
+    """
+    entropy = os.urandom(16 * count)
+    return [str(uuid.UUID(bytes=entropy[index * 16 : (index + 1) * 16], version=4)) for index in range(count)]
+
+
+__all__ = ["uuid4_batch"]
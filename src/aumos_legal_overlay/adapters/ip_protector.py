@@ -13,6 +13,8 @@ from typing import Any
 
 from aumos_common.observability import get_logger
 
+from aumos_legal_overlay.adapters.identifiers import uuid4_batch
+
 logger = get_logger(__name__)
 
 
@@ -61,6 +63,9 @@ _TRAINING_DATA_RISK_FACTORS: dict[str, str] = {
     "government_data": "minimal",
 }
 
+# Risk levels that flag a training data source as an infringement concern
+_HIGH_RISK: frozenset[str] = frozenset({"high", "critical"})
+
 # Infringement risk assessment by scenario
 _INFRINGEMENT_SCENARIOS: dict[str, dict[str, Any]] = {
     "model_replication": {
@@ -95,6 +100,33 @@ _INFRINGEMENT_SCENARIOS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Affected IP category reported for each infringement scenario
+_SCENARIO_CATEGORY: dict[str, str] = {
+    scenario_name: scenario_name.split("_")[0] for scenario_name in _INFRINGEMENT_SCENARIOS
+}
+
+# Clearance checklist steps following the registrar search, by asset type
+_CLEARANCE_STEPS: dict[str, tuple[str, ...]] = {
+    "trademark": (
+        "Conduct knockout search for phonetically similar names (trademark).",
+        "Consult IP counsel for clearance opinion.",
+        "File application upon clearance confirmation.",
+    ),
+    "patent": (
+        "Review prior art databases (USPTO, Google Patents).",
+        "Consult IP counsel for clearance opinion.",
+        "File application upon clearance confirmation.",
+    ),
+    "copyright": (
+        "Consult IP counsel for clearance opinion.",
+        "File application upon clearance confirmation.",
+    ),
+    "trade_secret": (
+        "Consult IP counsel for clearance opinion.",
+        "File application upon clearance confirmation.",
+    ),
+}
+
 
 @dataclass
 class IPAsset:
@@ -187,6 +219,7 @@ class IPProtector:
         ai_related: bool = False,
         training_data_source: str | None = None,
         metadata: dict[str, Any] | None = None,
+        asset_id: str | None = None,
     ) -> IPAsset:
         """Register a new IP asset in the registry.
 
@@ -202,6 +235,8 @@ class IPProtector:
             ai_related: Whether this asset relates to AI/ML.
             training_data_source: Training data source type if applicable.
             metadata: Additional metadata dict.
+            asset_id: Caller-supplied asset ID (e.g. from a migration source);
+                a random UUID4 is generated if None.
 
         Returns:
             Registered IPAsset.
@@ -209,14 +244,15 @@ class IPProtector:
         Raises:
             ValueError: If asset_type is not recognized.
         """
-        if asset_type not in _IP_ASSET_TYPES:
+        type_info = _IP_ASSET_TYPES.get(asset_type)
+        if type_info is None:
             raise ValueError(
                 f"Unknown asset_type '{asset_type}'. "
                 f"Supported: {list(_IP_ASSET_TYPES.keys())}"
             )
 
-        asset_id = str(uuid.uuid4())
-        type_info = _IP_ASSET_TYPES[asset_type]
+        if asset_id is None:
+            asset_id = str(uuid.uuid4())
         term_years = protection_term_years or type_info.get("protection_term_years")
 
         expiration_date: date | None = None
@@ -249,6 +285,30 @@ class IPProtector:
         )
         return asset
 
+    def register_assets_bulk(self, rows: list[dict[str, Any]]) -> list[IPAsset]:
+        """Register many IP assets in one call, e.g. from a CSV or database import.
+
+        Asset IDs for rows that do not carry their own ``asset_id`` come from
+        one uuid4_batch call instead of one entropy read per asset.
+
+        Args:
+            rows: Keyword-argument dicts accepted by register_asset.
+
+        Returns:
+            Registered IPAssets in input order.
+
+        Raises:
+            ValueError: If any row has an unrecognized asset_type. Rows before
+                the failing row remain registered.
+        """
+        generated_ids = uuid4_batch(len(rows))
+        assets: list[IPAsset] = []
+        for index, row in enumerate(rows):
+            if row.get("asset_id") is None:
+                row = {**row, "asset_id": generated_ids[index]}
+            assets.append(self.register_asset(**row))
+        return assets
+
     def classify_model_ip(
         self,
         model_name: str,
@@ -298,7 +358,7 @@ class IPProtector:
         # Assess training data risk
         for source in training_data_sources:
             risk = _TRAINING_DATA_RISK_FACTORS.get(source, "medium")
-            if risk in ("high", "critical"):
+            if risk in _HIGH_RISK:
                 risk_factors.append(
                     f"Training data source '{source}' carries {risk} IP infringement risk."
                 )
@@ -358,7 +418,7 @@ class IPProtector:
         # Check training data scenarios
         for source in training_data_sources:
             source_risk = _TRAINING_DATA_RISK_FACTORS.get(source, "medium")
-            if source_risk in ("high", "critical"):
+            if source_risk in _HIGH_RISK:
                 scenario = _INFRINGEMENT_SCENARIOS["trade_secret_misappropriation"]
                 scenario_assessments.append({
                     "scenario": "trade_secret_misappropriation",
@@ -412,7 +472,7 @@ class IPProtector:
         litigation_risk = risk_multiplier.get(highest_risk, 200_000) * len(deployment_jurisdictions)
 
         affected_ip_types = list({
-            sc["scenario"].split("_")[0] for sc in scenario_assessments
+            _SCENARIO_CATEGORY[sc["scenario"]] for sc in scenario_assessments
         })
 
         assessment = InfringementRiskAssessment(
@@ -448,6 +508,7 @@ class IPProtector:
         by_status: dict[str, int] = {}
         expiring_soon: list[dict[str, Any]] = []
         ai_related_count = 0
+        today_ordinal = now.toordinal()
 
         for asset in assets:
             by_type[asset.asset_type] = by_type.get(asset.asset_type, 0) + 1
@@ -455,15 +516,10 @@ class IPProtector:
             if asset.ai_related:
                 ai_related_count += 1
             if asset.expiration_date:
-                days_until_expiry = (asset.expiration_date - now).days
+                days_until_expiry = asset.expiration_date.toordinal() - today_ordinal
                 if 0 <= days_until_expiry <= 365:
-                    expiring_soon.append({
-                        "asset_id": asset.asset_id,
-                        "asset_name": asset.asset_name,
-                        "asset_type": asset.asset_type,
-                        "expiration_date": asset.expiration_date.isoformat(),
-                        "days_until_expiry": days_until_expiry,
-                    })
+                    expiring_soon.append(self._expiring_entry(asset, days_until_expiry))
+        expiring_soon.sort(key=lambda a: a["days_until_expiry"])
 
         report = {
             "tenant_id": self._tenant_id,
@@ -472,7 +528,7 @@ class IPProtector:
             "ai_related_assets": ai_related_count,
             "assets_by_type": by_type,
             "assets_by_status": by_status,
-            "expiring_within_12_months": sorted(expiring_soon, key=lambda a: a["days_until_expiry"]),
+            "expiring_within_12_months": expiring_soon,
             "top_jurisdictions": self._compute_top_jurisdictions(assets),
         }
 
@@ -484,6 +540,25 @@ class IPProtector:
         )
         return report
 
+    @staticmethod
+    def _expiring_entry(asset: IPAsset, days_until_expiry: int) -> dict[str, Any]:
+        """Build the expiring-asset entry used in portfolio reports.
+
+        Args:
+            asset: Asset with a known expiration date.
+            days_until_expiry: Days remaining until expiration.
+
+        Returns:
+            Dict describing the expiring asset.
+        """
+        return {
+            "asset_id": asset.asset_id,
+            "asset_name": asset.asset_name,
+            "asset_type": asset.asset_type,
+            "expiration_date": asset.expiration_date.isoformat() if asset.expiration_date else None,
+            "days_until_expiry": days_until_expiry,
+        }
+
     def _compute_top_jurisdictions(self, assets: list[IPAsset]) -> list[dict[str, Any]]:
         """Compute jurisdiction coverage counts across assets.
 
@@ -520,7 +595,17 @@ class IPProtector:
 
         Returns:
             Dict with clearance_status, conflicts_found, and required_steps.
+
+        Raises:
+            ValueError: If proposed_asset_type is not recognized.
         """
+        type_info = _IP_ASSET_TYPES.get(proposed_asset_type)
+        if type_info is None:
+            raise ValueError(
+                f"Unknown asset_type '{proposed_asset_type}'. "
+                f"Supported: {list(_IP_ASSET_TYPES.keys())}"
+            )
+
         workflow_id = str(uuid.uuid4())
         conflicts: list[dict[str, str]] = []
 
@@ -540,13 +625,9 @@ class IPProtector:
                 })
 
         required_steps = [
-            f"Search {_IP_ASSET_TYPES[proposed_asset_type]['registrar'] or 'relevant databases'} for '{proposed_asset_name}'.",
-            "Conduct knockout search for phonetically similar names (trademark)." if proposed_asset_type == "trademark" else "",
-            "Review prior art databases (USPTO, Google Patents)." if proposed_asset_type == "patent" else "",
-            "Consult IP counsel for clearance opinion.",
-            "File application upon clearance confirmation.",
+            f"Search {type_info['registrar'] or 'relevant databases'} for '{proposed_asset_name}'.",
+            *_CLEARANCE_STEPS[proposed_asset_type],
         ]
-        required_steps = [s for s in required_steps if s]
 
         clearance_status = "blocked" if conflicts else "clear_pending_search"
 
@@ -4,6 +4,12 @@ GAP-319: Multi-Jurisdictional Privilege Rules.
 """
 from __future__ import annotations
 
+import bisect
+import dataclasses
+import functools
+import operator
+import time
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from typing import Any
@@ -12,25 +18,85 @@ from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
+_effective_date_key = operator.attrgetter("effective_date")
 
-@dataclass
+# (monotonic timestamp, UTC date) of the last clock read; see _today_utc
+_today_cache: tuple[float, date] = (float("-inf"), date.min)
+
+
+def _today_utc() -> date:
+    """Return today's UTC date, re-reading the wall clock at most once per second.
+
+    Returns:
+        The current UTC date.
+    """
+    global _today_cache
+    now = time.monotonic()
+    checked_at, today = _today_cache
+    if now - checked_at > 1.0:
+        today = datetime.now(timezone.utc).date()
+        _today_cache = (now, today)
+    return today
+
+
+@dataclass(frozen=True, slots=True)
 class JurisdictionRule:
     """A privilege rule specific to a jurisdiction.
 
     Covers US federal, US state, and international jurisdictions.
     jurisdiction_code uses ISO 3166-2 for US states (e.g., "US-CA", "US-NY")
     and ISO 3166-1 alpha-2 for countries (e.g., "UK", "DE", "AU").
+    Rules are immutable so built-in instances can be shared across engines;
+    deactivation replaces the rule inside the owning engine. metadata is
+    left out of the hash so rules stay hashable.
     """
 
     jurisdiction_code: str          # e.g., "US-CA", "UK", "DE", "US-FEDERAL"
     rule_type: str                  # attorney_client | work_product | common_interest | mediation
     description: str
     effective_date: date
+    rule_id: str | None = None      # Stable identifier referenced by supersedes_rule_id
     supersedes_rule_id: str | None = None
     is_active: bool = True
     citation: str = ""              # Statutory or case law citation
     notes: str = ""
-    metadata: dict[str, Any] = field(default_factory=dict)
+    metadata: dict[str, Any] = field(default_factory=dict, hash=False)
+    # First 200 characters of description, computed once for response payloads
+    description_preview: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "description_preview", self.description[:200])
+
+
+@dataclass(frozen=True, slots=True)
+class PrivilegeRiskAssessment:
+    """Result of a jurisdiction-aware privilege risk assessment.
+
+    applicable_rules is shared between assessments for the same jurisdiction
+    and must be treated as read-only.
+    """
+
+    jurisdiction_code: str
+    communication_type: str
+    privilege_likely: bool
+    risk_level: str                 # low | medium | high
+    applicable_rules: tuple[dict[str, Any], ...]
+    risk_notes: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize the assessment to a plain dict at an API or event boundary.
+
+        Returns:
+            Dict with privilege_likely, risk_level, applicable_rules, and risk_notes.
+        """
+        return {
+            "jurisdiction_code": self.jurisdiction_code,
+            "communication_type": self.communication_type,
+            "privilege_likely": self.privilege_likely,
+            "risk_level": self.risk_level,
+            "applicable_rules": [dict(rule) for rule in self.applicable_rules],
+            "risk_notes": list(self.risk_notes),
+        }
 
 
 # Bundled default rules for major jurisdictions
@@ -185,6 +251,95 @@ BUILT_IN_RULES: list[dict[str, Any]] = [
     },
 ]
 
+# Built-in rules instantiated once at import and shared by every engine
+_BUILT_IN_RULE_OBJS: tuple[JurisdictionRule, ...] = tuple(
+    JurisdictionRule(**rule_data) for rule_data in BUILT_IN_RULES
+)
+
+# EU member jurisdictions whose queries also return EU-level rules
+_EU_MEMBERS: frozenset[str] = frozenset({"UK", "DE", "FR", "IT", "ES", "NL", "BE", "SE", "PL"})
+
+
+class _TrieNode:
+    """Node of a JurisdictionTrie, one per hyphen-separated code segment."""
+
+    __slots__ = ("children", "is_code")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.is_code = False
+
+
+class JurisdictionTrie:
+    """Prefix tree over hyphen-separated jurisdiction codes.
+
+    Resolves the ancestor chain of a code (e.g. "US-CA-LA" -> "US-CA") in
+    O(segments), plus registered parent aliases that are not prefixes,
+    such as "EU" for member states or "US-FEDERAL" for everything under "US-".
+    """
+
+    def __init__(self) -> None:
+        self._root = _TrieNode()
+        self._parents: dict[str, list[str]] = {}
+        self._descendant_parents: dict[str, list[str]] = {}
+
+    def insert(self, jurisdiction_code: str) -> None:
+        """Register a jurisdiction code that has rules.
+
+        Args:
+            jurisdiction_code: Jurisdiction identifier, e.g. "US-CA".
+        """
+        node = self._root
+        for segment in jurisdiction_code.split("-"):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.is_code = True
+
+    def add_parent(self, jurisdiction_code: str, parent_code: str, descendants_only: bool = False) -> None:
+        """Register a parent jurisdiction that is not a code prefix.
+
+        Args:
+            jurisdiction_code: Code (or code prefix) the parent applies to.
+            parent_code: Parent jurisdiction whose rules also apply.
+            descendants_only: Apply only to codes below jurisdiction_code,
+                not to jurisdiction_code itself.
+        """
+        target = self._descendant_parents if descendants_only else self._parents
+        target.setdefault(jurisdiction_code, []).append(parent_code)
+
+    def ancestors(self, jurisdiction_code: str) -> list[str]:
+        """Return the codes whose rules apply to a query, most specific first.
+
+        Args:
+            jurisdiction_code: Jurisdiction identifier being queried.
+
+        Returns:
+            The code itself, registered prefix codes (longest first), then
+            registered parent aliases.
+        """
+        segments = jurisdiction_code.split("-")
+        # Proper prefixes, longest first: "US-CA-LA" -> ["US-CA", "US"]
+        prefixes = ["-".join(segments[:depth]) for depth in range(len(segments) - 1, 0, -1)]
+
+        prefix_codes: list[str] = []
+        node = self._root
+        for segment, prefix in zip(segments[:-1], reversed(prefixes), strict=True):
+            child = node.children.get(segment)
+            if child is None:
+                break
+            if child.is_code:
+                prefix_codes.append(prefix)
+            node = child
+
+        result = [jurisdiction_code, *reversed(prefix_codes)]
+        for parent in self._parents.get(jurisdiction_code, ()):
+            if parent not in result:
+                result.append(parent)
+        for prefix in prefixes:
+            for parent in (*self._parents.get(prefix, ()), *self._descendant_parents.get(prefix, ())):
+                if parent not in result:
+                    result.append(parent)
+        return result
+
 
 class JurisdictionRuleEngine:
     """Configurable multi-jurisdictional privilege rule engine.
@@ -196,13 +351,42 @@ class JurisdictionRuleEngine:
 
     def __init__(self) -> None:
         self._rules: list[JurisdictionRule] = []
+        # Lookup indexes: rules per jurisdiction and per (jurisdiction, rule_type),
+        # each bucket kept sorted by effective_date.
+        self._by_code: dict[str, list[JurisdictionRule]] = {}
+        self._by_code_type: dict[tuple[str, str], list[JurisdictionRule]] = {}
+        self._by_id: dict[str, JurisdictionRule] = {}
+        # Per-engine memo of resolved lookups; cleared whenever a rule is added.
+        self._lookup_rules_cached = functools.lru_cache(maxsize=1024)(self._lookup_rules)
+        # Rendered applicable_rules payload per jurisdiction, tagged with the date it was resolved for.
+        self._rendered_rules: dict[str, tuple[date, tuple[dict[str, Any], ...]]] = {}
+        self._trie = JurisdictionTrie()
+        self._trie.add_parent("US", "US-FEDERAL", descendants_only=True)
+        for member in _EU_MEMBERS:
+            self._trie.add_parent(member, "EU")
         self._load_built_in_rules()
 
     def _load_built_in_rules(self) -> None:
         """Load built-in jurisdiction rules from the bundled rule set."""
-        for rule_data in BUILT_IN_RULES:
-            self._rules.append(JurisdictionRule(**rule_data))
-        logger.info("jurisdiction_rules_loaded", count=len(self._rules))
+        for rule in _BUILT_IN_RULE_OBJS:
+            self._index_rule(rule)
+        logger.debug("jurisdiction_rules_loaded", count=len(self._rules))
+
+    def _index_rule(self, rule: JurisdictionRule) -> None:
+        """Store a rule and add it to the lookup indexes.
+
+        Args:
+            rule: JurisdictionRule to index.
+        """
+        self._rules.append(rule)
+        if rule.rule_id:
+            self._by_id[rule.rule_id] = rule
+        self._trie.insert(rule.jurisdiction_code)
+        for bucket in (
+            self._by_code.setdefault(rule.jurisdiction_code, []),
+            self._by_code_type.setdefault((rule.jurisdiction_code, rule.rule_type), []),
+        ):
+            bucket.insert(bisect.bisect_right(bucket, rule.effective_date, key=_effective_date_key), rule)
 
     def get_rules(
         self,
@@ -214,8 +398,9 @@ class JurisdictionRuleEngine:
 
         Args:
             jurisdiction_code: Jurisdiction identifier (e.g., "US-CA", "UK", "DE").
-                               Searches both exact match and parent jurisdiction
-                               (e.g., "US-CA" query also returns "US-FEDERAL" rules).
+                               Searches both exact match and parent jurisdictions
+                               (e.g., "US-CA" query also returns "US-FEDERAL" rules,
+                               "US-CA-LA" also returns "US-CA" rules).
             rule_type: Optional filter by privilege type (attorney_client, work_product, etc.).
             as_of_date: Return rules effective as of this date (default: today).
 
@@ -223,55 +408,107 @@ class JurisdictionRuleEngine:
             List of JurisdictionRule records matching the query, ordered by specificity
             (jurisdiction-specific rules before federal/country-level rules).
         """
-        effective_date = as_of_date or datetime.now(timezone.utc).date()
-
-        # Build jurisdiction search set: exact match + parent jurisdictions
-        search_codes = {jurisdiction_code}
-        if jurisdiction_code.startswith("US-") and jurisdiction_code != "US-FEDERAL":
-            search_codes.add("US-FEDERAL")
-        if jurisdiction_code in ("UK", "DE", "FR", "IT", "ES", "NL", "BE", "SE", "PL"):
-            search_codes.add("EU")
-
-        matching = [
-            rule for rule in self._rules
-            if rule.jurisdiction_code in search_codes
-            and rule.is_active
-            and rule.effective_date <= effective_date
-            and (rule_type is None or rule.rule_type == rule_type)
-        ]
-
-        # Sort: jurisdiction-specific rules first, then broader (federal/EU)
-        matching.sort(
-            key=lambda r: (0 if r.jurisdiction_code == jurisdiction_code else 1, r.effective_date),
-            reverse=False,
-        )
-        return matching
+        effective_date = as_of_date or _today_utc()
+        return list(self._lookup_rules_cached(jurisdiction_code, rule_type, effective_date))
+
+    def _lookup_rules(
+        self,
+        jurisdiction_code: str,
+        rule_type: str | None,
+        effective_date: date,
+    ) -> tuple[JurisdictionRule, ...]:
+        """Resolve the rules for a get_rules query from the lookup indexes.
+
+        Args:
+            jurisdiction_code: Jurisdiction identifier being queried.
+            rule_type: Optional privilege type filter.
+            effective_date: Only rules effective on or before this date match.
+
+        Returns:
+            Matching rules ordered by specificity, then effective date.
+        """
+        index: dict[Any, list[JurisdictionRule]] = self._by_code if rule_type is None else self._by_code_type
+
+        def effective(code: str) -> list[JurisdictionRule]:
+            bucket = index.get(code if rule_type is None else (code, rule_type), [])
+            return [rule for rule in bucket if rule.is_active and rule.effective_date <= effective_date]
+
+        # Buckets are pre-sorted by effective_date, so specificity ordering is a
+        # concatenation: jurisdiction-specific rules first, then broader ones
+        # (state before federal, member state before EU).
+        matching: list[JurisdictionRule] = []
+        for code in self._trie.ancestors(jurisdiction_code):
+            matching.extend(effective(code))
+        return tuple(matching)
 
     def add_custom_rule(self, rule: JurisdictionRule) -> None:
         """Add a custom jurisdiction rule.
 
         Args:
-            rule: JurisdictionRule to add. Will supersede existing rules
-                  if rule.supersedes_rule_id is set.
+            rule: JurisdictionRule to add. Will supersede the existing rule
+                  whose rule_id matches rule.supersedes_rule_id, if any.
         """
         if rule.supersedes_rule_id:
-            for existing in self._rules:
-                if hasattr(existing, "rule_id") and getattr(existing, "rule_id", None) == rule.supersedes_rule_id:
-                    existing.is_active = False
-        self._rules.append(rule)
+            superseded = self._by_id.get(rule.supersedes_rule_id)
+            if superseded is not None:
+                self._deactivate_rule(superseded)
+        self._index_rule(rule)
+        self._lookup_rules_cached.cache_clear()
+        self._rendered_rules.clear()
         logger.info(
             "jurisdiction_rule_added",
             jurisdiction_code=rule.jurisdiction_code,
             rule_type=rule.rule_type,
         )
 
+    def _deactivate_rule(self, rule: JurisdictionRule) -> None:
+        """Swap a rule for an inactive copy in this engine's rule list and indexes.
+
+        Args:
+            rule: The rule to deactivate.
+        """
+        inactive = dataclasses.replace(rule, is_active=False)
+        for rules in (
+            self._rules,
+            self._by_code[rule.jurisdiction_code],
+            self._by_code_type[(rule.jurisdiction_code, rule.rule_type)],
+        ):
+            rules[rules.index(rule)] = inactive
+        if rule.rule_id:
+            self._by_id[rule.rule_id] = inactive
+
+    def _render_applicable_rules(self, jurisdiction_code: str) -> tuple[dict[str, Any], ...]:
+        """Return the applicable_rules payload for a jurisdiction, rendering it at most once per day.
+
+        Args:
+            jurisdiction_code: Jurisdiction where privilege is assessed.
+
+        Returns:
+            Shared tuple of rule summary dicts for the rules in effect today.
+        """
+        today = _today_utc()
+        cached = self._rendered_rules.get(jurisdiction_code)
+        if cached is not None and cached[0] == today:
+            return cached[1]
+        rendered = tuple(
+            {
+                "jurisdiction_code": r.jurisdiction_code,
+                "rule_type": r.rule_type,
+                "citation": r.citation,
+                "description": r.description_preview,
+            }
+            for r in self.get_rules(jurisdiction_code, as_of_date=today)
+        )
+        self._rendered_rules[jurisdiction_code] = (today, rendered)
+        return rendered
+
     def assess_privilege_risk(
         self,
         jurisdiction_code: str,
         communication_type: str,
         is_in_house_counsel: bool = False,
         is_litigation_anticipated: bool = False,
-    ) -> dict[str, Any]:
+    ) -> PrivilegeRiskAssessment:
         """Assess privilege risk for a communication in a given jurisdiction.
 
         Args:
@@ -281,9 +518,72 @@ class JurisdictionRuleEngine:
             is_litigation_anticipated: Whether litigation is anticipated at time of communication.
 
         Returns:
-            Risk assessment dict with privilege_likely, risk_level, applicable_rules, and notes.
+            PrivilegeRiskAssessment with privilege_likely, risk_level, applicable_rules,
+            and notes. Call to_dict() only when a plain dict is needed for serialization.
+        """
+        return self._assess(
+            jurisdiction_code,
+            communication_type,
+            is_in_house_counsel,
+            is_litigation_anticipated,
+            self._render_applicable_rules(jurisdiction_code),
+        )
+
+    def assess_privilege_risk_batch(
+        self,
+        records: Sequence[tuple[str, str, bool, bool]],
+    ) -> list[PrivilegeRiskAssessment]:
+        """Assess privilege risk for many communications in one call.
+
+        Applicable rules are resolved once per distinct jurisdiction in the
+        batch rather than once per record.
+
+        Args:
+            records: (jurisdiction_code, communication_type, is_in_house_counsel,
+                     is_litigation_anticipated) tuples, e.g. one per document in
+                     a screening batch.
+
+        Returns:
+            One PrivilegeRiskAssessment per record, in input order.
+        """
+        rules_by_code: dict[str, tuple[dict[str, Any], ...]] = {}
+        assessments: list[PrivilegeRiskAssessment] = []
+        for jurisdiction_code, communication_type, is_in_house_counsel, is_litigation_anticipated in records:
+            applicable_rules = rules_by_code.get(jurisdiction_code)
+            if applicable_rules is None:
+                applicable_rules = self._render_applicable_rules(jurisdiction_code)
+                rules_by_code[jurisdiction_code] = applicable_rules
+            assessments.append(
+                self._assess(
+                    jurisdiction_code,
+                    communication_type,
+                    is_in_house_counsel,
+                    is_litigation_anticipated,
+                    applicable_rules,
+                )
+            )
+        return assessments
+
+    def _assess(
+        self,
+        jurisdiction_code: str,
+        communication_type: str,
+        is_in_house_counsel: bool,
+        is_litigation_anticipated: bool,
+        applicable_rules: tuple[dict[str, Any], ...],
+    ) -> PrivilegeRiskAssessment:
+        """Apply the privilege risk heuristics for one communication.
+
+        Args:
+            jurisdiction_code: Jurisdiction where privilege is assessed.
+            communication_type: Type of communication.
+            is_in_house_counsel: Whether the communication involves in-house counsel only.
+            is_litigation_anticipated: Whether litigation is anticipated at time of communication.
+            applicable_rules: Rendered rule summaries for the jurisdiction.
+
+        Returns:
+            PrivilegeRiskAssessment for the communication.
         """
-        applicable_rules = self.get_rules(jurisdiction_code)
         risk_notes: list[str] = []
 
         # In-house counsel risk assessment
@@ -312,19 +612,24 @@ class JurisdictionRuleEngine:
             "high" if not privilege_likely else "medium"
         )
 
-        return {
-            "jurisdiction_code": jurisdiction_code,
-            "communication_type": communication_type,
-            "privilege_likely": privilege_likely,
-            "risk_level": risk_level,
-            "applicable_rules": [
-                {
-                    "jurisdiction_code": r.jurisdiction_code,
-                    "rule_type": r.rule_type,
-                    "citation": r.citation,
-                    "description": r.description[:200],
-                }
-                for r in applicable_rules
-            ],
-            "risk_notes": risk_notes,
-        }
+        return PrivilegeRiskAssessment(
+            jurisdiction_code=jurisdiction_code,
+            communication_type=communication_type,
+            privilege_likely=privilege_likely,
+            risk_level=risk_level,
+            applicable_rules=applicable_rules,
+            risk_notes=tuple(risk_notes),
+        )
+
+
+@functools.lru_cache(maxsize=1)
+def get_engine() -> JurisdictionRuleEngine:
+    """Return the process-wide JurisdictionRuleEngine.
+
+    Intended as a FastAPI/DI dependency so request handlers share one engine
+    (and its lookup caches) instead of constructing a new one per request.
+
+    Returns:
+        The shared JurisdictionRuleEngine instance.
+    """
+    return JurisdictionRuleEngine()
@@ -2,16 +2,34 @@
 
 Defines domain events published by this service and provides
 a typed publisher wrapper. All events use Topics constants and
-include tenant_id and correlation_id for traceability.
+include tenant_id and correlation_id for traceability. The correlation ID
+is taken from correlation_id_var, which the HTTP middleware binds once per
+request, unless a caller passes one explicitly.
 """
 
 import uuid
+from contextvars import ContextVar
 
 from aumos_common.events import EventPublisher, Topics
 from aumos_common.observability import get_logger
 
 logger = get_logger(__name__)
 
+# Correlation ID of the request being handled; set by the HTTP middleware in main.py.
+correlation_id_var: ContextVar[str | None] = ContextVar("correlation_id", default=None)
+
+
+def _resolve_correlation_id(correlation_id: str | None) -> str:
+    """Return the explicit correlation ID, else the request's, else a fresh one.
+
+    Args:
+        correlation_id: Correlation ID passed by the caller, if any.
+
+    Returns:
+        Correlation ID to stamp on the event.
+    """
+    return correlation_id or correlation_id_var.get() or str(uuid.uuid4())
+
 
 class LegalDomainEventPublisher:
     """Publisher for aumos-legal-overlay domain events.
@@ -23,13 +41,32 @@ class LegalDomainEventPublisher:
         publisher: The underlying EventPublisher from aumos-common.
     """
 
+    __slots__ = (
+        "_log",
+        "_publisher",
+        "_topic_ediscovery_job_created",
+        "_topic_legal_hold_created",
+        "_topic_legal_hold_released",
+        "_topic_privilege_checked",
+        "_topic_privilege_log_entry_created",
+    )
+
     def __init__(self, publisher: EventPublisher) -> None:
         """Initialize with the shared event publisher.
 
+        Topic names and the bound logger are resolved once here rather than
+        on every publish.
+
         Args:
             publisher: Configured EventPublisher instance.
         """
         self._publisher = publisher
+        self._log = logger.bind(service="aumos-legal-overlay")
+        self._topic_privilege_checked = Topics.LEGAL_PRIVILEGE_CHECKED
+        self._topic_ediscovery_job_created = Topics.LEGAL_EDISCOVERY_JOB_CREATED
+        self._topic_privilege_log_entry_created = Topics.LEGAL_PRIVILEGE_LOG_ENTRY_CREATED
+        self._topic_legal_hold_created = Topics.LEGAL_HOLD_CREATED
+        self._topic_legal_hold_released = Topics.LEGAL_HOLD_RELEASED
 
     async def publish_privilege_checked(
         self,
@@ -37,7 +74,7 @@ class LegalDomainEventPublisher:
         check_id: uuid.UUID,
         document_id: str,
         is_privileged: bool,
-        correlation_id: str,
+        correlation_id: str | None = None,
     ) -> None:
         """Publish a PrivilegeChecked event to Kafka.
 
@@ -49,7 +86,8 @@ class LegalDomainEventPublisher:
             check_id: UUID of the privilege check.
             document_id: Document that was checked.
             is_privileged: Whether privilege was determined.
-            correlation_id: Request correlation ID for tracing.
+            correlation_id: Request correlation ID for tracing. Defaults to the
+                ID bound to the current request context.
         """
         event = {
             "event_type": "privilege_checked",
@@ -57,13 +95,13 @@ class LegalDomainEventPublisher:
             "check_id": str(check_id),
             "document_id": document_id,
             "is_privileged": is_privileged,
-            "correlation_id": correlation_id,
+            "correlation_id": _resolve_correlation_id(correlation_id),
         }
-        await self._publisher.publish(Topics.LEGAL_PRIVILEGE_CHECKED, event)
-        logger.info(
+        await self._publisher.publish(self._topic_privilege_checked, event)
+        self._log.info(
             "Published PrivilegeChecked event",
-            tenant_id=str(tenant_id),
-            check_id=str(check_id),
+            tenant_id=event["tenant_id"],
+            check_id=event["check_id"],
             document_id=document_id,
             is_privileged=is_privileged,
         )
@@ -73,7 +111,7 @@ class LegalDomainEventPublisher:
         tenant_id: uuid.UUID,
         job_id: uuid.UUID,
         case_name: str,
-        correlation_id: str,
+        correlation_id: str | None = None,
     ) -> None:
         """Publish an EDiscoveryJobCreated event to Kafka.
 
@@ -84,20 +122,21 @@ class LegalDomainEventPublisher:
             tenant_id: The tenant that owns the job.
             job_id: UUID of the e-discovery job.
             case_name: Name of the legal case.
-            correlation_id: Request correlation ID for tracing.
+            correlation_id: Request correlation ID for tracing. Defaults to the
+                ID bound to the current request context.
         """
         event = {
             "event_type": "ediscovery_job_created",
             "tenant_id": str(tenant_id),
             "job_id": str(job_id),
             "case_name": case_name,
-            "correlation_id": correlation_id,
+            "correlation_id": _resolve_correlation_id(correlation_id),
         }
-        await self._publisher.publish(Topics.LEGAL_EDISCOVERY_JOB_CREATED, event)
-        logger.info(
+        await self._publisher.publish(self._topic_ediscovery_job_created, event)
+        self._log.info(
             "Published EDiscoveryJobCreated event",
-            tenant_id=str(tenant_id),
-            job_id=str(job_id),
+            tenant_id=event["tenant_id"],
+            job_id=event["job_id"],
             case_name=case_name,
         )
 
@@ -106,7 +145,7 @@ class LegalDomainEventPublisher:
         tenant_id: uuid.UUID,
         entry_id: uuid.UUID,
         document_id: str,
-        correlation_id: str,
+        correlation_id: str | None = None,
     ) -> None:
         """Publish a PrivilegeLogEntryCreated event to Kafka.
 
@@ -117,20 +156,21 @@ class LegalDomainEventPublisher:
             tenant_id: The tenant that owns the entry.
             entry_id: UUID of the privilege log entry.
             document_id: Document referenced by the log entry.
-            correlation_id: Request correlation ID for tracing.
+            correlation_id: Request correlation ID for tracing. Defaults to the
+                ID bound to the current request context.
         """
         event = {
             "event_type": "privilege_log_entry_created",
             "tenant_id": str(tenant_id),
             "entry_id": str(entry_id),
             "document_id": document_id,
-            "correlation_id": correlation_id,
+            "correlation_id": _resolve_correlation_id(correlation_id),
         }
-        await self._publisher.publish(Topics.LEGAL_PRIVILEGE_LOG_ENTRY_CREATED, event)
-        logger.info(
+        await self._publisher.publish(self._topic_privilege_log_entry_created, event)
+        self._log.info(
             "Published PrivilegeLogEntryCreated event",
-            tenant_id=str(tenant_id),
-            entry_id=str(entry_id),
+            tenant_id=event["tenant_id"],
+            entry_id=event["entry_id"],
             document_id=document_id,
         )
 
@@ -140,7 +180,7 @@ class LegalDomainEventPublisher:
         hold_id: uuid.UUID,
         hold_name: str,
         custodians: list[str],
-        correlation_id: str,
+        correlation_id: str | None = None,
     ) -> None:
         """Publish a LegalHoldCreated event to Kafka.
 
@@ -152,7 +192,8 @@ class LegalDomainEventPublisher:
             hold_id: UUID of the legal hold.
             hold_name: Name of the hold.
             custodians: List of custodians to notify.
-            correlation_id: Request correlation ID for tracing.
+            correlation_id: Request correlation ID for tracing. Defaults to the
+                ID bound to the current request context.
         """
         event = {
             "event_type": "legal_hold_created",
@@ -160,13 +201,13 @@ class LegalDomainEventPublisher:
             "hold_id": str(hold_id),
             "hold_name": hold_name,
             "custodians": custodians,
-            "correlation_id": correlation_id,
+            "correlation_id": _resolve_correlation_id(correlation_id),
         }
-        await self._publisher.publish(Topics.LEGAL_HOLD_CREATED, event)
-        logger.info(
+        await self._publisher.publish(self._topic_legal_hold_created, event)
+        self._log.info(
             "Published LegalHoldCreated event",
-            tenant_id=str(tenant_id),
-            hold_id=str(hold_id),
+            tenant_id=event["tenant_id"],
+            hold_id=event["hold_id"],
             hold_name=hold_name,
             custodian_count=len(custodians),
         )
@@ -176,7 +217,7 @@ class LegalDomainEventPublisher:
         tenant_id: uuid.UUID,
         hold_id: uuid.UUID,
         release_reason: str,
-        correlation_id: str,
+        correlation_id: str | None = None,
     ) -> None:
         """Publish a LegalHoldReleased event to Kafka.
 
@@ -187,19 +228,20 @@ class LegalDomainEventPublisher:
             tenant_id: The tenant that owns the hold.
             hold_id: UUID of the released hold.
             release_reason: Documented reason for release.
-            correlation_id: Request correlation ID for tracing.
+            correlation_id: Request correlation ID for tracing. Defaults to the
+                ID bound to the current request context.
         """
         event = {
             "event_type": "legal_hold_released",
             "tenant_id": str(tenant_id),
             "hold_id": str(hold_id),
             "release_reason": release_reason,
-            "correlation_id": correlation_id,
+            "correlation_id": _resolve_correlation_id(correlation_id),
         }
-        await self._publisher.publish(Topics.LEGAL_HOLD_RELEASED, event)
-        logger.info(
+        await self._publisher.publish(self._topic_legal_hold_released, event)
+        self._log.info(
             "Published LegalHoldReleased event",
-            tenant_id=str(tenant_id),
-            hold_id=str(hold_id),
+            tenant_id=event["tenant_id"],
+            hold_id=event["hold_id"],
             release_reason=release_reason,
         )
@@ -5,17 +5,49 @@ tracking, acknowledgement management, hold release, compliance monitoring,
 audit trail generation, and regulatory obligation mapping.
 """
 
+import atexit
+import contextvars
+import functools
 import hashlib
+import json
+import operator
+import os
+import sys
+import threading
+import time
 import uuid
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
+from queue import Empty, SimpleQueue
+from string import Formatter
 from typing import Any
 
+import numpy as np
 from aumos_common.observability import get_logger
 
+from aumos_legal_overlay.adapters.identifiers import uuid4_batch
+
+try:
+    import orjson
+except ImportError:  # Optional: install the "fast-json" extra for faster exports.
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
 
+# Canonical status and audit event names, interned so the many records that
+# share them hold one string object and compare by identity first.
+_STATUS_ACTIVE = sys.intern("active")
+_STATUS_RELEASED = sys.intern("released")
+_STATUS_PENDING = sys.intern("pending")
+_STATUS_ACKNOWLEDGED = sys.intern("acknowledged")
+_STATUS_OVERDUE = sys.intern("overdue")
+_EVENT_NOTICE_ISSUED = sys.intern("hold_notice_issued")
+_EVENT_ACKNOWLEDGED = sys.intern("acknowledgement_received")
+_EVENT_REMINDER_SENT = sys.intern("reminder_sent")
+_EVENT_RELEASED = sys.intern("hold_released")
+
 # Regulatory obligations that trigger legal hold requirements
 _REGULATORY_HOLD_OBLIGATIONS: dict[str, dict[str, Any]] = {
     "FRCP_37e": {
@@ -55,6 +87,17 @@ _REGULATORY_HOLD_OBLIGATIONS: dict[str, dict[str, Any]] = {
     },
 }
 
+# Obligation dicts in the export_hold_summary shape, merged once at import.
+# Shared between calls and must be treated as read-only.
+_EXPORTED_OBLIGATIONS: dict[str, dict[str, Any]] = {
+    oid: {"id": oid, **body} for oid, body in _REGULATORY_HOLD_OBLIGATIONS.items()
+}
+
+# Custodian fields read per row by export_hold_summary, fetched in one call.
+_CUSTODIAN_EXPORT_FIELDS = operator.attrgetter(
+    "custodian_name", "status", "notice_sent_at", "acknowledged_at", "reminder_count"
+)
+
 # Matter type definitions
 _MATTER_TYPES: dict[str, dict[str, Any]] = {
     "litigation": {
@@ -84,6 +127,27 @@ _MATTER_TYPES: dict[str, dict[str, Any]] = {
     },
 }
 
+# Matter type -> (standard_duration_days, regulatory_triggers), resolved once
+# so hold creation and obligation lookups need a single dict access.
+_MATTER_RESOLVED: dict[str, tuple[int, tuple[str, ...]]] = {
+    matter_type: (config["standard_duration_days"], tuple(config.get("regulatory_triggers", ())))
+    for matter_type, config in _MATTER_TYPES.items()
+}
+
+# Obligation dicts in the get_regulatory_obligations shape, merged once at import.
+# Shared between calls and must be treated as read-only.
+_REGULATORY_OBLIGATION_CACHE: dict[str, dict[str, Any]] = {
+    oid: {"obligation_id": oid, **body} for oid, body in _REGULATORY_HOLD_OBLIGATIONS.items()
+}
+
+# Matter type -> its obligation dicts, in trigger order.
+_MATTER_OBLIGATIONS: dict[str, tuple[dict[str, Any], ...]] = {
+    matter_type: tuple(
+        _REGULATORY_OBLIGATION_CACHE.get(oid) or {"obligation_id": oid} for oid in triggers
+    )
+    for matter_type, (_, triggers) in _MATTER_RESOLVED.items()
+}
+
 # Notice templates by matter type
 _NOTICE_TEMPLATES: dict[str, str] = {
     "litigation": (
@@ -135,8 +199,136 @@ _NOTICE_TEMPLATES: dict[str, str] = {
     ),
 }
 
+# Digest size in bytes of the per-custodian notice fingerprint (16 hex chars).
+_NOTICE_HASH_DIGEST_SIZE = 8
+
+# A template parsed once into (literal_text, field_name) chunks; field_name is
+# None for a trailing literal. Rendering is a join with no format-spec parsing.
+_CompiledTemplate = tuple[tuple[str, str | None], ...]
+
+# A compiled template whose literal chunks are already UTF-8 encoded.
+_EncodedTemplate = tuple[tuple[bytes, str | None], ...]
+
+
+def _compile_template(template: str) -> _CompiledTemplate:
+    """Parse a str.format template into literal/field chunks.
+
+    Args:
+        template: Template using plain {field} placeholders.
+
+    Returns:
+        Compiled template chunks.
+    """
+    return tuple((literal, field_name) for literal, field_name, _, _ in Formatter().parse(template))
+
+
+def _render_template(compiled: _CompiledTemplate, context: dict[str, str]) -> str:
+    """Render a compiled template.
+
+    Args:
+        compiled: Chunks produced by _compile_template.
+        context: Field values keyed by placeholder name.
+
+    Returns:
+        Rendered text, identical to template.format(**context).
+    """
+    parts: list[str] = []
+    for literal, field_name in compiled:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(context[field_name])
+    return "".join(parts)
+
+
+def _encode_template(compiled: _CompiledTemplate) -> _EncodedTemplate:
+    """Pre-encode the literal chunks of a compiled template to UTF-8.
+
+    Args:
+        compiled: Chunks produced by _compile_template.
+
+    Returns:
+        Chunks with UTF-8 literals, for _render_template_bytes.
+    """
+    return tuple((literal.encode(), field_name) for literal, field_name in compiled)
+
+
+def _render_template_bytes(encoded: _EncodedTemplate, context: dict[str, str]) -> bytes:
+    """Render a pre-encoded template straight to UTF-8 bytes.
 
-@dataclass
+    Only the field values are encoded per call; the literal text was encoded
+    once by _encode_template.
+
+    Args:
+        encoded: Chunks produced by _encode_template.
+        context: Field values keyed by placeholder name.
+
+    Returns:
+        Rendered bytes, identical to template.format(**context).encode().
+    """
+    parts: list[bytes] = []
+    for literal, field_name in encoded:
+        parts.append(literal)
+        if field_name is not None:
+            parts.append(context[field_name].encode())
+    return b"".join(parts)
+
+
+def _split_template(compiled: _CompiledTemplate, field_name: str) -> tuple[_CompiledTemplate, _CompiledTemplate]:
+    """Split a compiled template around its single occurrence of a field.
+
+    Args:
+        compiled: Chunks produced by _compile_template.
+        field_name: Placeholder to split at.
+
+    Returns:
+        (head, tail) templates such that head + value + tail renders the original.
+
+    Raises:
+        ValueError: If the field does not occur exactly once.
+    """
+    positions = [i for i, (_, name) in enumerate(compiled) if name == field_name]
+    if len(positions) != 1:
+        raise ValueError(f"Template must reference '{field_name}' exactly once, found {len(positions)}.")
+    split_at = positions[0]
+    head = (*compiled[:split_at], (compiled[split_at][0], None))
+    return head, compiled[split_at + 1:]
+
+
+_COMPILED_NOTICE_TEMPLATES: dict[str, _CompiledTemplate] = {
+    matter_type: _compile_template(template) for matter_type, template in _NOTICE_TEMPLATES.items()
+}
+
+# Notice templates split around {custodian_name}: everything else in a notice
+# is shared by all custodians of a hold, so it is rendered once per hold.
+_SPLIT_NOTICE_TEMPLATES: dict[str, tuple[_CompiledTemplate, _CompiledTemplate]] = {
+    matter_type: _split_template(compiled, "custodian_name")
+    for matter_type, compiled in _COMPILED_NOTICE_TEMPLATES.items()
+}
+
+# Split notice templates with literals pre-encoded, used to hash notices
+# without rendering the shared head and tail as str first.
+_ENCODED_SPLIT_NOTICE_TEMPLATES: dict[str, tuple[_EncodedTemplate, _EncodedTemplate]] = {
+    matter_type: (_encode_template(head), _encode_template(tail))
+    for matter_type, (head, tail) in _SPLIT_NOTICE_TEMPLATES.items()
+}
+
+# Reminder notice sent to custodians who have not acknowledged a hold
+_REMINDER_TEMPLATE = (
+    "REMINDER #{reminder_count} — LEGAL HOLD NOTICE\n\n"
+    "Date: {reminder_date}\n"
+    "To: {custodian_name}\n"
+    "Re: {case_name} — Hold Acknowledgement Overdue\n\n"
+    "This is a reminder that you have not yet acknowledged receipt "
+    "of the Legal Hold Notice issued on {issued_date}.\n\n"
+    "Failure to acknowledge may be reported to senior management. "
+    "Please acknowledge immediately.\n\n"
+    "Issued by: {issuing_attorney}, {issuing_firm}"
+)
+
+_COMPILED_REMINDER_TEMPLATE: _CompiledTemplate = _compile_template(_REMINDER_TEMPLATE)
+
+
+@dataclass(slots=True)
 class CustodianRecord:
     """Tracking record for a legal hold custodian.
 
@@ -160,10 +352,33 @@ class CustodianRecord:
     reminder_count: int
     last_reminder_at: datetime | None
     status: str
-    data_sources: list[str]
+    data_sources: tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class AuditEvent:
+    """Immutable entry in a legal hold's audit trail.
+
+    Attributes:
+        event: Audit event type (e.g. hold_notice_issued, reminder_sent).
+        timestamp: ISO 8601 timestamp of the event.
+        payload: Event-specific (key, value) pairs, in output order.
+    """
+
+    event: str
+    timestamp: str
+    payload: tuple[tuple[str, Any], ...] = ()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialise the event to the audit dict shape used at API boundaries.
+
+        Returns:
+            Dict with event, timestamp, and the payload fields.
+        """
+        return {"event": self.event, "timestamp": self.timestamp, **dict(self.payload)}
 
 
-@dataclass
+@dataclass(slots=True)
 class LegalHoldRecord:
     """Full legal hold record managed by LegalHoldManager.
 
@@ -183,6 +398,15 @@ class LegalHoldRecord:
         status: Hold status (active, released, expired).
         regulatory_obligations: Applicable regulatory frameworks.
         audit_trail: Ordered list of audit events for this hold.
+        custodians_by_name: Custodian records grouped by custodian name, in
+            hold order, for acknowledgement and reminder lookups. A name can
+            map to several records when custodians share a name.
+        custodian_positions: Index of each custodian_id in custodian_records.
+        notice_sent_us: Column of custodian notice times, in microseconds since
+            the Unix epoch, aligned with custodian_records. Notice times are
+            fixed once a hold is created.
+        pending_mask: Column flagging custodians still in "pending" status,
+            aligned with custodian_records; cleared on every status transition.
     """
 
     hold_id: str
@@ -192,14 +416,221 @@ class LegalHoldRecord:
     matter_type: str
     issuing_attorney: str
     custodian_records: list[CustodianRecord]
-    data_sources: list[str]
+    data_sources: tuple[str, ...]
     issued_at: datetime
     expires_at: datetime | None
     released_at: datetime | None
     release_reason: str | None
     status: str
-    regulatory_obligations: list[str]
-    audit_trail: list[dict[str, Any]] = field(default_factory=list)
+    regulatory_obligations: tuple[str, ...]
+    audit_trail: list[AuditEvent] = field(default_factory=list)
+    custodians_by_name: dict[str, list[CustodianRecord]] = field(default_factory=dict)
+    custodian_positions: dict[str, int] = field(default_factory=dict)
+    notice_sent_us: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.int64))
+    pending_mask: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=bool))
+
+    def clear_pending(self, custodian: CustodianRecord) -> None:
+        """Mark a custodian as no longer pending in the compliance columns.
+
+        Args:
+            custodian: Custodian record belonging to this hold.
+        """
+        self.pending_mask[self.custodian_positions[custodian.custodian_id]] = False
+
+    def unacknowledged_custodian(self, custodian_name: str) -> CustodianRecord | None:
+        """Return the first custodian with this name that has not acknowledged.
+
+        Args:
+            custodian_name: Custodian name to look up.
+
+        Returns:
+            The earliest such CustodianRecord in hold order, or None.
+        """
+        for record in self.custodians_by_name.get(custodian_name, ()):
+            if record.acknowledged_at is None:
+                return record
+        return None
+
+
+# Unix epoch and one microsecond, for converting datetimes to int64 columns.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+
+def _epoch_microseconds(moment: datetime) -> int:
+    """Convert an aware datetime to whole microseconds since the Unix epoch.
+
+    Args:
+        moment: Timezone-aware datetime.
+
+    Returns:
+        Microseconds since 1970-01-01T00:00:00Z.
+    """
+    return (moment - _EPOCH) // _ONE_MICROSECOND
+
+
+# English month names for notice dates, independent of the process locale.
+_MONTHS = (
+    "January", "February", "March", "April", "May", "June",
+    "July", "August", "September", "October", "November", "December",
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _format_long_date(year: int, month: int, day: int) -> str:
+    """Format a date as in notices, e.g. "March 04, 2025".
+
+    Equivalent to ``strftime("%B %d, %Y")`` in the C locale; cached because
+    notices and reminders on the same day share the string.
+
+    Args:
+        year: Calendar year.
+        month: Month number, 1-12.
+        day: Day of month.
+
+    Returns:
+        Formatted long date.
+    """
+    return f"{_MONTHS[month - 1]} {day:02d}, {year}"
+
+
+def _keep_timestamp(value: datetime) -> datetime:
+    """Leave a timestamp for the JSON encoder to serialise.
+
+    Args:
+        value: Timestamp to pass through.
+
+    Returns:
+        The same timestamp.
+    """
+    return value
+
+
+def _json_default(value: object) -> object:
+    """Serialise datetimes for the standard-library JSON fallback.
+
+    Args:
+        value: Object the encoder could not handle.
+
+    Returns:
+        ISO 8601 string for datetimes.
+
+    Raises:
+        TypeError: For any other type.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _notice_template(matter_type: str) -> _CompiledTemplate:
+    """Return the compiled notice template for a matter type.
+
+    Args:
+        matter_type: Matter type identifier.
+
+    Returns:
+        Compiled template, falling back to the default notice.
+    """
+    return _COMPILED_NOTICE_TEMPLATES.get(matter_type, _COMPILED_NOTICE_TEMPLATES["default"])
+
+
+# Upper bound on records written per flush by the background log batcher.
+_LOG_BATCH_MAX_RECORDS = 256
+
+# Longest a queued log record waits for its batch to fill before being written.
+_LOG_BATCH_FLUSH_INTERVAL_SECONDS = 0.05
+
+# A queued log record: the caller's context, the event message, and its fields.
+_QueuedLogRecord = tuple[contextvars.Context, str, dict[str, object]]
+
+
+class _LogBatcher:
+    """Moves routine info-level log writes off the caller's thread.
+
+    Records are queued on a SimpleQueue and written by a background thread in
+    batches of up to ``max_records``, waiting at most ``flush_interval`` for a
+    batch to fill. Each record carries a copy of the caller's context, so
+    context-bound log fields (e.g. structlog contextvars) are written as if
+    logged inline. At interpreter exit a stop sentinel is queued behind the
+    pending records and the thread is joined, so nothing queued is dropped.
+    """
+
+    def __init__(self, max_records: int, flush_interval: float) -> None:
+        """Start the background flusher thread.
+
+        Args:
+            max_records: Maximum records written per batch.
+            flush_interval: Maximum seconds a batch waits to fill.
+        """
+        # None is the stop sentinel queued by close().
+        self._queue: SimpleQueue[_QueuedLogRecord | None] = SimpleQueue()
+        self._max_records = max_records
+        self._flush_interval = flush_interval
+        self._closed = False
+        self._thread = threading.Thread(
+            target=self._run, name="legal-hold-log-batcher", daemon=True
+        )
+        self._thread.start()
+        atexit.register(self.close)
+
+    def put(self, event: str, fields: dict[str, object]) -> None:
+        """Queue an info-level log record, or write it inline once closed.
+
+        Args:
+            event: Log event message.
+            fields: Structured fields for the record.
+        """
+        if self._closed:
+            logger.info(event, **fields)
+            return
+        self._queue.put((contextvars.copy_context(), event, fields))
+
+    def close(self) -> None:
+        """Write every queued record and stop the background thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._queue.put(None)
+        self._thread.join()
+
+    def _run(self) -> None:
+        """Collect and write batches until the stop sentinel is received."""
+        stopping = False
+        while not stopping:
+            batch: list[_QueuedLogRecord] = []
+            record = self._queue.get()
+            deadline = time.monotonic() + self._flush_interval
+            while True:
+                if record is None:
+                    stopping = True
+                    break
+                batch.append(record)
+                remaining = deadline - time.monotonic()
+                if len(batch) >= self._max_records or remaining <= 0:
+                    break
+                try:
+                    record = self._queue.get(timeout=remaining)
+                except Empty:
+                    break
+            for context, event, fields in batch:
+                context.run(logger.info, event, **fields)
+
+
+@functools.lru_cache(maxsize=1)
+def _log_batcher() -> _LogBatcher:
+    """Return the process-wide log batcher, starting it on first use.
+
+    Returns:
+        The shared _LogBatcher.
+    """
+    return _LogBatcher(_LOG_BATCH_MAX_RECORDS, _LOG_BATCH_FLUSH_INTERVAL_SECONDS)
+
+
+# A forked child inherits the batcher but not its flusher thread, so the
+# child starts its own batcher on first use.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_log_batcher.cache_clear)
 
 
 class LegalHoldManager:
@@ -216,6 +647,7 @@ class LegalHoldManager:
         acknowledgement_deadline_days: int = 5,
         reminder_interval_days: int = 7,
         overdue_threshold_days: int = 14,
+        batch_logging: bool = False,
     ) -> None:
         """Initialize the legal hold manager.
 
@@ -224,18 +656,36 @@ class LegalHoldManager:
             acknowledgement_deadline_days: Days before acknowledgement is overdue.
             reminder_interval_days: Days between reminder notices.
             overdue_threshold_days: Days before custodian is escalated as non-compliant.
+            batch_logging: Write routine info logs from a background thread in
+                batches. Warnings and hold releases are always logged synchronously.
         """
         self._issuing_firm = issuing_firm
         self._ack_deadline_days = acknowledgement_deadline_days
         self._reminder_interval_days = reminder_interval_days
         self._overdue_threshold_days = overdue_threshold_days
+        self._batch_logging = batch_logging
         self._holds: dict[str, LegalHoldRecord] = {}
+        # Secondary index of holds with status "active", in creation order, so
+        # compliance sweeps skip the released/expired archive entirely.
+        self._active_holds: dict[str, LegalHoldRecord] = {}
         logger.info(
             "LegalHoldManager initialized",
             issuing_firm=issuing_firm,
             ack_deadline_days=acknowledgement_deadline_days,
         )
 
+    def _log_info(self, event: str, **fields: object) -> None:
+        """Emit a routine info log, via the background batcher when enabled.
+
+        Args:
+            event: Log event message.
+            **fields: Structured fields for the record.
+        """
+        if self._batch_logging:
+            _log_batcher().put(event, fields)
+        else:
+            logger.info(event, **fields)
+
     def generate_hold_notice(
         self,
         custodian_name: str,
@@ -258,20 +708,44 @@ class LegalHoldManager:
         Returns:
             Formatted legal hold notice text.
         """
-        template = _NOTICE_TEMPLATES.get(matter_type, _NOTICE_TEMPLATES["default"])
-        issued_date = datetime.now(tz=timezone.utc).strftime("%B %d, %Y")
-        data_sources_list = "\n".join(f"  - {source}" for source in data_sources)
-
-        notice = template.format(
-            issued_date=issued_date,
-            custodian_name=custodian_name,
+        context = self._notice_context(
             issuing_attorney=issuing_attorney,
-            issuing_firm=self._issuing_firm,
             case_name=case_name,
-            case_number=case_number or "N/A",
-            data_sources_list=data_sources_list,
+            data_sources=data_sources,
+            case_number=case_number,
+            issued_at=datetime.now(tz=timezone.utc),
         )
-        return notice
+        context["custodian_name"] = custodian_name
+        return _render_template(_notice_template(matter_type), context)
+
+    def _notice_context(
+        self,
+        issuing_attorney: str,
+        case_name: str,
+        data_sources: Sequence[str],
+        case_number: str | None,
+        issued_at: datetime,
+    ) -> dict[str, str]:
+        """Build the custodian-independent notice fields for a hold.
+
+        Args:
+            issuing_attorney: Attorney issuing the hold.
+            case_name: Name of the legal matter.
+            data_sources: Data sources to be preserved.
+            case_number: Optional case number.
+            issued_at: Issuance timestamp.
+
+        Returns:
+            Template context without custodian_name.
+        """
+        return {
+            "issued_date": _format_long_date(issued_at.year, issued_at.month, issued_at.day),
+            "issuing_attorney": issuing_attorney,
+            "issuing_firm": self._issuing_firm,
+            "case_name": case_name,
+            "case_number": case_number or "N/A",
+            "data_sources_list": "\n".join(f"  - {source}" for source in data_sources),
+        }
 
     def create_hold(
         self,
@@ -302,7 +776,8 @@ class LegalHoldManager:
         Raises:
             ValueError: If matter_type is not supported.
         """
-        if matter_type not in _MATTER_TYPES:
+        resolved = _MATTER_RESOLVED.get(matter_type)
+        if resolved is None:
             raise ValueError(
                 f"Unsupported matter_type '{matter_type}'. "
                 f"Supported: {list(_MATTER_TYPES.keys())}"
@@ -310,43 +785,65 @@ class LegalHoldManager:
 
         hold_id = str(uuid.uuid4())
         issued_at = datetime.now(tz=timezone.utc)
-        matter_config = _MATTER_TYPES[matter_type]
+        standard_duration_days, regulatory_triggers = resolved
 
-        duration_days = custom_expiry_days or matter_config["standard_duration_days"]
+        duration_days = custom_expiry_days or standard_duration_days
         expires_at = issued_at + timedelta(days=duration_days)
 
-        regulatory_obligations = matter_config.get("regulatory_triggers", [])
+        # One immutable tuple per hold, shared by the hold and all its custodians.
+        data_sources_shared = tuple(data_sources)
 
         custodian_records: list[CustodianRecord] = []
-        audit_trail: list[dict[str, Any]] = []
+        custodians_by_name: dict[str, list[CustodianRecord]] = {}
+        audit_trail: list[AuditEvent] = []
 
-        for custodian_name in custodians:
-            notice = self.generate_hold_notice(
-                custodian_name=custodian_name,
-                issuing_attorney=issuing_attorney,
-                case_name=case_name,
-                matter_type=matter_type,
-                data_sources=data_sources,
-                case_number=case_number,
-            )
+        notice_context = self._notice_context(
+            issuing_attorney=issuing_attorney,
+            case_name=case_name,
+            data_sources=data_sources_shared,
+            case_number=case_number,
+            issued_at=issued_at,
+        )
+        head_template, tail_template = _ENCODED_SPLIT_NOTICE_TEMPLATES.get(
+            matter_type, _ENCODED_SPLIT_NOTICE_TEMPLATES["default"]
+        )
+        # Each notice is head + custodian_name + tail; hash the shared head once
+        # and clone the digest state per custodian. The fingerprint is a 64-bit
+        # BLAKE2b digest, which yields the 16 hex characters directly.
+        head_digest = hashlib.blake2b(
+            _render_template_bytes(head_template, notice_context),
+            digest_size=_NOTICE_HASH_DIGEST_SIZE,
+        )
+        tail_bytes = _render_template_bytes(tail_template, notice_context)
+        issued_at_iso = issued_at.isoformat()
+        # One entropy read for every custodian id rather than one per custodian.
+        custodian_ids = uuid4_batch(len(custodians))
+
+        for index, custodian_name in enumerate(custodians):
+            notice_digest = head_digest.copy()
+            notice_digest.update(custodian_name.encode())
+            notice_digest.update(tail_bytes)
             custodian_record = CustodianRecord(
-                custodian_id=str(uuid.uuid4()),
+                custodian_id=custodian_ids[index],
                 custodian_name=custodian_name,
                 hold_id=hold_id,
                 notice_sent_at=issued_at,
                 acknowledged_at=None,
                 reminder_count=0,
                 last_reminder_at=None,
-                status="pending",
-                data_sources=data_sources,
+                status=_STATUS_PENDING,
+                data_sources=data_sources_shared,
             )
             custodian_records.append(custodian_record)
-            audit_trail.append({
-                "event": "hold_notice_issued",
-                "timestamp": issued_at.isoformat(),
-                "custodian": custodian_name,
-                "notice_hash": hashlib.sha256(notice.encode()).hexdigest()[:16],
-            })
+            custodians_by_name.setdefault(custodian_name, []).append(custodian_record)
+            audit_trail.append(AuditEvent(
+                event=_EVENT_NOTICE_ISSUED,
+                timestamp=issued_at_iso,
+                payload=(
+                    ("custodian", custodian_name),
+                    ("notice_hash", notice_digest.hexdigest()),
+                ),
+            ))
 
         hold = LegalHoldRecord(
             hold_id=hold_id,
@@ -356,24 +853,31 @@ class LegalHoldManager:
             matter_type=matter_type,
             issuing_attorney=issuing_attorney,
             custodian_records=custodian_records,
-            data_sources=data_sources,
+            data_sources=data_sources_shared,
             issued_at=issued_at,
             expires_at=expires_at,
             released_at=None,
             release_reason=None,
-            status="active",
-            regulatory_obligations=regulatory_obligations,
+            status=_STATUS_ACTIVE,
+            regulatory_obligations=regulatory_triggers,
             audit_trail=audit_trail,
+            custodians_by_name=custodians_by_name,
+            custodian_positions={c.custodian_id: i for i, c in enumerate(custodian_records)},
+            notice_sent_us=np.full(
+                len(custodian_records), _epoch_microseconds(issued_at), dtype=np.int64
+            ),
+            pending_mask=np.ones(len(custodian_records), dtype=bool),
         )
         self._holds[hold_id] = hold
+        self._active_holds[hold_id] = hold
 
-        logger.info(
+        self._log_info(
             "Legal hold created",
             hold_id=hold_id,
             hold_name=hold_name,
             matter_type=matter_type,
             custodian_count=len(custodians),
-            regulatory_obligations=regulatory_obligations,
+            regulatory_obligations=regulatory_triggers,
         )
         return hold
 
@@ -394,22 +898,23 @@ class LegalHoldManager:
             logger.warning("Hold not found for acknowledgement", hold_id=hold_id)
             return None
 
-        now = datetime.now(tz=timezone.utc)
-        for record in hold.custodian_records:
-            if record.custodian_name == custodian_name and record.acknowledged_at is None:
-                record.acknowledged_at = now
-                record.status = "acknowledged"
-                hold.audit_trail.append({
-                    "event": "acknowledgement_received",
-                    "timestamp": now.isoformat(),
-                    "custodian": custodian_name,
-                })
-                logger.info(
-                    "Hold acknowledgement recorded",
-                    hold_id=hold_id,
-                    custodian_name=custodian_name,
-                )
-                return record
+        record = hold.unacknowledged_custodian(custodian_name)
+        if record is not None:
+            now = datetime.now(tz=timezone.utc)
+            record.acknowledged_at = now
+            record.status = _STATUS_ACKNOWLEDGED
+            hold.clear_pending(record)
+            hold.audit_trail.append(AuditEvent(
+                event=_EVENT_ACKNOWLEDGED,
+                timestamp=now.isoformat(),
+                payload=(("custodian", custodian_name),),
+            ))
+            self._log_info(
+                "Hold acknowledgement recorded",
+                hold_id=hold_id,
+                custodian_name=custodian_name,
+            )
+            return record
 
         logger.warning(
             "Custodian not found or already acknowledged",
@@ -432,41 +937,174 @@ class LegalHoldManager:
         if not hold:
             return None
 
+        record = hold.unacknowledged_custodian(custodian_name)
+        if record is None:
+            return None
+
         now = datetime.now(tz=timezone.utc)
-        for record in hold.custodian_records:
-            if record.custodian_name == custodian_name and not record.acknowledged_at:
-                record.reminder_count += 1
-                record.last_reminder_at = now
-                if record.reminder_count >= 3:
-                    record.status = "overdue"
-
-                hold.audit_trail.append({
-                    "event": "reminder_sent",
-                    "timestamp": now.isoformat(),
-                    "custodian": custodian_name,
-                    "reminder_count": record.reminder_count,
-                })
-
-                reminder_text = (
-                    f"REMINDER #{record.reminder_count} — LEGAL HOLD NOTICE\n\n"
-                    f"Date: {now.strftime('%B %d, %Y')}\n"
-                    f"To: {custodian_name}\n"
-                    f"Re: {hold.case_name} — Hold Acknowledgement Overdue\n\n"
-                    f"This is a reminder that you have not yet acknowledged receipt "
-                    f"of the Legal Hold Notice issued on "
-                    f"{hold.issued_at.strftime('%B %d, %Y')}.\n\n"
-                    f"Failure to acknowledge may be reported to senior management. "
-                    f"Please acknowledge immediately.\n\n"
-                    f"Issued by: {hold.issuing_attorney}, {self._issuing_firm}"
-                )
-                logger.info(
-                    "Hold reminder sent",
-                    hold_id=hold_id,
-                    custodian_name=custodian_name,
-                    reminder_count=record.reminder_count,
-                )
-                return reminder_text
-        return None
+        record.reminder_count += 1
+        record.last_reminder_at = now
+        if record.reminder_count >= 3:
+            record.status = _STATUS_OVERDUE
+            hold.clear_pending(record)
+
+        hold.audit_trail.append(AuditEvent(
+            event=_EVENT_REMINDER_SENT,
+            timestamp=now.isoformat(),
+            payload=(
+                ("custodian", custodian_name),
+                ("reminder_count", record.reminder_count),
+            ),
+        ))
+
+        reminder_text = self._reminder_text(
+            hold,
+            custodian_name,
+            record.reminder_count,
+            _format_long_date(now.year, now.month, now.day),
+        )
+        self._log_info(
+            "Hold reminder sent",
+            hold_id=hold_id,
+            custodian_name=custodian_name,
+            reminder_count=record.reminder_count,
+        )
+        return reminder_text
+
+    def record_acknowledgements_bulk(
+        self, hold_id: str, custodian_names: list[str]
+    ) -> list[CustodianRecord]:
+        """Record acknowledgements for many custodians of one hold at once.
+
+        Resolves the hold and the timestamp once, appends the audit events in a
+        single extend, and emits one summary log instead of one per custodian.
+
+        Args:
+            hold_id: Hold identifier.
+            custodian_names: Names of the acknowledging custodians.
+
+        Returns:
+            Updated CustodianRecords, in input order. Unknown or already
+            acknowledged custodians are skipped.
+        """
+        hold = self._holds.get(hold_id)
+        if not hold:
+            return []
+
+        now = datetime.now(tz=timezone.utc)
+        now_iso = now.isoformat()
+        acknowledged: list[CustodianRecord] = []
+        events: list[AuditEvent] = []
+
+        for custodian_name in custodian_names:
+            record = hold.unacknowledged_custodian(custodian_name)
+            if record is None:
+                continue
+            record.acknowledged_at = now
+            record.status = _STATUS_ACKNOWLEDGED
+            hold.clear_pending(record)
+            acknowledged.append(record)
+            events.append(AuditEvent(
+                event=_EVENT_ACKNOWLEDGED,
+                timestamp=now_iso,
+                payload=(("custodian", custodian_name),),
+            ))
+
+        hold.audit_trail.extend(events)
+        self._log_info(
+            "Hold acknowledgements recorded",
+            hold_id=hold_id,
+            count=len(acknowledged),
+            skipped=len(custodian_names) - len(acknowledged),
+        )
+        return acknowledged
+
+    def send_reminders_bulk(
+        self, hold_id: str, custodian_names: list[str]
+    ) -> dict[str, str]:
+        """Send reminder notices to many non-acknowledging custodians at once.
+
+        Args:
+            hold_id: Hold identifier.
+            custodian_names: Custodians to remind.
+
+        Returns:
+            Dict mapping custodian name to reminder notice text. Unknown or
+            already acknowledged custodians are omitted.
+        """
+        hold = self._holds.get(hold_id)
+        if not hold:
+            return {}
+
+        now = datetime.now(tz=timezone.utc)
+        now_iso = now.isoformat()
+        reminder_date = _format_long_date(now.year, now.month, now.day)
+        reminders: dict[str, str] = {}
+        events: list[AuditEvent] = []
+
+        for custodian_name in custodian_names:
+            if custodian_name in reminders:
+                continue
+            record = hold.unacknowledged_custodian(custodian_name)
+            if record is None:
+                continue
+            record.reminder_count += 1
+            record.last_reminder_at = now
+            if record.reminder_count >= 3:
+                record.status = _STATUS_OVERDUE
+                hold.clear_pending(record)
+            events.append(AuditEvent(
+                event=_EVENT_REMINDER_SENT,
+                timestamp=now_iso,
+                payload=(
+                    ("custodian", custodian_name),
+                    ("reminder_count", record.reminder_count),
+                ),
+            ))
+            reminders[custodian_name] = self._reminder_text(
+                hold, custodian_name, record.reminder_count, reminder_date
+            )
+
+        hold.audit_trail.extend(events)
+        self._log_info(
+            "Hold reminders sent",
+            hold_id=hold_id,
+            count=len(reminders),
+            skipped=len(custodian_names) - len(reminders),
+        )
+        return reminders
+
+    def _reminder_text(
+        self,
+        hold: LegalHoldRecord,
+        custodian_name: str,
+        reminder_count: int,
+        reminder_date: str,
+    ) -> str:
+        """Render the reminder notice for one custodian.
+
+        Args:
+            hold: The hold the reminder refers to.
+            custodian_name: Custodian being reminded.
+            reminder_count: Reminder sequence number for this custodian.
+            reminder_date: Pre-formatted date the reminder is issued.
+
+        Returns:
+            Reminder notice text.
+        """
+        issued_at = hold.issued_at
+        return _render_template(
+            _COMPILED_REMINDER_TEMPLATE,
+            {
+                "reminder_count": str(reminder_count),
+                "reminder_date": reminder_date,
+                "custodian_name": custodian_name,
+                "case_name": hold.case_name,
+                "issued_date": _format_long_date(issued_at.year, issued_at.month, issued_at.day),
+                "issuing_attorney": hold.issuing_attorney,
+                "issuing_firm": self._issuing_firm,
+            },
+        )
 
     def release_hold(
         self, hold_id: str, release_reason: str, releasing_attorney: str
@@ -487,15 +1125,18 @@ class LegalHoldManager:
             return None
 
         now = datetime.now(tz=timezone.utc)
-        hold.status = "released"
+        hold.status = _STATUS_RELEASED
         hold.released_at = now
         hold.release_reason = release_reason
-        hold.audit_trail.append({
-            "event": "hold_released",
-            "timestamp": now.isoformat(),
-            "releasing_attorney": releasing_attorney,
-            "release_reason": release_reason,
-        })
+        self._active_holds.pop(hold_id, None)
+        hold.audit_trail.append(AuditEvent(
+            event=_EVENT_RELEASED,
+            timestamp=now.isoformat(),
+            payload=(
+                ("releasing_attorney", releasing_attorney),
+                ("release_reason", release_reason),
+            ),
+        ))
 
         logger.info(
             "Legal hold released",
@@ -512,6 +1153,10 @@ class LegalHoldManager:
             Dict with compliance summary, overdue custodians, and non-compliant holds.
         """
         now = datetime.now(tz=timezone.utc)
+        # Comparing against a single cut-off avoids building a timedelta per custodian;
+        # ``sent <= now - N days`` is equivalent to ``(now - sent).days >= N``.
+        overdue_threshold = now - timedelta(days=self._overdue_threshold_days)
+        overdue_threshold_us = _epoch_microseconds(overdue_threshold)
         compliance_summary: dict[str, Any] = {
             "total_active_holds": 0,
             "fully_compliant_holds": 0,
@@ -521,34 +1166,39 @@ class LegalHoldManager:
             "overdue_custodian_list": [],
         }
 
-        for hold in self._holds.values():
-            if hold.status != "active":
-                continue
+        for hold in self._active_holds.values():
             compliance_summary["total_active_holds"] += 1
 
-            pending = [c for c in hold.custodian_records if c.status == "pending"]
-            overdue = []
-            for c in pending:
-                days_since_notice = (now - c.notice_sent_at).days
-                if days_since_notice >= self._overdue_threshold_days:
-                    c.status = "overdue"
-                    overdue.append(c.custodian_name)
+            # Overdue detection is one vectorised compare over the hold's
+            # columns; only custodians that actually become overdue are touched.
+            pending_mask = hold.pending_mask
+            pending_count = int(np.count_nonzero(pending_mask))
+            overdue_count = 0
+            if pending_count:
+                overdue_positions = np.flatnonzero(
+                    pending_mask & (hold.notice_sent_us <= overdue_threshold_us)
+                )
+                pending_mask[overdue_positions] = False
+                overdue_count = len(overdue_positions)
+                for position in overdue_positions.tolist():
+                    c = hold.custodian_records[position]
+                    c.status = _STATUS_OVERDUE
                     compliance_summary["overdue_custodian_list"].append({
                         "hold_id": hold.hold_id,
                         "hold_name": hold.hold_name,
                         "custodian": c.custodian_name,
-                        "days_overdue": days_since_notice - self._ack_deadline_days,
+                        "days_overdue": (now - c.notice_sent_at).days - self._ack_deadline_days,
                     })
 
-            compliance_summary["total_pending_acknowledgements"] += len(pending)
-            compliance_summary["total_overdue_custodians"] += len(overdue)
+            compliance_summary["total_pending_acknowledgements"] += pending_count
+            compliance_summary["total_overdue_custodians"] += overdue_count
 
-            if not pending and not overdue:
+            if not pending_count:
                 compliance_summary["fully_compliant_holds"] += 1
-            elif overdue:
+            elif overdue_count:
                 compliance_summary["holds_with_overdue_custodians"] += 1
 
-        logger.info(
+        self._log_info(
             "Hold compliance monitoring complete",
             active_holds=compliance_summary["total_active_holds"],
             overdue_custodians=compliance_summary["total_overdue_custodians"],
@@ -562,13 +1212,10 @@ class LegalHoldManager:
             matter_type: Matter type identifier.
 
         Returns:
-            List of applicable regulatory obligation dicts.
+            List of applicable regulatory obligation dicts. The dicts are shared
+            between calls and must not be mutated.
         """
-        obligation_ids = _MATTER_TYPES.get(matter_type, {}).get("regulatory_triggers", [])
-        return [
-            {"obligation_id": oid, **_REGULATORY_HOLD_OBLIGATIONS.get(oid, {})}
-            for oid in obligation_ids
-        ]
+        return list(_MATTER_OBLIGATIONS.get(matter_type, ()))
 
     def get_hold_audit_trail(self, hold_id: str) -> list[dict[str, Any]]:
         """Return the full audit trail for a specific hold.
@@ -582,7 +1229,7 @@ class LegalHoldManager:
         hold = self._holds.get(hold_id)
         if not hold:
             return []
-        return list(hold.audit_trail)
+        return [event.to_dict() for event in hold.audit_trail]
 
     def export_hold_summary(self, hold_id: str) -> dict[str, Any]:
         """Export a comprehensive summary of a legal hold.
@@ -592,14 +1239,62 @@ class LegalHoldManager:
 
         Returns:
             Dict with full hold details, custodian status, and regulatory obligations.
+            The obligation dicts are shared between calls and must not be mutated.
         """
         hold = self._holds.get(hold_id)
         if not hold:
             return {"error": f"Hold '{hold_id}' not found."}
+        return self._hold_summary(hold, datetime.isoformat)
 
-        acknowledged_count = sum(
-            1 for c in hold.custodian_records if c.acknowledged_at is not None
-        )
+    def export_hold_summary_bytes(self, hold_id: str) -> bytes:
+        """Export a legal hold summary serialised as UTF-8 JSON.
+
+        Produces the same document as ``json.dumps(export_hold_summary(hold_id))``.
+        Timestamps are handed to the encoder as datetimes rather than formatted
+        up front; orjson is used when installed, the standard library otherwise.
+
+        Args:
+            hold_id: Hold identifier.
+
+        Returns:
+            JSON-encoded summary bytes.
+        """
+        hold = self._holds.get(hold_id)
+        if not hold:
+            payload: dict[str, Any] = {"error": f"Hold '{hold_id}' not found."}
+        else:
+            payload = self._hold_summary(hold, _keep_timestamp)
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload, ensure_ascii=False, default=_json_default).encode()
+
+    def _hold_summary(
+        self, hold: LegalHoldRecord, format_timestamp: Callable[[datetime], Any]
+    ) -> dict[str, Any]:
+        """Build the export summary for a hold.
+
+        Args:
+            hold: Hold to summarise.
+            format_timestamp: Applied to every non-null timestamp in the summary.
+
+        Returns:
+            Summary dict in the export_hold_summary shape.
+        """
+        acknowledged_count = 0
+        custodian_statuses: list[dict[str, Any]] = []
+        for custodian in hold.custodian_records:
+            name, status, notice_sent_at, acknowledged_at, reminder_count = (
+                _CUSTODIAN_EXPORT_FIELDS(custodian)
+            )
+            if acknowledged_at is not None:
+                acknowledged_count += 1
+            custodian_statuses.append({
+                "name": name,
+                "status": status,
+                "notice_sent_at": format_timestamp(notice_sent_at),
+                "acknowledged_at": format_timestamp(acknowledged_at) if acknowledged_at else None,
+                "reminder_count": reminder_count,
+            })
 
         return {
             "hold_id": hold.hold_id,
@@ -609,30 +1304,20 @@ class LegalHoldManager:
             "matter_type": hold.matter_type,
             "issuing_attorney": hold.issuing_attorney,
             "status": hold.status,
-            "issued_at": hold.issued_at.isoformat(),
-            "expires_at": hold.expires_at.isoformat() if hold.expires_at else None,
-            "released_at": hold.released_at.isoformat() if hold.released_at else None,
+            "issued_at": format_timestamp(hold.issued_at),
+            "expires_at": format_timestamp(hold.expires_at) if hold.expires_at else None,
+            "released_at": format_timestamp(hold.released_at) if hold.released_at else None,
             "release_reason": hold.release_reason,
             "total_custodians": len(hold.custodian_records),
             "acknowledged_custodians": acknowledged_count,
             "compliance_rate": round(acknowledged_count / max(1, len(hold.custodian_records)), 3),
-            "data_sources": hold.data_sources,
+            "data_sources": list(hold.data_sources),
             "regulatory_obligations": [
-                {"id": oid, **_REGULATORY_HOLD_OBLIGATIONS.get(oid, {})}
+                _EXPORTED_OBLIGATIONS.get(oid) or {"id": oid}
                 for oid in hold.regulatory_obligations
             ],
-            "custodian_statuses": [
-                {
-                    "name": c.custodian_name,
-                    "status": c.status,
-                    "notice_sent_at": c.notice_sent_at.isoformat(),
-                    "acknowledged_at": c.acknowledged_at.isoformat() if c.acknowledged_at else None,
-                    "reminder_count": c.reminder_count,
-                }
-                for c in hold.custodian_records
-            ],
+            "custodian_statuses": custodian_statuses,
             "audit_event_count": len(hold.audit_trail),
         }
 
-
-__all__ = ["LegalHoldManager", "LegalHoldRecord", "CustodianRecord"]
+__all__ = ["LegalHoldManager", "LegalHoldRecord", "CustodianRecord", "AuditEvent"]
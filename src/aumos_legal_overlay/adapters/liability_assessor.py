@@ -5,17 +5,36 @@ negligence, strict liability, and product liability. Produces assessment
 reports with mitigation recommendations and insurance requirements.
 """
 
-import uuid
-from dataclasses import dataclass, field
+import functools
+import json
+import operator
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from types import MappingProxyType
 from typing import Any
 
+import numpy as np
 from aumos_common.observability import get_logger
 
+from aumos_legal_overlay.adapters.identifiers import uuid4_batch
+
+try:
+    import orjson
+except ImportError:  # Optional: install the "fast-json" extra for faster exports.
+    orjson = None  # type: ignore[assignment]
+
 logger = get_logger(__name__)
 
+# The reference tables below are read-only views. Reports hold references to
+# the mitigation, insurance, and jurisdiction entries, so those entries are
+# read-only as well (mapping proxies and tuples); exports copy them into plain
+# dicts and lists.
 
 # AI Liability framework mapping by risk category
-_AI_LIABILITY_FRAMEWORKS: dict[str, dict[str, Any]] = {
+_AI_LIABILITY_FRAMEWORKS: Mapping[str, dict[str, Any]] = MappingProxyType({
     "negligence": {
         "description": "Failure to exercise reasonable care in AI development or deployment.",
         "elements": [
@@ -45,8 +64,26 @@ _AI_LIABILITY_FRAMEWORKS: dict[str, dict[str, Any]] = {
         ],
         "applicable_standards": ["EU Product Liability Directive", "UCC §2-314"],
     },
+})
+
+# AI-specific factors per framework as frozensets, for O(1) trigger checks.
+_FRAMEWORK_FACTOR_SETS: dict[str, frozenset[str]] = {
+    name: frozenset(framework["ai_specific_factors"])
+    for name, framework in _AI_LIABILITY_FRAMEWORKS.items()
 }
 
+# Per framework: (name, description, factors, standards) as immutable tuples,
+# so assessments can reference them without copying.
+_FRAMEWORK_STATIC: tuple[tuple[str, str, tuple[str, ...], tuple[str, ...]], ...] = tuple(
+    (
+        name,
+        framework["description"],
+        tuple(framework["ai_specific_factors"]),
+        tuple(framework["applicable_standards"]),
+    )
+    for name, framework in _AI_LIABILITY_FRAMEWORKS.items()
+)
+
 # Risk categorization by AI domain
 _AI_DOMAIN_RISK_LEVELS: dict[str, str] = {
     "medical_diagnosis": "critical",
@@ -65,9 +102,48 @@ _AI_DOMAIN_RISK_LEVELS: dict[str, str] = {
     "manufacturing_quality": "medium",
 }
 
-# Mitigation strategies by risk level
-_MITIGATION_STRATEGIES: dict[str, list[str]] = {
-    "critical": [
+# Risk levels in ascending order, their positions, and the escalated pair.
+_RISK_ORDER: tuple[str, ...] = ("low", "medium", "high", "critical")
+_RISK_INDEX: dict[str, int] = {level: i for i, level in enumerate(_RISK_ORDER)}
+_HIGH_CRITICAL: frozenset[str] = frozenset(("high", "critical"))
+
+
+def _escalated_risk_index(base_index: int, is_autonomous: bool, high_stakes: bool, human_oversight: bool) -> int:
+    """Apply the risk escalation rules to a base risk index.
+
+    Args:
+        base_index: Position of the domain's base risk level in _RISK_ORDER.
+        is_autonomous: Whether the AI makes autonomous decisions without review.
+        high_stakes: Whether decisions have significant real-world impact.
+        human_oversight: Whether human oversight is implemented.
+
+    Returns:
+        Position of the escalated risk level in _RISK_ORDER.
+    """
+    risk_index = base_index
+    # Escalate risk for autonomous high-stakes systems without oversight
+    if is_autonomous and high_stakes:
+        risk_index = min(3, risk_index + 1)
+    if not human_oversight and _RISK_ORDER[base_index] in _HIGH_CRITICAL:
+        risk_index = min(3, risk_index + 1)
+    return risk_index
+
+
+# (base risk index, is_autonomous, high_stakes, human_oversight) -> escalated
+# risk index, enumerated once over all 32 input combinations.
+_CATEGORIZE_LUT: dict[tuple[int, bool, bool, bool], int] = {
+    (base_index, is_autonomous, high_stakes, human_oversight): _escalated_risk_index(
+        base_index, is_autonomous, high_stakes, human_oversight
+    )
+    for base_index in range(len(_RISK_ORDER))
+    for is_autonomous in (False, True)
+    for high_stakes in (False, True)
+    for human_oversight in (False, True)
+}
+
+# Mitigation strategies by risk level (tuples, so reports can share them safely)
+_MITIGATION_STRATEGIES: Mapping[str, tuple[str, ...]] = MappingProxyType({
+    "critical": (
         "Deploy mandatory human-in-the-loop review for all AI decisions.",
         "Implement adversarial testing and red-team exercises quarterly.",
         "Establish independent AI ethics board with veto authority.",
@@ -75,32 +151,32 @@ _MITIGATION_STRATEGIES: dict[str, list[str]] = {
         "Obtain pre-deployment regulatory approval where required.",
         "Implement automatic fallback to human decision-making on uncertainty.",
         "Engage specialized AI liability insurance coverage.",
-    ],
-    "high": [
+    ),
+    "high": (
         "Implement human oversight for edge cases and outlier predictions.",
         "Conduct bias and fairness audits at least annually.",
         "Maintain audit logs of all AI decisions for 7+ years.",
         "Provide transparent explanations for automated decisions.",
         "Establish clear human escalation pathways.",
         "Obtain professional liability insurance with AI endorsement.",
-    ],
-    "medium": [
+    ),
+    "medium": (
         "Monitor model drift and performance degradation monthly.",
         "Implement output confidence thresholds with fallback logic.",
         "Maintain user feedback mechanisms for AI decision appeals.",
         "Conduct annual AI risk assessments.",
         "Document intended use and known limitations.",
-    ],
-    "low": [
+    ),
+    "low": (
         "Log AI interactions for periodic quality review.",
         "Provide clear disclosure of AI involvement to end users.",
         "Include standard limitation of liability clause in terms of service.",
-    ],
-}
+    ),
+})
 
 # Jurisdiction-specific liability rules
-_JURISDICTION_LIABILITY_RULES: dict[str, dict[str, Any]] = {
-    "EU": {
+_JURISDICTION_LIABILITY_RULES: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "EU": MappingProxyType({
         "primary_framework": "EU AI Act + AI Liability Directive",
         "strict_liability_threshold": "high_risk_ai_systems",
         "compensation_available": True,
@@ -108,8 +184,8 @@ _JURISDICTION_LIABILITY_RULES: dict[str, dict[str, Any]] = {
         "regulatory_authority": "National Market Surveillance Authorities",
         "max_fine_percentage": 7.0,
         "notes": "High-risk AI systems require conformity assessment before deployment.",
-    },
-    "US": {
+    }),
+    "US": MappingProxyType({
         "primary_framework": "Common law tort + sector-specific regulation",
         "strict_liability_threshold": "ultrahazardous_activities",
         "compensation_available": True,
@@ -117,8 +193,8 @@ _JURISDICTION_LIABILITY_RULES: dict[str, dict[str, Any]] = {
         "regulatory_authority": "FTC, CFPB, sector regulators",
         "max_fine_percentage": None,
         "notes": "No comprehensive federal AI law; patchwork of state laws (CA, CO, IL).",
-    },
-    "UK": {
+    }),
+    "UK": MappingProxyType({
         "primary_framework": "AI Safety Institute guidelines + tort law",
         "strict_liability_threshold": "case_by_case",
         "compensation_available": True,
@@ -126,8 +202,8 @@ _JURISDICTION_LIABILITY_RULES: dict[str, dict[str, Any]] = {
         "regulatory_authority": "ICO, FCA, sector regulators",
         "max_fine_percentage": 4.0,
         "notes": "Post-Brexit AI regulation diverging from EU framework.",
-    },
-    "US-CA": {
+    }),
+    "US-CA": MappingProxyType({
         "primary_framework": "California Consumer Privacy Act + CPRA + AB 2930",
         "strict_liability_threshold": "automated_decision_making",
         "compensation_available": True,
@@ -135,52 +211,154 @@ _JURISDICTION_LIABILITY_RULES: dict[str, dict[str, Any]] = {
         "regulatory_authority": "California Privacy Protection Agency",
         "max_fine_percentage": None,
         "notes": "AB 2930 requires ADMT impact assessments; CCPA opt-out rights apply.",
-    },
+    }),
+})
+
+
+def _jurisdiction_fine_terms(jurisdiction: str, rules: Mapping[str, Any]) -> tuple[float, str]:
+    """Derive the regulatory fine fraction and exposure note for a jurisdiction.
+
+    Args:
+        jurisdiction: Jurisdiction code as named in the note.
+        rules: Liability rules applied for that jurisdiction.
+
+    Returns:
+        Tuple of (fine as a fraction of revenue, exposure estimate note).
+    """
+    max_fine_pct = rules.get("max_fine_percentage") or 0.0
+    if max_fine_pct:
+        notes = (
+            f"Estimates based on {jurisdiction} regulatory framework. "
+            f"Regulatory fine calculated at {max_fine_pct}% of revenue."
+        )
+    else:
+        notes = "Regulatory fines vary; consult legal counsel for precise estimates."
+    return max_fine_pct / 100.0, notes
+
+
+@functools.lru_cache(maxsize=32)
+def _resolve_jurisdiction(jurisdiction: str) -> tuple[Mapping[str, Any], float, str]:
+    """Resolve everything an assessment needs about a jurisdiction in one lookup.
+
+    Unknown jurisdictions fall back to US rules. Memoized, so after warm-up
+    every jurisdiction resolves with a single cache hit.
+
+    Args:
+        jurisdiction: Jurisdiction code.
+
+    Returns:
+        Tuple of (liability rules, fine as a fraction of revenue, exposure note).
+    """
+    rules = _JURISDICTION_LIABILITY_RULES.get(jurisdiction, _JURISDICTION_LIABILITY_RULES["US"])
+    fine_fraction, notes = _jurisdiction_fine_terms(jurisdiction, rules)
+    return rules, fine_fraction, notes
+
+
+# Exposure coefficients by risk level: (class-action USD per affected user,
+# reputational multiplier of revenue, remediation multiplier of revenue).
+_EXPOSURE_COEFFS: dict[str, tuple[int, float, float]] = {
+    "critical": (10000, 2.0, 0.3),
+    "high": (3000, 0.5, 0.1),
+    "medium": (500, 0.1, 0.03),
+    "low": (100, 0.02, 0.005),
 }
 
+# The exposure coefficients as columns, indexed by position in _EXPOSURE_LEVELS,
+# for the vectorised batch estimator.
+_EXPOSURE_LEVELS: tuple[str, ...] = tuple(_EXPOSURE_COEFFS)
+_EXPOSURE_LEVEL_INDEX: dict[str, int] = {level: i for i, level in enumerate(_EXPOSURE_LEVELS)}
+_PER_USER_COLUMN = np.array([c[0] for c in _EXPOSURE_COEFFS.values()], dtype=np.int64)
+_REPUTATIONAL_COLUMN = np.array([c[1] for c in _EXPOSURE_COEFFS.values()], dtype=np.float64)
+_REMEDIATION_COLUMN = np.array([c[2] for c in _EXPOSURE_COEFFS.values()], dtype=np.float64)
+
+# Base normalized risk score by risk level
+_BASE_RISK_SCORES: dict[str, float] = {"critical": 0.85, "high": 0.65, "medium": 0.40, "low": 0.15}
+
 # Insurance requirement thresholds
-_INSURANCE_REQUIREMENTS: dict[str, dict[str, Any]] = {
-    "critical": {
+_INSURANCE_REQUIREMENTS: Mapping[str, Mapping[str, Any]] = MappingProxyType({
+    "critical": MappingProxyType({
         "minimum_coverage_usd": 50_000_000,
-        "policy_types": [
+        "policy_types": (
             "Technology Errors & Omissions (AI endorsement)",
             "Cyber Liability (AI incident coverage)",
             "Professional Liability",
             "Product Liability",
             "Directors & Officers (AI governance)",
-        ],
+        ),
         "retentions": "Negotiate per-occurrence retention below $500K",
         "additional_requirements": "Insurer must accept AI-generated harm claims",
-    },
-    "high": {
+    }),
+    "high": MappingProxyType({
         "minimum_coverage_usd": 10_000_000,
-        "policy_types": [
+        "policy_types": (
             "Technology Errors & Omissions",
             "Cyber Liability",
             "Professional Liability",
-        ],
+        ),
         "retentions": "Standard retentions acceptable",
         "additional_requirements": "Annual attestation of AI risk controls",
-    },
-    "medium": {
+    }),
+    "medium": MappingProxyType({
         "minimum_coverage_usd": 2_000_000,
-        "policy_types": [
+        "policy_types": (
             "Technology Errors & Omissions",
             "General Liability with tech endorsement",
-        ],
+        ),
         "retentions": "Standard retentions acceptable",
         "additional_requirements": "None beyond standard policy requirements",
-    },
-    "low": {
+    }),
+    "low": MappingProxyType({
         "minimum_coverage_usd": 1_000_000,
-        "policy_types": ["General Liability", "Professional Liability"],
+        "policy_types": ("General Liability", "Professional Liability"),
         "retentions": "Standard retentions acceptable",
         "additional_requirements": "None",
-    },
+    }),
+})
+
+# Risk level -> (mitigation strategies, insurance requirements), resolved once.
+_RISK_LEVEL_GUIDANCE: dict[str, tuple[tuple[str, ...], Mapping[str, Any]]] = {
+    level: (
+        _MITIGATION_STRATEGIES.get(level, ()),
+        _INSURANCE_REQUIREMENTS.get(level, _INSURANCE_REQUIREMENTS["medium"]),
+    )
+    for level in _RISK_ORDER
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
+class FrameworkAssessment:
+    """How one liability framework applies to an assessed AI system.
+
+    Attributes:
+        framework: Framework identifier (negligence, strict_liability, product_liability).
+        description: Framework description.
+        is_triggered: Whether the framework applies to the system.
+        triggered_factors: AI-specific factors that triggered the framework.
+        applicable_standards: Standards relevant to the framework.
+    """
+
+    framework: str
+    description: str
+    is_triggered: bool
+    triggered_factors: tuple[str, ...]
+    applicable_standards: tuple[str, ...]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize to the plain dict shape used in exported reports.
+
+        Returns:
+            Dict with list-valued factors and standards.
+        """
+        return {
+            "framework": self.framework,
+            "description": self.description,
+            "is_triggered": self.is_triggered,
+            "triggered_factors": list(self.triggered_factors),
+            "applicable_standards": list(self.applicable_standards),
+        }
+
+
+@dataclass(frozen=True, slots=True)
 class LiabilityAssessmentReport:
     """Full AI liability assessment report.
 
@@ -204,15 +382,97 @@ class LiabilityAssessmentReport:
     ai_domain: str
     jurisdiction: str
     risk_level: str
-    applicable_frameworks: list[dict[str, Any]]
+    applicable_frameworks: tuple[FrameworkAssessment, ...]
     exposure_estimates: dict[str, Any]
-    mitigation_strategies: list[str]
-    insurance_requirements: dict[str, Any]
-    jurisdiction_rules: dict[str, Any]
-    critical_risks: list[str] = field(default_factory=list)
+    mitigation_strategies: tuple[str, ...]
+    insurance_requirements: Mapping[str, Any]
+    jurisdiction_rules: Mapping[str, Any]
+    critical_risks: tuple[str, ...] = ()
     overall_risk_score: float = 0.0
 
 
+# Report fields in export order, and a getter that reads them in one call.
+_REPORT_FIELDS: tuple[str, ...] = (
+    "assessment_id",
+    "ai_system_name",
+    "ai_domain",
+    "jurisdiction",
+    "risk_level",
+    "overall_risk_score",
+    "applicable_frameworks",
+    "exposure_estimates",
+    "mitigation_strategies",
+    "insurance_requirements",
+    "jurisdiction_rules",
+    "critical_risks",
+)
+_get_report_fields = operator.attrgetter(*_REPORT_FIELDS)
+
+
+def _export_mapping(entry: Mapping[str, Any]) -> dict[str, Any]:
+    """Copy a read-only reference entry into a plain dict, with tuples as lists.
+
+    Args:
+        entry: Insurance or jurisdiction entry held by a report.
+
+    Returns:
+        Plain dict with the same keys and values.
+    """
+    return {key: list(value) if isinstance(value, tuple) else value for key, value in entry.items()}
+
+
+def _orjson_default(value: object) -> object:
+    """Serialise the read-only reference entries for orjson.
+
+    Args:
+        value: Object orjson could not handle.
+
+    Returns:
+        Plain dict for mappings such as MappingProxyType.
+
+    Raises:
+        TypeError: For any other type.
+    """
+    if isinstance(value, Mapping):
+        return dict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+# Reports whose exported dicts export_as_dict_cached keeps, per assessor.
+_EXPORT_CACHE_SIZE = 1024
+
+# Assessment ids generated per entropy read; each thread refills its own pool.
+_ID_POOL_SIZE = 256
+_id_pool = threading.local()
+
+
+def _reset_id_pool() -> None:
+    """Discard pre-generated ids in a forked child so it never reuses the parent's."""
+    global _id_pool
+    _id_pool = threading.local()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_id_pool)
+
+
+def _next_assessment_id() -> str:
+    """Return a fresh UUID4 string from the calling thread's id pool.
+
+    Ids are pre-generated in batches with uuid4_batch, one entropy read per
+    batch rather than per assessment. The pools are discarded in forked
+    children, so pre-fork workers never hand out the same ids.
+
+    Returns:
+        Canonical UUID4 string.
+    """
+    ids: list[str] | None = getattr(_id_pool, "ids", None)
+    if not ids:
+        ids = uuid4_batch(_ID_POOL_SIZE)
+        _id_pool.ids = ids
+    return ids.pop()
+
+
 class LiabilityAssessor:
     """Evaluates AI system liability exposure across legal frameworks.
 
@@ -223,6 +483,9 @@ class LiabilityAssessor:
 
     def __init__(self) -> None:
         """Initialize the liability assessor."""
+        # Per-assessor memo of the input-determined part of an assessment.
+        self._assess_core_cached = functools.lru_cache(maxsize=4096)(self._assess_core)
+        self._export_cache: OrderedDict[str, dict[str, Any]] = OrderedDict()
         logger.info("LiabilityAssessor initialized")
 
     def categorize_risk(
@@ -244,17 +507,10 @@ class LiabilityAssessor:
             Risk level string: "critical", "high", "medium", or "low".
         """
         base_risk = _AI_DOMAIN_RISK_LEVELS.get(ai_domain, "medium")
-
-        risk_order = ["low", "medium", "high", "critical"]
-        risk_index = risk_order.index(base_risk)
-
-        # Escalate risk for autonomous high-stakes systems without oversight
-        if is_autonomous and high_stakes_decisions:
-            risk_index = min(3, risk_index + 1)
-        if not human_oversight and base_risk in ("high", "critical"):
-            risk_index = min(3, risk_index + 1)
-
-        return risk_order[risk_index]
+        risk_index = _CATEGORIZE_LUT[
+            (_RISK_INDEX[base_risk], bool(is_autonomous), bool(high_stakes_decisions), bool(human_oversight))
+        ]
+        return _RISK_ORDER[risk_index]
 
     def estimate_exposure(
         self,
@@ -274,38 +530,22 @@ class LiabilityAssessor:
         Returns:
             Dict with exposure estimates by category and total potential exposure.
         """
-        # Regulatory fine estimates
-        jur_rules = _JURISDICTION_LIABILITY_RULES.get(
-            regulatory_jurisdiction,
-            _JURISDICTION_LIABILITY_RULES["US"]
+        # Regulatory fine estimates; unknown jurisdictions fall back to US rules.
+        _, fine_fraction, notes = _resolve_jurisdiction(regulatory_jurisdiction)
+        regulatory_fine_estimate = revenue_at_risk_usd * fine_fraction
+
+        per_user_multiplier, reputational_multiplier, remediation_multiplier = _EXPOSURE_COEFFS.get(
+            risk_level, _EXPOSURE_COEFFS["medium"]
         )
-        max_fine_pct = jur_rules.get("max_fine_percentage") or 0.0
-        regulatory_fine_estimate = revenue_at_risk_usd * (max_fine_pct / 100.0)
 
         # Class action exposure: $1K-$10K per affected user depending on risk
-        per_user_multiplier = {
-            "critical": 10000,
-            "high": 3000,
-            "medium": 500,
-            "low": 100,
-        }.get(risk_level, 500)
         class_action_exposure = affected_users_estimate * per_user_multiplier
 
         # Reputational exposure (estimated brand value impact)
-        reputational_exposure = revenue_at_risk_usd * {
-            "critical": 2.0,
-            "high": 0.5,
-            "medium": 0.1,
-            "low": 0.02,
-        }.get(risk_level, 0.1)
+        reputational_exposure = revenue_at_risk_usd * reputational_multiplier
 
         # Remediation costs
-        remediation_cost = revenue_at_risk_usd * {
-            "critical": 0.3,
-            "high": 0.1,
-            "medium": 0.03,
-            "low": 0.005,
-        }.get(risk_level, 0.03)
+        remediation_cost = revenue_at_risk_usd * remediation_multiplier
 
         total_exposure = (
             regulatory_fine_estimate
@@ -321,12 +561,70 @@ class LiabilityAssessor:
             "remediation_cost_usd": round(remediation_cost),
             "total_potential_exposure_usd": round(total_exposure),
             "per_user_exposure_usd": per_user_multiplier,
-            "notes": (
-                f"Estimates based on {regulatory_jurisdiction} regulatory framework. "
-                f"Regulatory fine calculated at {max_fine_pct}% of revenue."
-                if max_fine_pct
-                else "Regulatory fines vary; consult legal counsel for precise estimates."
-            ),
+            "notes": notes,
+        }
+
+    def estimate_exposure_batch(
+        self,
+        risk_levels: Sequence[str],
+        revenues_at_risk_usd: Sequence[float],
+        affected_users_estimates: Sequence[int],
+        regulatory_jurisdictions: Sequence[str],
+    ) -> dict[str, np.ndarray]:
+        """Estimate liability exposure for many AI systems at once.
+
+        Vectorised equivalent of calling estimate_exposure per system: the
+        per-level and per-jurisdiction coefficients are gathered into columns
+        and every exposure category is computed in one NumPy pass.
+
+        Args:
+            risk_levels: Risk level per system.
+            revenues_at_risk_usd: Annual revenue dependent on each system.
+            affected_users_estimates: Estimated affected users per system.
+            regulatory_jurisdictions: Jurisdiction per system.
+
+        Returns:
+            Dict of int64 arrays keyed like estimate_exposure's numeric fields,
+            with element i matching estimate_exposure for system i.
+
+        Raises:
+            ValueError: If the input sequences differ in length.
+        """
+        count = len(risk_levels)
+        if not (len(revenues_at_risk_usd) == len(affected_users_estimates) == len(regulatory_jurisdictions) == count):
+            raise ValueError("All batch inputs must have the same length.")
+
+        medium_index = _EXPOSURE_LEVEL_INDEX["medium"]
+        level_index = np.fromiter(
+            (_EXPOSURE_LEVEL_INDEX.get(level, medium_index) for level in risk_levels),
+            dtype=np.intp,
+            count=count,
+        )
+        unique_jurisdictions, jurisdiction_index = np.unique(
+            np.asarray(regulatory_jurisdictions, dtype=object), return_inverse=True
+        )
+        fine_fraction = np.array(
+            [_resolve_jurisdiction(code)[1] for code in unique_jurisdictions],
+            dtype=np.float64,
+        )[jurisdiction_index.reshape(-1)]
+
+        revenues = np.asarray(revenues_at_risk_usd, dtype=np.float64)
+        users = np.asarray(affected_users_estimates, dtype=np.int64)
+        per_user = _PER_USER_COLUMN[level_index]
+
+        regulatory_fine = revenues * fine_fraction
+        class_action = users * per_user
+        reputational = revenues * _REPUTATIONAL_COLUMN[level_index]
+        remediation = revenues * _REMEDIATION_COLUMN[level_index]
+        total = regulatory_fine + class_action + reputational + remediation
+
+        return {
+            "regulatory_fine_estimate_usd": np.rint(regulatory_fine).astype(np.int64),
+            "class_action_exposure_usd": class_action,
+            "reputational_exposure_usd": np.rint(reputational).astype(np.int64),
+            "remediation_cost_usd": np.rint(remediation).astype(np.int64),
+            "total_potential_exposure_usd": np.rint(total).astype(np.int64),
+            "per_user_exposure_usd": per_user,
         }
 
     def compute_risk_score(
@@ -347,8 +645,7 @@ class LiabilityAssessor:
         Returns:
             Normalized risk score from 0.0 (minimal) to 1.0 (critical).
         """
-        base_scores = {"critical": 0.85, "high": 0.65, "medium": 0.40, "low": 0.15}
-        score = base_scores.get(risk_level, 0.40)
+        score = _BASE_RISK_SCORES.get(risk_level, _BASE_RISK_SCORES["medium"])
 
         # Increase for each additional liability framework
         score += frameworks_triggered * 0.03
@@ -386,9 +683,11 @@ class LiabilityAssessor:
             missing_controls: Known missing risk controls.
 
         Returns:
-            LiabilityAssessmentReport with full risk analysis.
+            LiabilityAssessmentReport with full risk analysis. Repeated inputs
+            reuse a memoized analysis; its immutable FrameworkAssessment entries
+            are shared between reports.
         """
-        assessment_id = str(uuid.uuid4())
+        assessment_id = _next_assessment_id()
         missing_controls = missing_controls or []
 
         logger.info(
@@ -399,6 +698,81 @@ class LiabilityAssessor:
             jurisdiction=jurisdiction,
         )
 
+        (
+            risk_level,
+            applicable_frameworks,
+            exposure_estimates,
+            critical_risks,
+            overall_risk_score,
+            triggered_count,
+        ) = self._assess_core_cached(
+            ai_domain,
+            jurisdiction,
+            is_autonomous,
+            high_stakes_decisions,
+            human_oversight,
+            revenue_at_risk_usd,
+            affected_users_estimate,
+            tuple(missing_controls),
+        )
+
+        mitigation_strategies, insurance_requirements = _RISK_LEVEL_GUIDANCE[risk_level]
+        jurisdiction_rules = _resolve_jurisdiction(jurisdiction)[0]
+
+        report = LiabilityAssessmentReport(
+            assessment_id=assessment_id,
+            ai_system_name=ai_system_name,
+            ai_domain=ai_domain,
+            jurisdiction=jurisdiction,
+            risk_level=risk_level,
+            applicable_frameworks=applicable_frameworks,
+            exposure_estimates=dict(exposure_estimates),
+            mitigation_strategies=mitigation_strategies,
+            insurance_requirements=insurance_requirements,
+            jurisdiction_rules=jurisdiction_rules,
+            critical_risks=critical_risks,
+            overall_risk_score=overall_risk_score,
+        )
+
+        logger.info(
+            "Liability assessment complete",
+            assessment_id=assessment_id,
+            risk_level=risk_level,
+            overall_risk_score=overall_risk_score,
+            frameworks_triggered=triggered_count,
+        )
+        return report
+
+    def _assess_core(
+        self,
+        ai_domain: str,
+        jurisdiction: str,
+        is_autonomous: bool,
+        high_stakes_decisions: bool,
+        human_oversight: bool,
+        revenue_at_risk_usd: float,
+        affected_users_estimate: int,
+        missing_controls: tuple[str, ...],
+    ) -> tuple[str, tuple[FrameworkAssessment, ...], dict[str, Any], tuple[str, ...], float, int]:
+        """Compute the parts of an assessment that depend only on its inputs.
+
+        Memoized per assessor by ``_assess_core_cached``; the returned
+        structures are shared between reports and must not be mutated.
+
+        Args:
+            ai_domain: AI domain.
+            jurisdiction: Jurisdiction code.
+            is_autonomous: Whether the AI operates autonomously.
+            high_stakes_decisions: Whether decisions have significant real-world impact.
+            human_oversight: Whether human oversight is implemented.
+            revenue_at_risk_usd: Annual revenue at risk if system fails.
+            affected_users_estimate: Estimated user population affected.
+            missing_controls: Known missing risk controls, in caller order.
+
+        Returns:
+            Tuple of (risk_level, applicable_frameworks, exposure_estimates,
+            critical_risks, overall_risk_score, frameworks_triggered).
+        """
         risk_level = self.categorize_risk(
             ai_domain=ai_domain,
             is_autonomous=is_autonomous,
@@ -407,25 +781,28 @@ class LiabilityAssessor:
         )
 
         # Determine applicable frameworks
-        applicable_frameworks: list[dict[str, Any]] = []
-        for framework_name, framework in _AI_LIABILITY_FRAMEWORKS.items():
-            triggers = []
+        missing_control_set = frozenset(missing_controls)
+        applicable_frameworks: list[FrameworkAssessment] = []
+        triggered_count = 0
+        for framework_name, description, factors, standards in _FRAMEWORK_STATIC:
+            triggers: tuple[str, ...] = ()
             if framework_name == "negligence":
-                triggers = [f for f in framework["ai_specific_factors"] if f in missing_controls]
-            elif framework_name == "strict_liability" and (is_autonomous and risk_level in ("critical", "high")):
-                triggers = framework["ai_specific_factors"]
+                if not missing_control_set.isdisjoint(_FRAMEWORK_FACTOR_SETS[framework_name]):
+                    triggers = tuple(f for f in factors if f in missing_control_set)
+            elif framework_name == "strict_liability" and (is_autonomous and risk_level in _HIGH_CRITICAL):
+                triggers = factors
             elif framework_name == "product_liability" and high_stakes_decisions:
-                triggers = framework["ai_specific_factors"]
-
-            applicable_frameworks.append({
-                "framework": framework_name,
-                "description": framework["description"],
-                "is_triggered": len(triggers) > 0 or framework_name == "negligence",
-                "triggered_factors": triggers,
-                "applicable_standards": framework["applicable_standards"],
-            })
-
-        triggered_count = sum(1 for f in applicable_frameworks if f["is_triggered"])
+                triggers = factors
+
+            is_triggered = len(triggers) > 0 or framework_name == "negligence"
+            triggered_count += is_triggered
+            applicable_frameworks.append(FrameworkAssessment(
+                framework=framework_name,
+                description=description,
+                is_triggered=is_triggered,
+                triggered_factors=triggers,
+                applicable_standards=standards,
+            ))
 
         exposure_estimates = self.estimate_exposure(
             risk_level=risk_level,
@@ -434,17 +811,13 @@ class LiabilityAssessor:
             regulatory_jurisdiction=jurisdiction,
         )
 
-        mitigation_strategies = _MITIGATION_STRATEGIES.get(risk_level, [])
-        insurance_requirements = _INSURANCE_REQUIREMENTS.get(risk_level, _INSURANCE_REQUIREMENTS["medium"])
-        jurisdiction_rules = _JURISDICTION_LIABILITY_RULES.get(jurisdiction, _JURISDICTION_LIABILITY_RULES["US"])
-
         critical_risks: list[str] = []
-        if not human_oversight and risk_level in ("critical", "high"):
+        if not human_oversight and risk_level in _HIGH_CRITICAL:
             critical_risks.append("No human oversight on high-risk AI decisions — strict liability risk elevated.")
         if is_autonomous and jurisdiction == "EU":
             critical_risks.append("Autonomous AI in EU likely qualifies as 'high-risk' under EU AI Act Art.6.")
-        for control in missing_controls:
-            critical_risks.append(f"Missing control: {control}")
+        if missing_controls:
+            critical_risks += [f"Missing control: {control}" for control in missing_controls]
 
         overall_risk_score = self.compute_risk_score(
             risk_level=risk_level,
@@ -453,29 +826,14 @@ class LiabilityAssessor:
             jurisdiction=jurisdiction,
         )
 
-        report = LiabilityAssessmentReport(
-            assessment_id=assessment_id,
-            ai_system_name=ai_system_name,
-            ai_domain=ai_domain,
-            jurisdiction=jurisdiction,
-            risk_level=risk_level,
-            applicable_frameworks=applicable_frameworks,
-            exposure_estimates=exposure_estimates,
-            mitigation_strategies=mitigation_strategies,
-            insurance_requirements=insurance_requirements,
-            jurisdiction_rules=jurisdiction_rules,
-            critical_risks=critical_risks,
-            overall_risk_score=overall_risk_score,
-        )
-
-        logger.info(
-            "Liability assessment complete",
-            assessment_id=assessment_id,
-            risk_level=risk_level,
-            overall_risk_score=overall_risk_score,
-            frameworks_triggered=triggered_count,
+        return (
+            risk_level,
+            tuple(applicable_frameworks),
+            exposure_estimates,
+            tuple(critical_risks),
+            overall_risk_score,
+            triggered_count,
         )
-        return report
 
     def export_as_dict(self, report: LiabilityAssessmentReport) -> dict[str, Any]:
         """Serialize an assessment report to a plain dict.
@@ -486,20 +844,119 @@ class LiabilityAssessor:
         Returns:
             Plain dict representation for JSON serialization.
         """
+        exported = dict(zip(_REPORT_FIELDS, _get_report_fields(report), strict=True))
+        exported["applicable_frameworks"] = [f.to_dict() for f in report.applicable_frameworks]
+        exported["mitigation_strategies"] = list(report.mitigation_strategies)
+        exported["insurance_requirements"] = _export_mapping(report.insurance_requirements)
+        exported["jurisdiction_rules"] = _export_mapping(report.jurisdiction_rules)
+        exported["critical_risks"] = list(report.critical_risks)
+        return exported
+
+    def export_batch(self, reports: Sequence[LiabilityAssessmentReport]) -> dict[str, Any]:
+        """Serialize several reports, emitting shared reference data once.
+
+        Reports at the same risk level share their mitigation strategies and
+        insurance requirements, and reports in the same jurisdiction share its
+        rules. Those are written once under "_shared"; each report carries a
+        "mitigation_ref" (its risk level) and a "jurisdiction_ref" (its
+        jurisdiction) in their place. A report whose reference data differs
+        from what is already shared under its key keeps it inline instead.
+
+        Args:
+            reports: Reports to serialize, in output order.
+
+        Returns:
+            Dict with "_shared" reference data and the exported "reports".
+        """
+        shared_mitigation: dict[str, list[str]] = {}
+        shared_insurance: dict[str, dict[str, Any]] = {}
+        shared_rules: dict[str, dict[str, Any]] = {}
+        # Objects already shared under each key; a report refers to an entry
+        # only when it holds the very same object.
+        guidance_sources: dict[str, tuple[tuple[str, ...], Mapping[str, Any]]] = {}
+        rules_sources: dict[str, Mapping[str, Any]] = {}
+        exported_reports: list[dict[str, Any]] = []
+
+        for report in reports:
+            exported = dict(zip(_REPORT_FIELDS, _get_report_fields(report), strict=True))
+            exported["applicable_frameworks"] = [f.to_dict() for f in report.applicable_frameworks]
+            exported["critical_risks"] = list(report.critical_risks)
+
+            risk_level = report.risk_level
+            guidance = guidance_sources.get(risk_level)
+            if guidance is None:
+                guidance = guidance_sources[risk_level] = (report.mitigation_strategies, report.insurance_requirements)
+                shared_mitigation[risk_level] = list(report.mitigation_strategies)
+                shared_insurance[risk_level] = _export_mapping(report.insurance_requirements)
+            if guidance[0] is report.mitigation_strategies and guidance[1] is report.insurance_requirements:
+                del exported["mitigation_strategies"], exported["insurance_requirements"]
+                exported["mitigation_ref"] = risk_level
+            else:
+                exported["mitigation_strategies"] = list(report.mitigation_strategies)
+                exported["insurance_requirements"] = _export_mapping(report.insurance_requirements)
+
+            jurisdiction = report.jurisdiction
+            rules = rules_sources.get(jurisdiction)
+            if rules is None:
+                rules = rules_sources[jurisdiction] = report.jurisdiction_rules
+                shared_rules[jurisdiction] = _export_mapping(rules)
+            if rules is report.jurisdiction_rules:
+                del exported["jurisdiction_rules"]
+                exported["jurisdiction_ref"] = jurisdiction
+            else:
+                exported["jurisdiction_rules"] = _export_mapping(report.jurisdiction_rules)
+
+            exported_reports.append(exported)
+
         return {
-            "assessment_id": report.assessment_id,
-            "ai_system_name": report.ai_system_name,
-            "ai_domain": report.ai_domain,
-            "jurisdiction": report.jurisdiction,
-            "risk_level": report.risk_level,
-            "overall_risk_score": report.overall_risk_score,
-            "applicable_frameworks": report.applicable_frameworks,
-            "exposure_estimates": report.exposure_estimates,
-            "mitigation_strategies": report.mitigation_strategies,
-            "insurance_requirements": report.insurance_requirements,
-            "jurisdiction_rules": report.jurisdiction_rules,
-            "critical_risks": report.critical_risks,
+            "_shared": {
+                "mitigation_strategies": shared_mitigation,
+                "insurance_requirements": shared_insurance,
+                "jurisdiction_rules": shared_rules,
+            },
+            "reports": exported_reports,
         }
 
+    def export_as_dict_cached(self, report: LiabilityAssessmentReport) -> dict[str, Any]:
+        """Serialize a report to a plain dict, reusing earlier exports of it.
+
+        Reports are immutable and their assessment_id is unique, so the export
+        is cached by id (most recently used _EXPORT_CACHE_SIZE reports). The
+        returned dict is shared between calls and must not be mutated.
+
+        Args:
+            report: The LiabilityAssessmentReport to serialize.
+
+        Returns:
+            Plain dict representation, as export_as_dict.
+        """
+        export_cache = self._export_cache
+        exported = export_cache.get(report.assessment_id)
+        if exported is not None:
+            export_cache.move_to_end(report.assessment_id)
+            return exported
+        exported = self.export_as_dict(report)
+        export_cache[report.assessment_id] = exported
+        if len(export_cache) > _EXPORT_CACHE_SIZE:
+            export_cache.popitem(last=False)
+        return exported
+
+    def export_as_json(self, report: LiabilityAssessmentReport) -> bytes:
+        """Serialize an assessment report to UTF-8 JSON.
+
+        Uses orjson's native dataclass support when installed, skipping the
+        intermediate dict; otherwise encodes export_as_dict with the standard
+        library. Both produce the same fields and values.
+
+        Args:
+            report: The LiabilityAssessmentReport to serialize.
+
+        Returns:
+            JSON-encoded report bytes.
+        """
+        if orjson is not None:
+            return orjson.dumps(report, default=_orjson_default)
+        return json.dumps(self.export_as_dict(report), ensure_ascii=False).encode()
+
 
-__all__ = ["LiabilityAssessor", "LiabilityAssessmentReport"]
+__all__ = ["LiabilityAssessor", "LiabilityAssessmentReport", "FrameworkAssessment"]
@@ -4,16 +4,22 @@ Handles e-discovery workflows including document collection, privilege review,
 Bates numbering, production formatting, and Technology Assisted Review (TAR).
 """
 
+import bisect
+import functools
 import hashlib
-import random
+import re
 import string
 import uuid
+from collections.abc import Sequence
 from dataclasses import dataclass, field
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from typing import Any
 
+import numpy as np
 from aumos_common.observability import get_logger
 
+from aumos_legal_overlay.adapters.identifiers import uuid4_batch
+
 logger = get_logger(__name__)
 
 
@@ -33,37 +39,106 @@ _TAR_CONFIDENCE_TIERS: dict[str, dict[str, Any]] = {
     "non_responsive": {"probability_range": (0.0, 0.20), "action": "withhold"},
 }
 
+# TAR heuristics: document types commonly responsive in commercial disputes,
+# and subject keywords that typically indicate (non-)responsiveness.
+_TAR_BOOSTED_TYPES: frozenset[str] = frozenset(("email", "memo", "contract"))
+_TAR_RESPONSIVE_KEYWORDS: tuple[str, ...] = ("agreement", "contract", "payment", "dispute", "claim", "breach")
+_TAR_NON_RESPONSIVE_KEYWORDS: tuple[str, ...] = ("newsletter", "meeting minutes", "lunch", "social")
+
+# Each keyword table as one case-insensitive alternation, so a subject is
+# scanned once per table without a lowercased copy. Keywords match anywhere
+# in the subject, as the substring checks did.
+_TAR_RESPONSIVE_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, _TAR_RESPONSIVE_KEYWORDS)), re.IGNORECASE
+)
+_TAR_NON_RESPONSIVE_PATTERN: re.Pattern[str] = re.compile(
+    "|".join(map(re.escape, _TAR_NON_RESPONSIVE_KEYWORDS)), re.IGNORECASE
+)
+
+# TAR tiers in ascending confidence order, and the cut points between them.
+# A confidence's tier id is the number of cuts at or below it; a score on a
+# boundary belongs to the higher tier.
+_TAR_TIER_NAMES: tuple[str, ...] = tuple(
+    sorted(_TAR_CONFIDENCE_TIERS, key=lambda name: _TAR_CONFIDENCE_TIERS[name]["probability_range"][0])
+)
+_TAR_TIER_CUTS: tuple[float, ...] = tuple(
+    _TAR_CONFIDENCE_TIERS[name]["probability_range"][0] for name in _TAR_TIER_NAMES[1:]
+)
+_TAR_TIER_CUTS_ARRAY: np.ndarray = np.array(_TAR_TIER_CUTS)
+_TAR_TIER_IDS: dict[str, int] = {name: tier_id for tier_id, name in enumerate(_TAR_TIER_NAMES)}
+
+# Document production statuses and their ids in the columnar store.
+_PRODUCTION_STATUSES: tuple[str, ...] = ("collected", "withheld_privilege", "produced")
+_PRODUCTION_STATUS_IDS: dict[str, int] = {status: status_id for status_id, status in enumerate(_PRODUCTION_STATUSES)}
+
+# Separator between Bates numbers in the production manifest hash.
+_MANIFEST_SEPARATOR = b"|"
+
+# Version of the file_hash input layout, recorded in each document's metadata.
+# Version 2 hashes document id, subject, and the document date as raw int64
+# epoch nanoseconds; version 1 hashed the date's ISO 8601 string.
+_FILE_HASH_SCHEMA_VERSION = 2
+
+# Unix epoch and datetime's one-microsecond resolution, for exact integer
+# timestamp conversion.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+
+# Initial row capacity of the columnar document store; doubles when full.
+_INITIAL_COLUMN_CAPACITY = 1024
+
+
+@dataclass(frozen=True, slots=True)
+class ProductionFormat:
+    """Specification of a supported production format.
+
+    Attributes:
+        description: Human-readable format description.
+        file_extension: Extension of produced load files, or None for natives.
+        delimiter: Field delimiter of the load file, if any.
+        includes_metadata: Whether produced documents carry metadata.
+        includes_images: Whether produced documents include page images.
+    """
+
+    description: str
+    file_extension: str | None
+    delimiter: str | None
+    includes_metadata: bool
+    includes_images: bool
+
+
 # Production format specifications
-_PRODUCTION_FORMATS: dict[str, dict[str, Any]] = {
-    "concordance": {
-        "description": "Concordance DAT/OPT format for litigation databases",
-        "file_extension": ".dat",
-        "delimiter": "|",
-        "includes_metadata": True,
-        "includes_images": True,
-    },
-    "summation": {
-        "description": "Summation DII format",
-        "file_extension": ".dii",
-        "delimiter": ",",
-        "includes_metadata": True,
-        "includes_images": True,
-    },
-    "native": {
-        "description": "Native file format preservation",
-        "file_extension": None,
-        "delimiter": None,
-        "includes_metadata": False,
-        "includes_images": False,
-    },
-    "pdf": {
-        "description": "Searchable PDF production",
-        "file_extension": ".pdf",
-        "delimiter": None,
-        "includes_metadata": True,
-        "includes_images": True,
-    },
+_PRODUCTION_FORMAT_SPECS: dict[str, ProductionFormat] = {
+    "concordance": ProductionFormat(
+        description="Concordance DAT/OPT format for litigation databases",
+        file_extension=".dat",
+        delimiter="|",
+        includes_metadata=True,
+        includes_images=True,
+    ),
+    "summation": ProductionFormat(
+        description="Summation DII format",
+        file_extension=".dii",
+        delimiter=",",
+        includes_metadata=True,
+        includes_images=True,
+    ),
+    "native": ProductionFormat(
+        description="Native file format preservation",
+        file_extension=None,
+        delimiter=None,
+        includes_metadata=False,
+        includes_images=False,
+    ),
+    "pdf": ProductionFormat(
+        description="Searchable PDF production",
+        file_extension=".pdf",
+        delimiter=None,
+        includes_metadata=True,
+        includes_images=True,
+    ),
 }
+_PRODUCTION_FORMAT_NAMES: frozenset[str] = frozenset(_PRODUCTION_FORMAT_SPECS)
 
 # Privilege tags for review
 _PRIVILEGE_TAGS: list[str] = [
@@ -76,10 +151,147 @@ _PRIVILEGE_TAGS: list[str] = [
 ]
 
 
-@dataclass
+@functools.lru_cache(maxsize=8192)
+def _isoformat_at_offset(value: datetime, utc_offset: timedelta | None) -> str:
+    """Format a datetime as ISO 8601, memoized.
+
+    The UTC offset is part of the key because aware datetimes at the same
+    instant compare equal even when their offsets, and so their ISO strings,
+    differ.
+
+    Args:
+        value: Datetime to format.
+        utc_offset: value.utcoffset().
+
+    Returns:
+        value.isoformat().
+    """
+    return value.isoformat()
+
+
+def _isoformat(value: datetime) -> str:
+    """Return value.isoformat(), reusing earlier results for repeated datetimes.
+
+    Args:
+        value: Datetime to format.
+
+    Returns:
+        ISO 8601 string.
+    """
+    return _isoformat_at_offset(value, value.utcoffset())
+
+
+def _tar_keyword_hits(subject: str) -> tuple[bool, bool]:
+    """Check a subject for responsive and non-responsive TAR keywords.
+
+    Args:
+        subject: Document subject or title.
+
+    Returns:
+        Tuple of (has_responsive_keyword, has_non_responsive_keyword).
+    """
+    return (
+        _TAR_RESPONSIVE_PATTERN.search(subject) is not None,
+        _TAR_NON_RESPONSIVE_PATTERN.search(subject) is not None,
+    )
+
+
+def _classify_tar_batch(
+    rng: np.random.Generator,
+    document_types: Sequence[str],
+    subjects: Sequence[str],
+) -> tuple[list[float], list[str]]:
+    """Classify a batch of documents with the TAR heuristics in vectorized form.
+
+    Applies the same scoring as LitigationSupport._classify_tar to every
+    document at once: scores are drawn in bulk, keyword hits are computed once
+    per distinct subject, and tiers are found by searching the tier cut points.
+
+    Args:
+        rng: Random generator for the simulated model scores.
+        document_types: Type of each document.
+        subjects: Subject of each document, aligned with document_types.
+
+    Returns:
+        Tuple of (confidence scores, tier labels), one per document.
+    """
+    count = len(subjects)
+    if count == 0:
+        return [], []
+
+    keyword_hits = {subject: _tar_keyword_hits(subject) for subject in set(subjects)}
+    boosted = np.fromiter((t in _TAR_BOOSTED_TYPES for t in document_types), dtype=bool, count=count)
+    responsive = np.fromiter((keyword_hits[s][0] for s in subjects), dtype=bool, count=count)
+    non_responsive = np.fromiter((keyword_hits[s][1] for s in subjects), dtype=bool, count=count)
+
+    scores = rng.uniform(0.1, 0.9, size=count)
+    scores = np.where(boosted, np.minimum(1.0, scores + 0.15), scores)
+    scores = np.where(responsive, np.minimum(1.0, scores + 0.2), scores)
+    scores = np.where(non_responsive, np.maximum(0.0, scores - 0.3), scores)
+    confidences = np.round(scores, 3)
+
+    tier_ids = np.searchsorted(_TAR_TIER_CUTS_ARRAY, confidences, side="right")
+    return confidences.tolist(), [_TAR_TIER_NAMES[tier_id] for tier_id in tier_ids.tolist()]
+
+
+def _epoch_nanoseconds(moment: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch.
+
+    Naive datetimes are taken as UTC so the result does not depend on the
+    host's local timezone.
+
+    Args:
+        moment: Datetime to convert.
+
+    Returns:
+        Nanoseconds since 1970-01-01T00:00:00Z.
+    """
+    if moment.utcoffset() is None:
+        moment = moment.replace(tzinfo=timezone.utc)
+    return (moment - _EPOCH) // _ONE_MICROSECOND * 1000
+
+
+def _hash_record_bytes(document_id: str, subject: str, document_date: datetime) -> bytes:
+    """Pack a document's identity into the file hash input (schema version 2).
+
+    Args:
+        document_id: Internal document identifier (fixed-width UUID string).
+        subject: Document subject or title.
+        document_date: Date of the document.
+
+    Returns:
+        ASCII id, UTF-8 subject, then the date as little-endian int64 epoch nanoseconds.
+    """
+    return (
+        document_id.encode("ascii")
+        + subject.encode("utf-8")
+        + _epoch_nanoseconds(document_date).to_bytes(8, "little", signed=True)
+    )
+
+
+def _compute_file_hashes_batch(contents: Sequence[bytes]) -> list[bytes]:
+    """Compute SHA-256 hashes for a batch of document contents in one call.
+
+    Args:
+        contents: Document contents, in output order.
+
+    Returns:
+        Raw SHA-256 digest of each content.
+    """
+    sha256 = hashlib.sha256
+    return [sha256(content).digest() for content in contents]
+
+
+@dataclass(slots=True)
 class DocumentRecord:
     """An e-discovery document record.
 
+    LitigationSupport mirrors tar_confidence, tar_tier, is_privileged,
+    is_responsive, and production_status in its columnar store. Change those
+    fields only through LitigationSupport methods (apply_privilege_review,
+    create_production); direct assignments are not seen by
+    identify_responsive_documents or get_case_statistics.
+
     Attributes:
         document_id: Internal document identifier.
         bates_number: Assigned Bates number for production.
@@ -87,7 +299,7 @@ class DocumentRecord:
         document_type: Type of document (email, memo, etc.).
         document_date: Date of the document.
         subject: Document subject or title.
-        file_hash: SHA-256 hash for integrity tracking.
+        file_hash: Raw SHA-256 digest (32 bytes) for integrity tracking; hex-encoded on export.
         is_privileged: Whether document is withheld on privilege grounds.
         privilege_tags: Applied privilege designations.
         is_responsive: Whether document is responsive to discovery requests.
@@ -104,7 +316,7 @@ class DocumentRecord:
     document_type: str
     document_date: datetime
     subject: str
-    file_hash: str
+    file_hash: bytes
     is_privileged: bool
     privilege_tags: list[str]
     is_responsive: bool
@@ -115,7 +327,7 @@ class DocumentRecord:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class ProductionPackage:
     """A production package for document delivery to opposing counsel.
 
@@ -146,6 +358,55 @@ class ProductionPackage:
     integrity_hash: str
 
 
+class _DocumentColumns:
+    """Growable numpy columns mirroring the scanned fields of registered documents.
+
+    Row i describes the i-th registered document. Scans over confidence,
+    privilege, tier, and status touch these packed arrays instead of every
+    DocumentRecord object. Capacity doubles when full, so appends are
+    amortized O(1).
+    """
+
+    _COLUMNS: tuple[str, ...] = ("tar_confidence", "is_privileged", "is_responsive", "tier_ids", "status_ids")
+
+    def __init__(self) -> None:
+        """Allocate empty columns at the initial capacity."""
+        self.size = 0
+        self.tar_confidence = np.empty(_INITIAL_COLUMN_CAPACITY, dtype=np.float64)
+        self.is_privileged = np.empty(_INITIAL_COLUMN_CAPACITY, dtype=bool)
+        self.is_responsive = np.empty(_INITIAL_COLUMN_CAPACITY, dtype=bool)
+        self.tier_ids = np.empty(_INITIAL_COLUMN_CAPACITY, dtype=np.int8)
+        self.status_ids = np.empty(_INITIAL_COLUMN_CAPACITY, dtype=np.int8)
+
+    def append(self, record: DocumentRecord) -> int:
+        """Append a row for a newly registered document.
+
+        Args:
+            record: The registered DocumentRecord.
+
+        Returns:
+            Row index of the document.
+        """
+        row = self.size
+        if row == len(self.tar_confidence):
+            self._grow()
+        self.tar_confidence[row] = record.tar_confidence
+        self.is_privileged[row] = record.is_privileged
+        self.is_responsive[row] = record.is_responsive
+        self.tier_ids[row] = _TAR_TIER_IDS[record.tar_tier]
+        self.status_ids[row] = _PRODUCTION_STATUS_IDS[record.production_status]
+        self.size = row + 1
+        return row
+
+    def _grow(self) -> None:
+        """Double the capacity of every column, keeping existing rows."""
+        for name in self._COLUMNS:
+            column = getattr(self, name)
+            grown = np.empty(2 * len(column), dtype=column.dtype)
+            grown[: self.size] = column[: self.size]
+            setattr(self, name, grown)
+
+
 class LitigationSupport:
     """Manages e-discovery workflows for litigation readiness.
 
@@ -159,6 +420,7 @@ class LitigationSupport:
         case_number: str,
         bates_prefix: str = "PROD",
         starting_bates_sequence: int = 1,
+        seed: int | None = None,
     ) -> None:
         """Initialize the litigation support handler for a case.
 
@@ -166,12 +428,21 @@ class LitigationSupport:
             case_number: Official case number for this discovery matter.
             bates_prefix: Bates number prefix (e.g., "ACME", "PROD").
             starting_bates_sequence: Starting sequence number for Bates.
+            seed: Seed for the simulated TAR scores and synthetic batches;
+                fresh OS entropy if None.
         """
         self._case_number = case_number
         self._bates_prefix = bates_prefix
         self._bates_counter = starting_bates_sequence
         self._document_registry: dict[str, DocumentRecord] = {}
+        # Registered documents by row of the columnar store, and each id's row.
+        self._documents: list[DocumentRecord] = []
+        self._document_rows: dict[str, int] = {}
+        # Encoded Bates number by row, so manifest hashing never re-encodes.
+        self._bates_bytes: list[bytes] = []
+        self._columns = _DocumentColumns()
         self._production_log: list[dict[str, str]] = []
+        self._rng = np.random.default_rng(seed)
         logger.info(
             "LitigationSupport initialized",
             case_number=case_number,
@@ -188,16 +459,31 @@ class LitigationSupport:
         self._bates_counter += 1
         return bates
 
-    def _compute_file_hash(self, content: str) -> str:
+    def _assign_bates_numbers(self, count: int) -> list[str]:
+        """Assign the next count sequential Bates numbers in one pass.
+
+        Args:
+            count: Number of Bates numbers to assign.
+
+        Returns:
+            Formatted Bates number strings, in sequence order.
+        """
+        base = self._bates_counter
+        prefix = self._bates_prefix
+        bates_numbers = [f"{prefix}{sequence:07d}" for sequence in range(base, base + count)]
+        self._bates_counter = base + count
+        return bates_numbers
+
+    def _compute_file_hash(self, content: bytes) -> bytes:
         """Compute SHA-256 hash of document content.
 
         Args:
-            content: Document text content.
+            content: Document content bytes.
 
         Returns:
-            Hex-encoded SHA-256 hash.
+            Raw 32-byte SHA-256 digest.
         """
-        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+        return hashlib.sha256(content).digest()
 
     def _classify_tar(self, document_type: str, subject: str, custodian: str) -> tuple[float, str]:
         """Classify document responsiveness using TAR heuristics.
@@ -215,30 +501,22 @@ class LitigationSupport:
         """
         # Heuristic scoring: certain document types and keyword subjects
         # are more likely to be responsive in business litigation
-        base_score = random.uniform(0.1, 0.9)
+        base_score = float(self._rng.uniform(0.1, 0.9))
 
         # Boost for document types commonly responsive in commercial disputes
-        if document_type in ("email", "memo", "contract"):
+        if document_type in _TAR_BOOSTED_TYPES:
             base_score = min(1.0, base_score + 0.15)
 
-        # Keywords that typically indicate responsiveness
-        responsive_keywords = ["agreement", "contract", "payment", "dispute", "claim", "breach"]
-        non_responsive_keywords = ["newsletter", "meeting minutes", "lunch", "social"]
-
-        subject_lower = subject.lower()
-        if any(kw in subject_lower for kw in responsive_keywords):
+        # Keywords that typically indicate (non-)responsiveness
+        has_responsive, has_non_responsive = _tar_keyword_hits(subject)
+        if has_responsive:
             base_score = min(1.0, base_score + 0.2)
-        if any(kw in subject_lower for kw in non_responsive_keywords):
+        if has_non_responsive:
             base_score = max(0.0, base_score - 0.3)
 
         # Determine tier
         confidence = round(base_score, 3)
-        tier = "uncertain"
-        for tier_name, tier_data in _TAR_CONFIDENCE_TIERS.items():
-            low, high = tier_data["probability_range"]
-            if low <= confidence <= high:
-                tier = tier_name
-                break
+        tier = _TAR_TIER_NAMES[bisect.bisect_right(_TAR_TIER_CUTS, confidence)]
 
         return confidence, tier
 
@@ -273,30 +551,83 @@ class LitigationSupport:
         """
         document_id = str(uuid.uuid4())
         bates_number = self._assign_bates_number()
-        file_hash = self._compute_file_hash(f"{document_id}{subject}{document_date.isoformat()}")
+        file_hash = self._compute_file_hash(_hash_record_bytes(document_id, subject, document_date))
         tar_confidence, tar_tier = self._classify_tar(document_type, subject, custodian)
-        applied_tags = privilege_tags or []
-        is_privileged = len(applied_tags) > 0
-        is_responsive = tar_tier in ("highly_responsive", "likely_responsive")
-
-        record = DocumentRecord(
+        return self._register_document(
             document_id=document_id,
             bates_number=bates_number,
+            file_hash=file_hash,
+            tar_confidence=tar_confidence,
+            tar_tier=tar_tier,
             custodian=custodian,
             document_type=document_type,
-            document_date=document_date,
             subject=subject,
-            file_hash=file_hash,
-            is_privileged=is_privileged,
-            privilege_tags=applied_tags,
-            is_responsive=is_responsive,
+            document_date=document_date,
+            privilege_tags=privilege_tags,
             is_redacted=is_redacted,
-            tar_confidence=tar_confidence,
-            tar_tier=tar_tier,
-            production_status="collected",
-            metadata=metadata or {},
+            metadata=metadata,
+        )
+
+    def _register_document(
+        self,
+        document_id: str,
+        bates_number: str,
+        file_hash: bytes,
+        tar_confidence: float,
+        tar_tier: str,
+        custodian: str,
+        document_type: str,
+        subject: str,
+        document_date: datetime,
+        privilege_tags: list[str] | None,
+        is_redacted: bool,
+        metadata: dict[str, Any] | None,
+    ) -> DocumentRecord:
+        """Register a numbered, hashed, TAR-classified document.
+
+        Args:
+            document_id: Internal document identifier.
+            bates_number: Assigned Bates number.
+            file_hash: Raw SHA-256 digest of the document content.
+            tar_confidence: TAR responsiveness confidence score.
+            tar_tier: TAR confidence tier classification.
+            custodian: Custodian possessing this document.
+            document_type: Type of document.
+            subject: Document subject or title.
+            document_date: Date of the document.
+            privilege_tags: Applied privilege designations.
+            is_redacted: Whether the document has been redacted.
+            metadata: Additional document metadata.
+
+        Returns:
+            Registered DocumentRecord.
+        """
+        applied_tags = privilege_tags or []
+        is_privileged = len(applied_tags) > 0
+        is_responsive = tar_tier in ("highly_responsive", "likely_responsive")
+
+        # Positional, in DocumentRecord field order, to skip keyword binding.
+        record = DocumentRecord(
+            document_id,
+            bates_number,
+            custodian,
+            document_type,
+            document_date,
+            subject,
+            file_hash,
+            is_privileged,
+            applied_tags,
+            is_responsive,
+            is_redacted,
+            tar_confidence,
+            tar_tier,
+            "collected",
+            {**(metadata or {}), "file_hash_schema": _FILE_HASH_SCHEMA_VERSION},
         )
         self._document_registry[document_id] = record
+        self._document_rows[document_id] = self._columns.append(record)
+        self._documents.append(record)
+        self._bates_bytes.append(bates_number.encode())
 
         logger.debug(
             "Document collected",
@@ -339,26 +670,62 @@ class LitigationSupport:
         ]
 
         time_range_seconds = int((date_range_end - date_range_start).total_seconds())
-        records: list[DocumentRecord] = []
-
-        for _ in range(document_count):
-            custodian = random.choice(custodians)
-            doc_type = random.choice(types)
-            subject = random.choice(subjects)
-            doc_seconds = random.randint(0, time_range_seconds)
-            doc_date = date_range_start + __import__("datetime").timedelta(seconds=doc_seconds)
-            tags: list[str] = []
-            if random.random() < privilege_rate:
-                tags = [random.choice(_PRIVILEGE_TAGS)]
-
-            record = self.collect_document(
+
+        # Draw every document's attributes as vectors; Python only assembles them.
+        rng = self._rng
+        custodian_ids = rng.integers(0, len(custodians), size=document_count).tolist()
+        type_ids = rng.integers(0, len(types), size=document_count).tolist()
+        subject_ids = rng.integers(0, len(subjects), size=document_count).tolist()
+        doc_seconds = rng.integers(0, time_range_seconds, size=document_count, endpoint=True).tolist()
+        privileged = (rng.random(document_count) < privilege_rate).tolist()
+        tag_ids = rng.integers(0, len(_PRIVILEGE_TAGS), size=document_count).tolist()
+
+        drawn: list[tuple[str, str, str, datetime, list[str]]] = [
+            (
+                custodians[custodian_id],
+                types[type_id],
+                subjects[subject_id],
+                date_range_start + timedelta(seconds=seconds),
+                [_PRIVILEGE_TAGS[tag_id]] if is_privileged else [],
+            )
+            for custodian_id, type_id, subject_id, seconds, is_privileged, tag_id in zip(
+                custodian_ids, type_ids, subject_ids, doc_seconds, privileged, tag_ids, strict=True
+            )
+        ]
+
+        # Hash the whole batch in one call rather than once per collect_document.
+        document_ids = uuid4_batch(len(drawn))
+        file_hashes = _compute_file_hashes_batch([
+            _hash_record_bytes(document_id, subject, doc_date)
+            for document_id, (_, _, subject, doc_date, _) in zip(document_ids, drawn, strict=True)
+        ])
+        tar_confidences, tar_tiers = _classify_tar_batch(
+            rng,
+            [doc_type for _, doc_type, _, _, _ in drawn],
+            [subject for _, _, subject, _, _ in drawn],
+        )
+
+        bates_numbers = self._assign_bates_numbers(len(drawn))
+
+        generated = zip(document_ids, bates_numbers, file_hashes, tar_confidences, tar_tiers, strict=True)
+        records = [
+            self._register_document(
+                document_id=document_id,
+                bates_number=bates_number,
+                file_hash=file_hash,
+                tar_confidence=confidence,
+                tar_tier=tier,
                 custodian=custodian,
                 document_type=doc_type,
                 subject=subject,
                 document_date=doc_date,
                 privilege_tags=tags,
+                is_redacted=False,
+                metadata=None,
             )
-            records.append(record)
+            for (custodian, doc_type, subject, doc_date, tags), (document_id, bates_number, file_hash, confidence, tier)
+            in zip(drawn, generated, strict=True)
+        ]
 
         logger.info(
             "Batch document collection complete",
@@ -389,6 +756,9 @@ class LitigationSupport:
         record.is_privileged = len(privilege_tags) > 0
         if record.is_privileged:
             record.production_status = "withheld_privilege"
+        row = self._document_rows[document_id]
+        self._columns.is_privileged[row] = record.is_privileged
+        self._columns.status_ids[row] = _PRODUCTION_STATUS_IDS[record.production_status]
         record.metadata["reviewing_attorney"] = reviewing_attorney
         record.metadata["review_timestamp"] = datetime.now(tz=timezone.utc).isoformat()
 
@@ -411,10 +781,8 @@ class LitigationSupport:
         Returns:
             List of responsive DocumentRecord instances.
         """
-        responsive = [
-            doc for doc in self._document_registry.values()
-            if doc.tar_confidence >= confidence_threshold and not doc.is_privileged
-        ]
+        documents = self._documents
+        responsive = [documents[row] for row in self._responsive_rows(confidence_threshold).tolist()]
         logger.info(
             "Responsive document identification",
             responsive_count=len(responsive),
@@ -422,6 +790,20 @@ class LitigationSupport:
         )
         return responsive
 
+    def _responsive_rows(self, confidence_threshold: float) -> np.ndarray:
+        """Find rows of non-privileged documents at or above a TAR confidence.
+
+        Args:
+            confidence_threshold: Minimum TAR confidence to mark as responsive.
+
+        Returns:
+            Ascending row indices into the columnar document store.
+        """
+        columns = self._columns
+        size = columns.size
+        mask = (columns.tar_confidence[:size] >= confidence_threshold) & ~columns.is_privileged[:size]
+        return np.flatnonzero(mask)
+
     def create_production(
         self,
         production_format: str = "concordance",
@@ -439,10 +821,10 @@ class LitigationSupport:
         Raises:
             ValueError: If production_format is unsupported.
         """
-        if production_format not in _PRODUCTION_FORMATS:
+        if production_format not in _PRODUCTION_FORMAT_NAMES:
             raise ValueError(
                 f"Unsupported format '{production_format}'. "
-                f"Supported: {list(_PRODUCTION_FORMATS.keys())}"
+                f"Supported: {list(_PRODUCTION_FORMAT_SPECS)}"
             )
 
         production_id = str(uuid.uuid4())
@@ -457,8 +839,11 @@ class LitigationSupport:
 
         bates_start = responsive_docs[0].bates_number if responsive_docs else f"{self._bates_prefix}0000001"
         bates_end = responsive_docs[-1].bates_number if responsive_docs else bates_start
-        total_pages = sum(random.randint(1, 20) for _ in responsive_docs)
+        total_pages = int(self._rng.integers(1, 20, size=len(responsive_docs), endpoint=True).sum())
 
+        document_rows = self._document_rows
+        produced_rows = [document_rows[doc.document_id] for doc in responsive_docs]
+        self._columns.status_ids[produced_rows] = _PRODUCTION_STATUS_IDS["produced"]
         production_log: list[dict[str, str]] = []
         for doc in responsive_docs:
             doc.production_status = "produced"
@@ -467,16 +852,23 @@ class LitigationSupport:
                 "bates_number": doc.bates_number,
                 "custodian": doc.custodian,
                 "document_type": doc.document_type,
-                "document_date": doc.document_date.isoformat(),
+                "document_date": _isoformat(doc.document_date),
                 "subject": doc.subject,
-                "file_hash": doc.file_hash,
+                "file_hash": doc.file_hash.hex(),
             })
 
         self._production_log.extend(production_log)
 
-        # Integrity hash of the manifest
-        manifest_content = "|".join(entry["bates_number"] for entry in production_log)
-        integrity_hash = hashlib.sha256(manifest_content.encode()).hexdigest()
+        # Integrity hash of the "|"-joined Bates manifest, streamed entry by
+        # entry so the joined manifest is never materialized.
+        bates_bytes = self._bates_bytes
+        manifest_hash = hashlib.sha256()
+        separator = b""
+        for row in produced_rows:
+            manifest_hash.update(separator)
+            manifest_hash.update(bates_bytes[row])
+            separator = _MANIFEST_SEPARATOR
+        integrity_hash = manifest_hash.hexdigest()
 
         package = ProductionPackage(
             production_id=production_id,
@@ -507,25 +899,27 @@ class LitigationSupport:
         Returns:
             Dict with total counts, privilege rate, TAR tier distribution.
         """
-        docs = list(self._document_registry.values())
-        privileged = [d for d in docs if d.is_privileged]
-        responsive = [d for d in docs if d.is_responsive]
-        produced = [d for d in docs if d.production_status == "produced"]
-
-        tier_distribution: dict[str, int] = {}
-        for doc in docs:
-            tier_distribution[doc.tar_tier] = tier_distribution.get(doc.tar_tier, 0) + 1
+        columns = self._columns
+        size = columns.size
+        privileged_count = int(np.count_nonzero(columns.is_privileged[:size]))
+        responsive_count = int(np.count_nonzero(columns.is_responsive[:size]))
+        produced_count = int(np.count_nonzero(columns.status_ids[:size] == _PRODUCTION_STATUS_IDS["produced"]))
+
+        tier_counts = np.bincount(columns.tier_ids[:size], minlength=len(_TAR_TIER_NAMES)).tolist()
+        tier_distribution: dict[str, int] = {
+            tier: count for tier, count in zip(_TAR_TIER_NAMES, tier_counts, strict=True) if count
+        }
 
         return {
             "case_number": self._case_number,
-            "total_collected": len(docs),
-            "privileged_count": len(privileged),
-            "privilege_rate": round(len(privileged) / max(1, len(docs)), 3),
-            "responsive_count": len(responsive),
-            "responsiveness_rate": round(len(responsive) / max(1, len(docs)), 3),
-            "produced_count": len(produced),
+            "total_collected": size,
+            "privileged_count": privileged_count,
+            "privilege_rate": round(privileged_count / max(1, size), 3),
+            "responsive_count": responsive_count,
+            "responsiveness_rate": round(responsive_count / max(1, size), 3),
+            "produced_count": produced_count,
             "tar_tier_distribution": tier_distribution,
-            "custodians": list({d.custodian for d in docs}),
+            "custodians": list({d.custodian for d in self._documents}),
             "bates_counter": self._bates_counter,
         }
 
@@ -538,4 +932,4 @@ class LitigationSupport:
         return list(self._production_log)
 
 
-__all__ = ["LitigationSupport", "DocumentRecord", "ProductionPackage"]
+__all__ = ["LitigationSupport", "DocumentRecord", "ProductionPackage", "ProductionFormat"]
@@ -4,15 +4,24 @@ GAP-312: ML-Based Privilege Analysis.
 """
 from __future__ import annotations
 
+import asyncio
+import hashlib
 import json
+from collections import OrderedDict
+from collections.abc import Sequence
 from enum import Enum
-from typing import TYPE_CHECKING, Literal
+from typing import TYPE_CHECKING, Any, Literal
 
 import httpx
 from pydantic import BaseModel, Field
 
 from aumos_common.observability import get_logger
 
+try:
+    import orjson
+except ImportError:  # Optional: install the "fast-json" extra for faster parsing.
+    orjson = None  # type: ignore[assignment]
+
 if TYPE_CHECKING:
     from aumos_legal_overlay.adapters.document_processor import DocumentProcessor
 
@@ -42,6 +51,19 @@ Legal standards to apply:
 - Mediation privilege: communications in mediation proceedings
 """
 
+# The prompt's fixed text around its two placeholders, rendered once so each
+# call only concatenates instead of re-parsing the template.
+_PROMPT_HEAD, _PROMPT_MID, _PROMPT_TAIL = PRIVILEGE_CLASSIFICATION_PROMPT.format(
+    metadata_json="\0", document_excerpt="\0"
+).split("\0")
+
+
+def _json_loads(data: bytes | str) -> dict[str, Any]:
+    """Parse a JSON object with orjson when installed, else the standard library."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
 
 class PrivilegeType(str, Enum):
     """Attorney-client privilege type classifications."""
@@ -64,7 +86,7 @@ class PrivilegeAnalysisResult(BaseModel):
     privilege_type: PrivilegeType
     confidence_score: float = Field(ge=0.0, le=1.0)
     reasoning: str
-    analysis_method: Literal["llm", "pattern_fallback"] = "llm"
+    analysis_method: Literal["llm", "llm_cached", "pattern_fallback"] = "llm"
     llm_model_id: str = ""
 
 
@@ -80,6 +102,10 @@ class LLMPrivilegeAnalyzer:
       responses cannot be reliably parsed for legal privilege determinations.
     - Fallback to pattern analysis (not failure) — legal hold workflows
       cannot block on external service availability.
+    - LLM results are memoized by a hash of (metadata, excerpt). Temperature
+      0.0 makes the call deterministic, so deduplicated boilerplate (form
+      NDAs, template emails) is classified once. Cache hits are recorded as
+      analysis_method="llm_cached"; pattern fallbacks are never cached.
     """
 
     def __init__(
@@ -89,12 +115,36 @@ class LLMPrivilegeAnalyzer:
         http_client: httpx.AsyncClient,
         fallback_analyzer: "DocumentProcessor",
         confidence_threshold: float = 0.85,
+        cache_size: int = 4096,
     ) -> None:
         self._llm_url = llm_serving_url
         self._model_id = llm_model_id
         self._client = http_client
         self._fallback = fallback_analyzer
         self._threshold = confidence_threshold
+        self._cache_size = cache_size
+        self._result_cache: OrderedDict[bytes, PrivilegeAnalysisResult] = OrderedDict()
+        self._cache_hits = 0
+        self._cache_misses = 0
+
+    @staticmethod
+    def _cache_key(metadata: dict, excerpt: str) -> bytes:
+        """Hash the inputs that determine an LLM classification."""
+        key_hash = hashlib.blake2b(digest_size=16)
+        key_hash.update(json.dumps(metadata, sort_keys=True).encode())
+        key_hash.update(b"\0")
+        key_hash.update(excerpt[:2000].encode())
+        return key_hash.digest()
+
+    def cache_info(self) -> dict[str, float]:
+        """Return LLM result cache hits, misses, hit rate, and current size."""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+            "size": len(self._result_cache),
+        }
 
     async def analyze(
         self,
@@ -112,8 +162,27 @@ class LLMPrivilegeAnalyzer:
         Returns:
             PrivilegeAnalysisResult with privilege determination and confidence.
         """
+        return await self._analyze_keyed(
+            self._cache_key(document_metadata, document_excerpt), document_id, document_metadata, document_excerpt
+        )
+
+    async def _analyze_keyed(
+        self,
+        cache_key: bytes,
+        document_id: str,
+        document_metadata: dict,
+        document_excerpt: str,
+    ) -> PrivilegeAnalysisResult:
+        """Analyze a document whose cache key has already been computed."""
+        cached = self._result_cache.get(cache_key)
+        if cached is not None:
+            self._cache_hits += 1
+            self._result_cache.move_to_end(cache_key)
+            return cached
+        self._cache_misses += 1
+
         try:
-            return await self._llm_analyze(document_metadata, document_excerpt)
+            result = await self._llm_analyze(document_metadata, document_excerpt)
         except (httpx.RequestError, httpx.HTTPStatusError) as exc:
             logger.warning(
                 "llm_privilege_fallback",
@@ -122,12 +191,56 @@ class LLMPrivilegeAnalyzer:
             )
             return await self._pattern_fallback(document_metadata, document_excerpt)
 
+        if self._cache_size > 0:
+            self._result_cache[cache_key] = result.model_copy(update={"analysis_method": "llm_cached"})
+            if len(self._result_cache) > self._cache_size:
+                self._result_cache.popitem(last=False)
+        return result
+
+    async def analyze_many(
+        self,
+        documents: Sequence[tuple[str, dict, str]],
+        max_concurrency: int = 16,
+    ) -> list[PrivilegeAnalysisResult]:
+        """Analyze many documents with bounded concurrent LLM requests.
+
+        Each document goes through the same path as analyze, so cached
+        results, per-document pattern fallback, and audit fields behave as for
+        single calls. Repeated documents are analyzed after their first copy.
+
+        Args:
+            documents: (document_id, document_metadata, document_excerpt) tuples.
+            max_concurrency: Maximum LLM requests in flight at once.
+
+        Returns:
+            One PrivilegeAnalysisResult per document, in input order.
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+        # Set once the first copy of each distinct document has been analyzed.
+        first_copy_done: dict[bytes, asyncio.Event] = {}
+
+        async def analyze_bounded(document_id: str, metadata: dict, excerpt: str) -> PrivilegeAnalysisResult:
+            cache_key = self._cache_key(metadata, excerpt)
+            first_copy = first_copy_done.get(cache_key)
+            done: asyncio.Event | None = None
+            if first_copy is None:
+                done = first_copy_done[cache_key] = asyncio.Event()
+            else:
+                # Repeats wait for the first copy, so they are served from the
+                # cache just as they would be when analyzed one at a time.
+                await first_copy.wait()
+            try:
+                async with semaphore:
+                    return await self._analyze_keyed(cache_key, document_id, metadata, excerpt)
+            finally:
+                if done is not None:
+                    done.set()
+
+        return list(await asyncio.gather(*(analyze_bounded(*document) for document in documents)))
+
     async def _llm_analyze(self, metadata: dict, excerpt: str) -> PrivilegeAnalysisResult:
         """Call aumos-llm-serving for privilege classification."""
-        prompt = PRIVILEGE_CLASSIFICATION_PROMPT.format(
-            metadata_json=json.dumps(metadata, indent=2),
-            document_excerpt=excerpt[:2000],
-        )
+        prompt = "".join((_PROMPT_HEAD, json.dumps(metadata, indent=2), _PROMPT_MID, excerpt[:2000], _PROMPT_TAIL))
         response = await self._client.post(
             f"{self._llm_url}/api/v1/llm/complete",
             json={
@@ -140,7 +253,7 @@ class LLMPrivilegeAnalyzer:
             timeout=30.0,
         )
         response.raise_for_status()
-        parsed = json.loads(response.json()["choices"][0]["text"])
+        parsed = _json_loads(_json_loads(response.content)["choices"][0]["text"])
         return PrivilegeAnalysisResult(
             is_privileged=parsed["is_privileged"],
             privilege_type=PrivilegeType(parsed["privilege_type"]),
@@ -5,8 +5,11 @@ inadvertent disclosure detection, clawback procedures, and redaction workflows.
 """
 
 import hashlib
+import itertools
+import operator
 import re
 import uuid
+from collections import Counter
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any
@@ -85,6 +88,14 @@ _INADVERTENT_DISCLOSURE_PATTERNS: list[re.Pattern[str]] = [
     re.compile(r"\bconfidential\s+legal\s+advice\b", re.IGNORECASE),
 ]
 
+# Each disclosure pattern with a literal that every match must contain, for
+# a cheap substring test on the lowercased text before running the regex.
+# Anchors avoid "i" and "s": re.IGNORECASE matches dotless i (U+0131) and
+# long s (U+017F) to them, but str.lower() leaves those characters unchanged.
+_DISCLOSURE_PREFILTERS: tuple[tuple[str, re.Pattern[str]], ...] = tuple(
+    zip(("leged", "attorney", "product", "forward", "only", "legal"), _INADVERTENT_DISCLOSURE_PATTERNS, strict=True)
+)
+
 # Attorney name pattern (simplified — Esq., Attorney, Counsel markers)
 _ATTORNEY_IDENTIFIER_PATTERN = re.compile(
     r"\b(?:Esq\.?|Attorney\s+at\s+Law|General\s+Counsel|Deputy\s+GC|Legal\s+Counsel)\b",
@@ -92,7 +103,7 @@ _ATTORNEY_IDENTIFIER_PATTERN = re.compile(
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivilegeClassification:
     """Result of classifying a document for privilege.
 
@@ -123,7 +134,7 @@ class PrivilegeClassification:
     reviewer_notes: str
 
 
-@dataclass
+@dataclass(slots=True)
 class PrivilegeLogEntry:
     """A single privilege log entry compliant with FRCP 26(b)(5).
 
@@ -162,7 +173,29 @@ class PrivilegeLogEntry:
     review_date: datetime
 
 
-@dataclass
+# Privilege log export fields in column order, and a getter that reads them
+# in one call.
+_LOG_EXPORT_FIELDS: tuple[str, ...] = (
+    "entry_number",
+    "entry_id",
+    "case_number",
+    "document_id",
+    "bates_number",
+    "document_type",
+    "document_date",
+    "author",
+    "recipients",
+    "privilege_type",
+    "privilege_basis",
+    "subject_matter",
+    "is_redacted",
+    "reviewing_attorney",
+    "review_date",
+)
+_get_log_export_fields = operator.attrgetter(*_LOG_EXPORT_FIELDS)
+
+
+@dataclass(slots=True)
 class ClawbackRequest:
     """An inadvertent disclosure clawback request.
 
@@ -216,6 +249,9 @@ class PrivilegePreserver:
         self._privilege_log: list[PrivilegeLogEntry] = []
         self._clawback_requests: dict[str, ClawbackRequest] = {}
         self._log_entry_counter = 0
+        # Running aggregates so get_review_summary never rescans the log
+        self._by_type_counts: Counter[str] = Counter()
+        self._redacted_count = 0
         logger.info(
             "PrivilegePreserver initialized",
             case_number=case_number,
@@ -251,26 +287,26 @@ class PrivilegePreserver:
         elements_missing: list[str] = []
         waiver_risks: list[str] = []
 
-        # Check for attorney identifier in author or recipients
-        has_attorney = False
+        # Check for attorney identifier in author or recipients with one search.
+        # NUL is neither a word nor a whitespace character (unlike "\x1f"), so
+        # no match can span two parties.
         all_parties = [author or ""] + (recipients or [])
-        for party in all_parties:
-            if _ATTORNEY_IDENTIFIER_PATTERN.search(party):
-                has_attorney = True
-                break
+        has_attorney = _ATTORNEY_IDENTIFIER_PATTERN.search("\0".join(all_parties)) is not None
 
-        # Check document text for attorney language
+        # Check document text for attorney language, skipping patterns whose
+        # anchor literal is absent
+        text_lc = document_text.lower()
         text_matches = sum(
-            1 for pattern in _INADVERTENT_DISCLOSURE_PATTERNS
-            if pattern.search(document_text)
+            1 for anchor, pattern in _DISCLOSURE_PREFILTERS
+            if anchor in text_lc and pattern.search(document_text)
         )
 
         # Determine privilege type and satisfied elements
-        if "work product" in document_text.lower() or "anticipation of litigation" in document_text.lower():
+        if "work product" in text_lc or "anticipation of litigation" in text_lc:
             privilege_type = "work_product"
             elements = _PRIVILEGE_TYPES["work_product"]["elements"]
             for element in elements:
-                if element == "prepared_in_anticipation_of_litigation" and "litigation" in document_text.lower():
+                if element == "prepared_in_anticipation_of_litigation" and "litigation" in text_lc:
                     elements_satisfied.append(element)
                 elif element == "prepared_by_party_or_representative" and author:
                     elements_satisfied.append(element)
@@ -284,7 +320,7 @@ class PrivilegePreserver:
             else:
                 elements_missing.append("communication_with_attorney")
             elements_satisfied.append("confidential_nature")
-            if "advice" in document_text.lower() or "opinion" in document_text.lower():
+            if "advice" in text_lc or "opinion" in text_lc:
                 elements_satisfied.append("legal_advice_sought")
             else:
                 elements_missing.append("legal_advice_sought")
@@ -293,7 +329,7 @@ class PrivilegePreserver:
         # Check waiver risks
         if recipients and len(recipients) > 5:
             waiver_risks.append("Wide distribution may constitute waiver — review recipient list.")
-        if "forwarded" in document_text.lower() and privilege_type:
+        if "forwarded" in text_lc and privilege_type:
             waiver_risks.append("Document was forwarded — check if forwarding waived privilege.")
 
         # Compute confidence score
@@ -339,7 +375,7 @@ class PrivilegePreserver:
             reviewer_notes=reviewer_notes,
         )
 
-        logger.info(
+        logger.debug(
             "Document privilege classification complete",
             classification_id=classification_id,
             document_id=document_id,
@@ -399,8 +435,10 @@ class PrivilegePreserver:
             review_date=datetime.now(tz=timezone.utc),
         )
         self._privilege_log.append(entry)
+        self._by_type_counts[entry.privilege_type] += 1
+        self._redacted_count += bool(is_redacted)
 
-        logger.info(
+        logger.debug(
             "Privilege log entry created",
             entry_id=entry.entry_id,
             entry_number=self._log_entry_counter,
@@ -414,16 +452,17 @@ class PrivilegePreserver:
         """Apply automated redaction to a privileged document.
 
         Identifies and redacts legal advice content, privilege headers,
-        and attorney communications.
+        and attorney communications. Overlapping spans are collapsed into a
+        single redaction marker.
 
         Args:
             document_text: Full text of the document to redact.
             privilege_type: The privilege type for redaction context.
 
         Returns:
-            Tuple of (redacted_text, list of (start, end) redaction spans).
+            Tuple of (redacted_text, list of (start, end) redaction spans
+            in ascending order).
         """
-        redacted = document_text
         spans: list[tuple[int, int]] = []
 
         # Redact privilege header block if present
@@ -444,12 +483,21 @@ class PrivilegePreserver:
             start, end = match.span(1)
             spans.append((start, end))
 
-        # Apply redactions in reverse order (preserve offsets)
-        spans_sorted = sorted(set(spans), key=lambda s: s[0], reverse=True)
+        # Copy the kept text and markers forward in one pass, then join once
+        spans_sorted = sorted(set(spans))
+        parts: list[str] = []
+        cursor = 0
         for start, end in spans_sorted:
-            redacted = redacted[:start] + _REDACTION_MARKER + redacted[end:]
-
-        logger.info(
+            if start < cursor:
+                cursor = max(cursor, end)
+                continue
+            parts.append(document_text[cursor:start])
+            parts.append(_REDACTION_MARKER)
+            cursor = end
+        parts.append(document_text[cursor:])
+        redacted = "".join(parts)
+
+        logger.debug(
             "Document redaction applied",
             privilege_type=privilege_type,
             redaction_count=len(spans),
@@ -472,14 +520,17 @@ class PrivilegePreserver:
         Returns:
             Dict with is_inadvertent, privilege_indicators, and recommended_action.
         """
+        # Up to two hits per pattern, in pattern order; each scan stops after
+        # its second match and is skipped when the pattern's anchor is absent.
+        text_lc = document_text.lower()
         privilege_hits: list[str] = []
-        for pattern in _INADVERTENT_DISCLOSURE_PATTERNS:
-            matches = pattern.findall(document_text)
-            privilege_hits.extend(matches[:2])
+        for anchor, pattern in _DISCLOSURE_PREFILTERS:
+            if anchor in text_lc:
+                privilege_hits.extend(match.group() for match in itertools.islice(pattern.finditer(document_text), 2))
 
         is_inadvertent = len(privilege_hits) >= 1
 
-        logger.info(
+        logger.debug(
             "Inadvertent disclosure detection",
             document_id=document_id,
             is_inadvertent=is_inadvertent,
@@ -606,7 +657,7 @@ class PrivilegePreserver:
             "Seek quick-peek agreement or claw-back provision before production.",
         ] if triggered_risks else ["No immediate mitigation required; standard privilege protections apply."]
 
-        logger.info(
+        logger.debug(
             "Waiver risk assessment complete",
             document_id=document_id,
             privilege_type=privilege_type,
@@ -629,26 +680,15 @@ class PrivilegePreserver:
         Returns:
             List of privilege log entry dicts in FRCP 26(b)(5) format.
         """
-        return [
-            {
-                "entry_number": entry.entry_number,
-                "entry_id": entry.entry_id,
-                "case_number": entry.case_number,
-                "document_id": entry.document_id,
-                "bates_number": entry.bates_number,
-                "document_type": entry.document_type,
-                "document_date": entry.document_date.isoformat() if entry.document_date else None,
-                "author": entry.author,
-                "recipients": entry.recipients,
-                "privilege_type": entry.privilege_type,
-                "privilege_basis": entry.privilege_basis,
-                "subject_matter": entry.subject_matter,
-                "is_redacted": entry.is_redacted,
-                "reviewing_attorney": entry.reviewing_attorney,
-                "review_date": entry.review_date.isoformat(),
-            }
-            for entry in sorted(self._privilege_log, key=lambda e: e.entry_number)
-        ]
+        # Entries are appended with increasing entry numbers, so the log is
+        # already in entry_number order.
+        exported: list[dict[str, Any]] = []
+        for entry in self._privilege_log:
+            row = dict(zip(_LOG_EXPORT_FIELDS, _get_log_export_fields(entry), strict=True))
+            row["document_date"] = entry.document_date.isoformat() if entry.document_date else None
+            row["review_date"] = entry.review_date.isoformat()
+            exported.append(row)
+        return exported
 
     def get_review_summary(self) -> dict[str, Any]:
         """Return a summary of the privilege review for the case.
@@ -657,20 +697,14 @@ class PrivilegePreserver:
             Dict with privilege log statistics and clawback status.
         """
         total = len(self._privilege_log)
-        by_type: dict[str, int] = {}
-        redacted_count = 0
-        for entry in self._privilege_log:
-            by_type[entry.privilege_type] = by_type.get(entry.privilege_type, 0) + 1
-            if entry.is_redacted:
-                redacted_count += 1
-
+        redacted_count = self._redacted_count
         return {
             "case_number": self._case_number,
             "reviewing_firm": self._reviewing_firm,
             "total_privileged_documents": total,
             "redacted_count": redacted_count,
             "withheld_count": total - redacted_count,
-            "privilege_type_breakdown": by_type,
+            "privilege_type_breakdown": dict(self._by_type_counts),
             "clawback_requests_initiated": len(self._clawback_requests),
             "clawback_pending": sum(
                 1 for r in self._clawback_requests.values() if r.status == "pending"
@@ -138,7 +138,6 @@ class PrivilegeService:
             check_id=check.id,
             document_id=document_id,
             is_privileged=is_privileged,
-            correlation_id=str(uuid.uuid4()),
         )
 
         return check
@@ -254,7 +253,6 @@ class EDiscoveryService:
             tenant_id=tenant.tenant_id,
             job_id=job.id,
             case_name=case_name,
-            correlation_id=str(uuid.uuid4()),
         )
 
         return job
@@ -567,7 +565,6 @@ class PrivilegeLogService:
             tenant_id=tenant.tenant_id,
             entry_id=entry.id,
             document_id=document_id,
-            correlation_id=str(uuid.uuid4()),
         )
 
         return entry
@@ -687,7 +684,6 @@ class LegalHoldService:
             hold_id=hold.id,
             hold_name=hold_name,
             custodians=custodians,
-            correlation_id=str(uuid.uuid4()),
         )
 
         return hold
@@ -749,7 +745,6 @@ class LegalHoldService:
             tenant_id=tenant.tenant_id,
             hold_id=hold_id,
             release_reason=release_reason,
-            correlation_id=str(uuid.uuid4()),
         )
 
         logger.info(
@@ -1524,7 +1519,6 @@ class LegalHoldLifecycleService:
             hold_id=uuid.UUID(hold_record.get("hold_id", str(uuid.uuid4()))),
             hold_name=hold_name,
             custodians=custodians,
-            correlation_id=str(uuid.uuid4()),
         )
         return hold_record
 
@@ -1,13 +1,15 @@
 """AumOS Legal Overlay service entry point."""
 
-from collections.abc import AsyncGenerator
+import uuid
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request, Response
 
 from aumos_common.app import create_app
 from aumos_common.database import init_database
 
+from aumos_legal_overlay.adapters.kafka import correlation_id_var
 from aumos_legal_overlay.api.router import router
 from aumos_legal_overlay.settings import Settings
 
@@ -45,4 +47,26 @@ app: FastAPI = create_app(
     ],
 )
 
+
+@app.middleware("http")
+async def bind_correlation_id(
+    request: Request,
+    call_next: Callable[[Request], Awaitable[Response]],
+) -> Response:
+    """Bind the request's correlation ID for domain events published while handling it.
+
+    Args:
+        request: Incoming HTTP request; X-Correlation-ID is used when present.
+        call_next: Next handler in the middleware chain.
+
+    Returns:
+        The downstream response.
+    """
+    token = correlation_id_var.set(request.headers.get("X-Correlation-ID") or str(uuid.uuid4()))
+    try:
+        return await call_next(request)
+    finally:
+        correlation_id_var.reset(token)
+
+
 app.include_router(router, prefix="/api/v1")
@@ -0,0 +1,20 @@
+"""Unit tests for the shared identifier helpers."""
+
+import uuid
+
+from aumos_legal_overlay.adapters.identifiers import uuid4_batch
+
+
+class TestUuid4Batch:
+    """Tests for uuid4_batch."""
+
+    def test_generates_distinct_canonical_uuid4s(self) -> None:
+        """Every id is a canonical version-4 UUID string and none repeat."""
+        ids = uuid4_batch(500)
+
+        assert len(set(ids)) == 500
+        assert all(str(uuid.UUID(value)) == value and uuid.UUID(value).version == 4 for value in ids)
+
+    def test_zero_count_is_empty(self) -> None:
+        """Asking for no ids returns an empty list."""
+        assert uuid4_batch(0) == []
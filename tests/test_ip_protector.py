@@ -0,0 +1,163 @@
+"""Unit tests for IPProtector adapter.
+
+Tests asset registration, infringement risk, clearance workflows, and
+portfolio reporting without any infrastructure dependencies.
+"""
+
+import uuid
+from dataclasses import replace
+from datetime import date, timedelta
+from typing import Any
+
+import pytest
+
+from aumos_legal_overlay.adapters.ip_protector import IPAsset, IPProtector
+
+
+@pytest.fixture
+def protector() -> IPProtector:
+    """Provide an IPProtector instance for testing.
+
+    Returns:
+        IPProtector scoped to a test tenant.
+    """
+    return IPProtector(tenant_id="tenant-test")
+
+
+class TestAssetLifecycle:
+    """Tests for registration, assessment, and clearance on the registry."""
+
+    def test_register_asset_sets_status_from_registration(self, protector: IPProtector) -> None:
+        """Registered assets are active; unregistered ones are pending."""
+        registered = protector.register_asset(
+            "patent", "Widget", "Acme", "Widget patent", ["US"],
+            registration_number="US-1", registration_date=date(2020, 1, 1),
+        )
+        pending = protector.register_asset("trademark", "Acme", "Acme", "Brand", ["US"])
+
+        assert isinstance(registered, IPAsset)
+        assert registered.status == "active"
+        assert registered.expiration_date is not None
+        assert pending.status == "pending"
+
+    def test_register_asset_rejects_unknown_type(self, protector: IPProtector) -> None:
+        """Unknown asset types must raise ValueError."""
+        with pytest.raises(ValueError, match="Unknown asset_type"):
+            protector.register_asset("formula", "X", "Acme", "X", ["US"])
+
+    def test_classify_model_ip_flags_scraped_data(self, protector: IPProtector) -> None:
+        """Scraped training data must surface as a risk factor."""
+        result = protector.classify_model_ip("model-a", ["scraped_web"], "transformer", True)
+
+        assert result["model_name"] == "model-a"
+        assert result["risk_factors"]
+
+    def test_assess_infringement_risk_for_registered_asset(self, protector: IPProtector) -> None:
+        """Assessment runs for a registered asset and rejects unknown IDs."""
+        asset = protector.register_asset("copyright", "Docs", "Acme", "Manual", ["US"])
+
+        assessment = protector.assess_infringement_risk(asset.asset_id, ["code_generation"], ["scraped_web"], ["US"])
+
+        assert assessment.asset_id == asset.asset_id
+        with pytest.raises(KeyError):
+            protector.assess_infringement_risk("missing", [], [], [])
+
+    def test_clearance_workflow_blocks_on_name_conflict(self, protector: IPProtector) -> None:
+        """A same-type, same-jurisdiction name match must block clearance."""
+        protector.register_asset("trademark", "Acme", "Acme", "Brand", ["US"])
+
+        result = protector.run_clearance_workflow("Acme Cloud", "trademark", "US")
+
+        assert result["clearance_status"] == "blocked"
+        assert len(result["conflicts_found"]) == 1
+
+
+class TestPortfolioReport:
+    """Tests for portfolio aggregation over the asset registry."""
+
+    def test_expiring_assets_are_sorted_by_days_remaining(self, protector: IPProtector) -> None:
+        """Only assets expiring within a year are listed, soonest first."""
+        soon = date.today() - timedelta(days=20 * 365 - 100)
+        sooner = date.today() - timedelta(days=20 * 365 - 10)
+        protector.register_asset(
+            "patent", "Widget", "Acme", "Widget", ["US", "EU"], "US-1", date(2001, 1, 1), asset_id="asset-1"
+        )
+        protector.register_asset("patent", "Gadget", "Acme", "Gadget", ["US"], "US-2", soon, asset_id="asset-2")
+        protector.register_asset("patent", "Gizmo", "Acme", "Gizmo", ["US"], "US-3", sooner, asset_id="asset-3")
+        protector.register_asset("trademark", "Acme", "Acme", "Brand", ["US"], asset_id="asset-4")
+
+        report = protector.generate_portfolio_report()
+
+        assert [entry["asset_id"] for entry in report["expiring_within_12_months"]] == ["asset-3", "asset-2"]
+        assert report["assets_by_status"] == {"active": 3, "pending": 1}
+
+    def test_reregistered_asset_is_counted_once(self, protector: IPProtector) -> None:
+        """Re-registering an asset_id replaces the earlier asset."""
+        protector.register_asset("patent", "Widget", "Acme", "Widget", ["US"], asset_id="asset-1")
+        protector.register_asset("patent", "Widget", "Acme", "Widget", ["US"], "US-1", asset_id="asset-1")
+
+        report = protector.generate_portfolio_report()
+
+        assert report["total_assets"] == 1
+        assert report["assets_by_type"] == {"patent": 1}
+        assert report["assets_by_status"] == {"active": 1}
+
+    def test_report_reads_current_asset_fields(self, protector: IPProtector) -> None:
+        """Changes made on an asset after registration are reported."""
+        asset = protector.register_asset("patent", "Widget", "Acme", "Widget", ["US"], "US-1")
+        asset.status = "lapsed"
+        asset.asset_type = "trade_secret"
+        asset.ai_related = True
+
+        report = protector.generate_portfolio_report()
+
+        assert report["assets_by_status"] == {"lapsed": 1}
+        assert report["assets_by_type"] == {"trade_secret": 1}
+        assert report["ai_related_assets"] == 1
+
+
+class TestBulkRegistration:
+    """Tests that register_assets_bulk matches repeated register_asset calls."""
+
+    _ROWS: tuple[dict[str, Any], ...] = (
+        {"asset_type": "patent", "asset_name": "Widget", "owner": "Acme", "description": "Widget",
+         "jurisdiction": ["US"], "registration_number": "US-1", "registration_date": date(2020, 1, 1)},
+        {"asset_type": "trade_secret", "asset_name": "Weights", "owner": "Acme", "description": "Model weights",
+         "jurisdiction": ["US", "EU"], "ai_related": True, "asset_id": "asset-fixed"},
+        {"asset_type": "trademark", "asset_name": "Acme", "owner": "Acme", "description": "Brand",
+         "jurisdiction": ["EU"], "asset_id": None},
+    )
+
+    def test_bulk_matches_scalar_registration(self) -> None:
+        """Bulk and one-by-one registration yield the same assets apart from generated IDs."""
+        bulk = IPProtector(tenant_id="tenant-test").register_assets_bulk([dict(row) for row in self._ROWS])
+        scalar_protector = IPProtector(tenant_id="tenant-test")
+        scalar = [scalar_protector.register_asset(**row) for row in self._ROWS]
+
+        assert len(bulk) == len(scalar)
+        for bulk_asset, scalar_asset in zip(bulk, scalar, strict=True):
+            if scalar_asset.asset_id == "asset-fixed":
+                assert bulk_asset == scalar_asset
+            else:
+                assert uuid.UUID(bulk_asset.asset_id).version == 4
+                assert replace(bulk_asset, asset_id=scalar_asset.asset_id) == scalar_asset
+
+    def test_bulk_generates_unique_ids_and_keeps_input_rows(self) -> None:
+        """Generated IDs are distinct and the caller's row dicts are not modified."""
+        rows = [dict(self._ROWS[0]) for _ in range(50)]
+        protector = IPProtector(tenant_id="tenant-test")
+
+        assets = protector.register_assets_bulk(rows)
+
+        assert len({asset.asset_id for asset in assets}) == 50
+        assert protector.generate_portfolio_report()["total_assets"] == 50
+        assert all("asset_id" not in row for row in rows)
+
+    def test_bulk_rejects_unknown_type_after_earlier_rows(self) -> None:
+        """A bad row raises ValueError; earlier rows stay registered."""
+        protector = IPProtector(tenant_id="tenant-test")
+        rows = [dict(self._ROWS[0]), {**self._ROWS[0], "asset_type": "formula"}]
+
+        with pytest.raises(ValueError, match="Unknown asset_type"):
+            protector.register_assets_bulk(rows)
+        assert protector.generate_portfolio_report()["total_assets"] == 1
@@ -0,0 +1,147 @@
+"""Unit tests for JurisdictionRuleEngine adapter.
+
+Tests rule lookup and privilege risk assessment without any
+infrastructure dependencies.
+"""
+
+from datetime import date
+
+import pytest
+
+from aumos_legal_overlay.adapters.jurisdiction_rules import (
+    JurisdictionRule,
+    JurisdictionRuleEngine,
+    JurisdictionTrie,
+)
+
+
+@pytest.fixture
+def engine() -> JurisdictionRuleEngine:
+    """Provide a JurisdictionRuleEngine with the built-in rule set.
+
+    Returns:
+        Configured JurisdictionRuleEngine.
+    """
+    return JurisdictionRuleEngine()
+
+
+class TestPrivilegeRiskAssessment:
+    """Tests for assess_privilege_risk and its batch variant."""
+
+    def test_eu_in_house_counsel_is_high_risk(self, engine: JurisdictionRuleEngine) -> None:
+        """EU in-house counsel communications are not privileged (Akzo Nobel)."""
+        assessment = engine.assess_privilege_risk("EU", "email", is_in_house_counsel=True)
+
+        assert not assessment.privilege_likely
+        assert assessment.risk_level == "high"
+
+    def test_batch_matches_scalar_assessments(self, engine: JurisdictionRuleEngine) -> None:
+        """The batch path returns the same assessments, in order, as scalar calls."""
+        records = [
+            ("US-CA", "email", False, False),
+            ("EU", "email", True, False),
+            ("UK", "strategy_memo", True, False),
+            ("US-CA", "analysis_memo", False, True),
+            ("DE", "meeting_notes", True, True),
+            ("XX", "email", False, False),
+        ]
+
+        batch = engine.assess_privilege_risk_batch(records)
+
+        assert [assessment.to_dict() for assessment in batch] == [
+            engine.assess_privilege_risk(*record).to_dict() for record in records
+        ]
+
+    def test_batch_of_nothing_is_empty(self, engine: JurisdictionRuleEngine) -> None:
+        """An empty batch returns an empty list."""
+        assert engine.assess_privilege_risk_batch([]) == []
+
+
+class TestJurisdictionRule:
+    """Tests for the immutable rule value type."""
+
+    def test_rules_are_hashable(self) -> None:
+        """Rules hash by value, including rules that carry metadata."""
+        rule = JurisdictionRule(
+            "US-CA", "attorney_client", "Cal. Evid. Code 954", date(1967, 1, 1), metadata={"source": "import"}
+        )
+        same = JurisdictionRule(
+            "US-CA", "attorney_client", "Cal. Evid. Code 954", date(1967, 1, 1), metadata={"source": "import"}
+        )
+
+        assert hash(rule) == hash(same)
+        assert len({rule, same}) == 1
+        assert all(isinstance(hash(r), int) for r in JurisdictionRuleEngine().get_rules("US-CA"))
+
+
+class TestJurisdictionResolution:
+    """Tests for parent jurisdiction resolution through the code trie."""
+
+    def test_trie_resolves_prefixes_then_parents(self) -> None:
+        """Registered prefix codes come longest first, then parent aliases."""
+        trie = JurisdictionTrie()
+        for code in ("US", "US-CA", "DE"):
+            trie.insert(code)
+        trie.add_parent("US", "US-FEDERAL", descendants_only=True)
+        trie.add_parent("DE", "EU")
+
+        assert trie.ancestors("US-CA") == ["US-CA", "US", "US-FEDERAL"]
+        assert trie.ancestors("US-CA-LA") == ["US-CA-LA", "US-CA", "US", "US-FEDERAL"]
+        assert trie.ancestors("US") == ["US"]
+        assert trie.ancestors("DE") == ["DE", "EU"]
+
+    def test_state_rules_precede_federal_rules(self, engine: JurisdictionRuleEngine) -> None:
+        """US-CA and its sub-jurisdictions get state rules, then US-FEDERAL rules."""
+        codes = [rule.jurisdiction_code for rule in engine.get_rules("US-CA")]
+
+        assert codes == ["US-CA", "US-CA", "US-FEDERAL", "US-FEDERAL", "US-FEDERAL"]
+        assert engine.get_rules("US-CA-LA") == engine.get_rules("US-CA")
+        assert engine.get_rules("US") == []
+
+    def test_eu_member_states_inherit_eu_rules(self, engine: JurisdictionRuleEngine) -> None:
+        """Member states resolve to EU rules after any rules of their own."""
+        assert [rule.jurisdiction_code for rule in engine.get_rules("DE")] == ["DE", "EU"]
+        assert [rule.jurisdiction_code for rule in engine.get_rules("FR")] == ["EU"]
+        assert engine.get_rules("XX") == []
+
+
+class TestRuleSupersession:
+    """Tests for superseding rules by rule_id."""
+
+    @staticmethod
+    def _rule(rule_id: str, description: str, supersedes_rule_id: str | None = None) -> JurisdictionRule:
+        """Build a US-NV attorney-client rule.
+
+        Args:
+            rule_id: Stable identifier of the rule.
+            description: Rule description.
+            supersedes_rule_id: rule_id of the rule this one replaces, if any.
+
+        Returns:
+            The JurisdictionRule.
+        """
+        return JurisdictionRule(
+            "US-NV", "attorney_client", description, date(2020, 1, 1),
+            rule_id=rule_id, supersedes_rule_id=supersedes_rule_id,
+        )
+
+    def test_superseded_rule_is_deactivated_and_drops_out_of_lookups(self, engine: JurisdictionRuleEngine) -> None:
+        """The superseded rule is kept inactive and no longer returned."""
+        engine.add_custom_rule(self._rule("nv-ac-1", "Original rule"))
+        assert [r.rule_id for r in engine.get_rules("US-NV", "attorney_client")] == ["nv-ac-1", None]
+
+        engine.add_custom_rule(self._rule("nv-ac-2", "Amended rule", supersedes_rule_id="nv-ac-1"))
+
+        assert [r.rule_id for r in engine.get_rules("US-NV", "attorney_client")] == ["nv-ac-2", None]
+        assert [r.rule_id for r in engine.get_rules("US-NV")][:1] == ["nv-ac-2"]
+        assert not engine._by_id["nv-ac-1"].is_active
+        assert engine.assess_privilege_risk("US-NV", "email").applicable_rules[0]["description"] == "Amended rule"
+
+    def test_unknown_supersedes_id_only_adds_the_rule(self, engine: JurisdictionRuleEngine) -> None:
+        """Superseding an unknown rule_id leaves existing rules active."""
+        before = engine.get_rules("US-NV")
+
+        engine.add_custom_rule(self._rule("nv-ac-1", "New rule", supersedes_rule_id="missing"))
+
+        assert engine.get_rules("US-NV")[1:] == before
+        assert engine._by_id["nv-ac-1"].is_active
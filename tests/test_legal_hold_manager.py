@@ -0,0 +1,336 @@
+"""Unit tests for LegalHoldManager adapter.
+
+Tests hold creation, custodian acknowledgement and reminders, compliance
+monitoring, and hold export without any infrastructure dependencies.
+"""
+
+import json
+import os
+from contextvars import ContextVar
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+import pytest
+
+from aumos_legal_overlay.adapters import legal_hold_manager
+from aumos_legal_overlay.adapters.legal_hold_manager import LegalHoldManager, LegalHoldRecord
+
+# Stand-in for request-scoped logging context such as a bound correlation ID.
+_request_id: ContextVar[str | None] = ContextVar("request_id", default=None)
+
+
+@pytest.fixture
+def manager() -> LegalHoldManager:
+    """Provide a LegalHoldManager instance for testing.
+
+    Returns:
+        LegalHoldManager for a test firm.
+    """
+    return LegalHoldManager(issuing_firm="Firm LLP")
+
+
+def _create_hold(manager: LegalHoldManager, custodians: list[str]) -> LegalHoldRecord:
+    """Create a litigation hold over the given custodians.
+
+    Args:
+        manager: Manager to create the hold on.
+        custodians: Custodian names, in notice order.
+
+    Returns:
+        The created LegalHoldRecord.
+    """
+    return manager.create_hold(
+        hold_name="Acme v. Widget",
+        case_name="Acme Corp v. Widget Inc",
+        matter_type="litigation",
+        issuing_attorney="J. Doe",
+        custodians=custodians,
+        data_sources=["email", "slack"],
+        case_number="1:24-cv-0001",
+    )
+
+
+class TestCustodianTracking:
+    """Tests for acknowledgement and reminder handling."""
+
+    def test_acknowledgement_clears_pending(self, manager: LegalHoldManager) -> None:
+        """An acknowledged custodian is no longer pending; a repeat is rejected."""
+        hold = _create_hold(manager, ["Alice", "Bob"])
+
+        record = manager.record_acknowledgement(hold.hold_id, "Alice")
+
+        assert record is not None
+        assert record.status == "acknowledged"
+        assert manager.record_acknowledgement(hold.hold_id, "Alice") is None
+        assert manager.monitor_compliance()["total_pending_acknowledgements"] == 1
+
+    def test_custodians_sharing_a_name_are_acknowledged_in_turn(self, manager: LegalHoldManager) -> None:
+        """Each acknowledgement for a shared name takes the next unacknowledged record."""
+        hold = _create_hold(manager, ["Alex Smith", "Alex Smith"])
+
+        first = manager.record_acknowledgement(hold.hold_id, "Alex Smith")
+        second = manager.record_acknowledgement(hold.hold_id, "Alex Smith")
+
+        assert first is hold.custodian_records[0]
+        assert second is hold.custodian_records[1]
+        assert manager.record_acknowledgement(hold.hold_id, "Alex Smith") is None
+        assert manager.monitor_compliance()["fully_compliant_holds"] == 1
+
+    def test_reminder_targets_unacknowledged_custodian_with_shared_name(
+        self, manager: LegalHoldManager
+    ) -> None:
+        """Reminders for a shared name skip the custodian who already acknowledged."""
+        hold = _create_hold(manager, ["Alex Smith", "Alex Smith"])
+        manager.record_acknowledgement(hold.hold_id, "Alex Smith")
+
+        reminder = manager.send_reminder(hold.hold_id, "Alex Smith")
+
+        assert reminder is not None
+        assert hold.custodian_records[0].reminder_count == 0
+        assert hold.custodian_records[1].reminder_count == 1
+
+    def test_reminder_after_acknowledgement_returns_none(self, manager: LegalHoldManager) -> None:
+        """No reminder is sent to a custodian who has acknowledged."""
+        hold = _create_hold(manager, ["Alice"])
+        manager.record_acknowledgement(hold.hold_id, "Alice")
+
+        assert manager.send_reminder(hold.hold_id, "Alice") is None
+        assert manager.send_reminder(hold.hold_id, "Nobody") is None
+
+
+class TestBulkCustodianUpdates:
+    """Tests that the bulk acknowledgement and reminder paths match the scalar ones."""
+
+    _CUSTODIANS = ("Alice", "Bob", "Alex Smith", "Alex Smith", "Carol")
+
+    @staticmethod
+    def _custodian_state(hold: LegalHoldRecord) -> list[tuple[str, str, int, bool]]:
+        """Summarise each custodian's tracking fields, in hold order."""
+        return [
+            (c.custodian_name, c.status, c.reminder_count, c.acknowledged_at is None)
+            for c in hold.custodian_records
+        ]
+
+    def test_bulk_acknowledgements_match_scalar(self) -> None:
+        """Bulk acknowledgement updates the same records as one call per name."""
+        names = ["Alex Smith", "Bob", "Nobody", "Bob", "Alex Smith", "Alex Smith"]
+        scalar_manager = LegalHoldManager(issuing_firm="Firm LLP")
+        bulk_manager = LegalHoldManager(issuing_firm="Firm LLP")
+        scalar_hold = _create_hold(scalar_manager, list(self._CUSTODIANS))
+        bulk_hold = _create_hold(bulk_manager, list(self._CUSTODIANS))
+
+        scalar = [scalar_manager.record_acknowledgement(scalar_hold.hold_id, name) for name in names]
+        bulk = bulk_manager.record_acknowledgements_bulk(bulk_hold.hold_id, names)
+
+        assert [scalar_hold.custodian_records.index(r) for r in scalar if r is not None] == [
+            bulk_hold.custodian_records.index(r) for r in bulk
+        ]
+        assert self._custodian_state(bulk_hold) == self._custodian_state(scalar_hold)
+        assert [e["event"] for e in bulk_manager.get_hold_audit_trail(bulk_hold.hold_id)] == [
+            e["event"] for e in scalar_manager.get_hold_audit_trail(scalar_hold.hold_id)
+        ]
+        assert bulk_manager.monitor_compliance() == scalar_manager.monitor_compliance()
+
+    def test_bulk_reminders_match_scalar(self) -> None:
+        """Bulk reminders send one reminder per distinct name, like scalar calls."""
+        names = ["Alice", "Alex Smith", "Alice", "Nobody", "Carol"]
+        scalar_manager = LegalHoldManager(issuing_firm="Firm LLP")
+        bulk_manager = LegalHoldManager(issuing_firm="Firm LLP")
+        scalar_hold = _create_hold(scalar_manager, list(self._CUSTODIANS))
+        bulk_hold = _create_hold(bulk_manager, list(self._CUSTODIANS))
+        scalar_manager.record_acknowledgement(scalar_hold.hold_id, "Carol")
+        bulk_manager.record_acknowledgement(bulk_hold.hold_id, "Carol")
+
+        scalar: dict[str, str] = {}
+        for name in dict.fromkeys(names):
+            reminder = scalar_manager.send_reminder(scalar_hold.hold_id, name)
+            if reminder is not None:
+                scalar[name] = reminder
+        bulk = bulk_manager.send_reminders_bulk(bulk_hold.hold_id, names)
+
+        assert list(bulk) == ["Alice", "Alex Smith"]
+        assert bulk == scalar
+        assert self._custodian_state(bulk_hold) == self._custodian_state(scalar_hold)
+
+    def test_bulk_calls_on_unknown_hold_are_empty(self, manager: LegalHoldManager) -> None:
+        """Unknown hold IDs yield empty results rather than raising."""
+        assert manager.record_acknowledgements_bulk("missing", ["Alice"]) == []
+        assert manager.send_reminders_bulk("missing", ["Alice"]) == {}
+
+
+class TestComplianceMonitoring:
+    """Tests that the column-based compliance sweep matches a per-custodian scan."""
+
+    @staticmethod
+    def _backdate(hold: LegalHoldRecord, custodian_name: str, days: int) -> None:
+        """Move a custodian's notice time back by the given number of days."""
+        position = next(i for i, c in enumerate(hold.custodian_records) if c.custodian_name == custodian_name)
+        custodian = hold.custodian_records[position]
+        custodian.notice_sent_at = datetime.now(tz=timezone.utc) - timedelta(days=days)
+        hold.notice_sent_us[position] = legal_hold_manager._epoch_microseconds(custodian.notice_sent_at)
+
+    @staticmethod
+    def _scan_compliance(manager: LegalHoldManager, overdue_days: int, ack_days: int) -> dict[str, Any]:
+        """Compute the compliance summary one custodian at a time, without updating statuses."""
+        now = datetime.now(tz=timezone.utc)
+        summary: dict[str, Any] = {
+            "total_active_holds": 0,
+            "fully_compliant_holds": 0,
+            "holds_with_overdue_custodians": 0,
+            "total_pending_acknowledgements": 0,
+            "total_overdue_custodians": 0,
+            "overdue_custodian_list": [],
+        }
+        for hold in manager._holds.values():
+            if hold.status != "active":
+                continue
+            summary["total_active_holds"] += 1
+            pending = [c for c in hold.custodian_records if c.status == "pending"]
+            overdue = [c for c in pending if (now - c.notice_sent_at).days >= overdue_days]
+            summary["overdue_custodian_list"] += [
+                {
+                    "hold_id": hold.hold_id,
+                    "hold_name": hold.hold_name,
+                    "custodian": c.custodian_name,
+                    "days_overdue": (now - c.notice_sent_at).days - ack_days,
+                }
+                for c in overdue
+            ]
+            summary["total_pending_acknowledgements"] += len(pending)
+            summary["total_overdue_custodians"] += len(overdue)
+            if not pending:
+                summary["fully_compliant_holds"] += 1
+            elif overdue:
+                summary["holds_with_overdue_custodians"] += 1
+        return summary
+
+    def test_backdated_notices_match_custodian_scan(self) -> None:
+        """Custodians past the escalation threshold are flagged once, with the same days overdue."""
+        manager = LegalHoldManager(issuing_firm="Firm LLP", acknowledgement_deadline_days=5, overdue_threshold_days=14)
+        mixed = _create_hold(manager, ["Alice", "Bob", "Carol", "Dana", "Eve"])
+        late = _create_hold(manager, ["Frank", "Grace"])
+        compliant = _create_hold(manager, ["Heidi"])
+        manager.record_acknowledgement(mixed.hold_id, "Eve")
+        manager.record_acknowledgement(compliant.hold_id, "Heidi")
+        for name, days in (("Alice", 2), ("Bob", 6), ("Carol", 14), ("Dana", 30), ("Eve", 30)):
+            self._backdate(mixed, name, days)
+        for name in ("Frank", "Grace"):
+            self._backdate(late, name, 10)
+
+        expected = self._scan_compliance(manager, overdue_days=14, ack_days=5)
+        summary = manager.monitor_compliance()
+
+        assert summary == expected
+        assert [(e["custodian"], e["days_overdue"]) for e in summary["overdue_custodian_list"]] == [
+            ("Carol", 9),
+            ("Dana", 25),
+        ]
+        assert summary["holds_with_overdue_custodians"] == 1
+        assert [c.status for c in mixed.custodian_records] == [
+            "pending", "pending", "overdue", "overdue", "acknowledged",
+        ]
+
+        expected = self._scan_compliance(manager, overdue_days=14, ack_days=5)
+        repeat = manager.monitor_compliance()
+
+        assert repeat == expected
+        assert repeat["overdue_custodian_list"] == []
+        assert repeat["total_pending_acknowledgements"] == 4
+
+
+class TestHoldExport:
+    """Tests for export_hold_summary and its JSON bytes variant."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_summary_bytes_match_json_encoded_summary(
+        self, manager: LegalHoldManager, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """The bytes export decodes to the same document as the dict export."""
+        if not use_orjson:
+            monkeypatch.setattr(legal_hold_manager, "orjson", None)
+        elif legal_hold_manager.orjson is None:
+            pytest.skip("orjson is not installed")
+        hold = _create_hold(manager, ["Alice", "Bob"])
+        manager.record_acknowledgement(hold.hold_id, "Alice")
+        manager.release_hold(hold.hold_id, "Case settled", "J. Doe")
+
+        exported = manager.export_hold_summary_bytes(hold.hold_id)
+
+        assert json.loads(exported) == json.loads(json.dumps(manager.export_hold_summary(hold.hold_id)))
+
+    def test_unknown_hold_exports_error(self, manager: LegalHoldManager) -> None:
+        """Both exports report a missing hold the same way."""
+        assert json.loads(manager.export_hold_summary_bytes("missing")) == manager.export_hold_summary("missing")
+
+
+class _RecordingLogger:
+    """Captures info records together with the context they were written in."""
+
+    def __init__(self) -> None:
+        """Start with no captured records."""
+        self.records: list[tuple[str, dict[str, object], str | None]] = []
+
+    def info(self, event: str, **fields: object) -> None:
+        """Capture an info record and the current request ID."""
+        self.records.append((event, fields, _request_id.get()))
+
+
+class TestBatchedLogging:
+    """Tests for the background log batcher used with batch_logging=True."""
+
+    def test_close_writes_records_held_in_a_partial_batch(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Records already pulled into an unfinished batch are written on close."""
+        recorder = _RecordingLogger()
+        monkeypatch.setattr(legal_hold_manager, "logger", recorder)
+        batcher = legal_hold_manager._LogBatcher(max_records=100, flush_interval=60.0)
+
+        for index in range(3):
+            batcher.put("event", {"index": index})
+        batcher.close()
+
+        assert [fields["index"] for _, fields, _ in recorder.records] == [0, 1, 2]
+
+    def test_records_keep_the_callers_context(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Each record is written inside the context it was queued from."""
+        recorder = _RecordingLogger()
+        monkeypatch.setattr(legal_hold_manager, "logger", recorder)
+        batcher = legal_hold_manager._LogBatcher(max_records=2, flush_interval=60.0)
+
+        for request_id in ("req-1", "req-2", None):
+            token = _request_id.set(request_id)
+            try:
+                batcher.put("event", {})
+            finally:
+                _request_id.reset(token)
+        batcher.close()
+        batcher.put("after close", {})
+
+        assert [(event, request_id) for event, _, request_id in recorder.records] == [
+            ("event", "req-1"),
+            ("event", "req-2"),
+            ("event", None),
+            ("after close", None),
+        ]
+
+    @pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+    def test_forked_child_writes_through_its_own_batcher(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """A child forked after the batcher started still writes its records."""
+        recorder = _RecordingLogger()
+        monkeypatch.setattr(legal_hold_manager, "logger", recorder)
+        parent_batcher = legal_hold_manager._log_batcher()
+        read_fd, write_fd = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            batcher = legal_hold_manager._log_batcher()
+            batcher.put("child event", {})
+            batcher.close()
+            fresh = batcher is not parent_batcher
+            os.write(write_fd, f"{fresh} {len(recorder.records)}".encode())
+            os._exit(0)
+        os.close(write_fd)
+        with os.fdopen(read_fd, "rb") as reader:
+            child_report = reader.read().decode()
+        os.waitpid(pid, 0)
+
+        assert child_report == "True 1"
@@ -0,0 +1,247 @@
+"""Unit tests for LiabilityAssessor adapter.
+
+Tests risk categorization, exposure estimation, assessment reports, and
+report export without any infrastructure dependencies.
+"""
+
+import itertools
+import json
+import os
+from dataclasses import replace
+from typing import Any
+
+import pytest
+
+from aumos_legal_overlay.adapters import liability_assessor
+from aumos_legal_overlay.adapters.liability_assessor import LiabilityAssessmentReport, LiabilityAssessor
+
+
+@pytest.fixture
+def assessor() -> LiabilityAssessor:
+    """Provide a LiabilityAssessor instance for testing.
+
+    Returns:
+        Configured LiabilityAssessor.
+    """
+    return LiabilityAssessor()
+
+
+class TestAssess:
+    """Tests for LiabilityAssessor.assess."""
+
+    def test_assess_autonomous_medical_system_is_critical(self, assessor: LiabilityAssessor) -> None:
+        """An autonomous high-stakes medical system without oversight is critical risk."""
+        report = assessor.assess(
+            "triage-bot",
+            "medical_diagnosis",
+            "EU",
+            is_autonomous=True,
+            high_stakes_decisions=True,
+            human_oversight=False,
+            affected_users_estimate=10_000,
+        )
+
+        assert isinstance(report, LiabilityAssessmentReport)
+        assert report.risk_level == "critical"
+        assert 0.0 <= report.overall_risk_score <= 1.0
+
+    def test_assess_issues_distinct_ids_for_identical_inputs(self, assessor: LiabilityAssessor) -> None:
+        """Memoized analysis must not reuse assessment IDs."""
+        first = assessor.assess("chatbot", "customer_service_chatbot", "US")
+        second = assessor.assess("chatbot", "customer_service_chatbot", "US")
+
+        assert first.assessment_id != second.assessment_id
+        assert assessor.export_as_dict(first) | {"assessment_id": None} == (
+            assessor.export_as_dict(second) | {"assessment_id": None}
+        )
+
+    def test_reference_data_cannot_be_changed_through_a_report(self, assessor: LiabilityAssessor) -> None:
+        """Shared tables are read-only on reports; exported copies are independent."""
+        report = assessor.assess("chatbot", "customer_service_chatbot", "US-CA")
+
+        with pytest.raises(TypeError):
+            report.jurisdiction_rules["burden_of_proof"] = "none"  # type: ignore[index]
+        with pytest.raises(TypeError):
+            report.insurance_requirements["minimum_coverage_usd"] = 0  # type: ignore[index]
+        exported = assessor.export_as_dict(report)
+        exported["jurisdiction_rules"]["burden_of_proof"] = "none"
+        exported["insurance_requirements"]["policy_types"].append("Extra policy")
+
+        later = assessor.export_as_dict(assessor.assess("router", "customer_service_chatbot", "US-CA"))
+        assert later["jurisdiction_rules"]["burden_of_proof"] == "shared"
+        assert later["insurance_requirements"]["policy_types"] == ["General Liability", "Professional Liability"]
+
+
+class TestCategorizeRisk:
+    """Tests that the escalation lookup table matches the escalation rules."""
+
+    @staticmethod
+    def _escalate(ai_domain: str, is_autonomous: bool, high_stakes: bool, human_oversight: bool) -> str:
+        """Apply the escalation rules step by step."""
+        risk_order = ["low", "medium", "high", "critical"]
+        base_risk = liability_assessor._AI_DOMAIN_RISK_LEVELS.get(ai_domain, "medium")
+        risk_index = risk_order.index(base_risk)
+        if is_autonomous and high_stakes:
+            risk_index = min(3, risk_index + 1)
+        if not human_oversight and base_risk in ("high", "critical"):
+            risk_index = min(3, risk_index + 1)
+        return risk_order[risk_index]
+
+    def test_every_combination_matches_escalation_rules(self, assessor: LiabilityAssessor) -> None:
+        """Each domain, including an unknown one, escalates as the rules say for all flag combinations."""
+        domains = [*liability_assessor._AI_DOMAIN_RISK_LEVELS, "unlisted_domain"]
+
+        for domain, flags in itertools.product(domains, itertools.product((False, True), repeat=3)):
+            assert assessor.categorize_risk(domain, *flags) == self._escalate(domain, *flags), (domain, flags)
+
+
+class TestJsonExport:
+    """Tests that export_as_json encodes the same report with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_json_matches_dict_export(
+        self, assessor: LiabilityAssessor, monkeypatch: pytest.MonkeyPatch, use_orjson: bool
+    ) -> None:
+        """Both encoders produce JSON equal to export_as_dict, including the reference tables."""
+        if use_orjson and liability_assessor.orjson is None:
+            pytest.skip("orjson is not installed")
+        if not use_orjson:
+            monkeypatch.setattr(liability_assessor, "orjson", None)
+        report = assessor.assess("scorer", "financial_lending", "US-CA", high_stakes_decisions=True)
+
+        encoded = assessor.export_as_json(report)
+
+        assert isinstance(encoded, bytes)
+        assert json.loads(encoded) == assessor.export_as_dict(report)
+
+    def test_encoders_agree(self, assessor: LiabilityAssessor, monkeypatch: pytest.MonkeyPatch) -> None:
+        """The orjson and standard-library encodings decode to the same document."""
+        if liability_assessor.orjson is None:
+            pytest.skip("orjson is not installed")
+        report = assessor.assess("triage-bot", "medical_diagnosis", "EU", is_autonomous=True)
+        with_orjson = assessor.export_as_json(report)
+        monkeypatch.setattr(liability_assessor, "orjson", None)
+
+        assert json.loads(assessor.export_as_json(report)) == json.loads(with_orjson)
+
+
+class TestExportCache:
+    """Tests for export_as_dict_cached."""
+
+    def test_repeat_export_returns_the_cached_dict(self, assessor: LiabilityAssessor) -> None:
+        """A cache hit returns the same dict, equal to a fresh export."""
+        report = assessor.assess("chatbot", "customer_service_chatbot", "US")
+
+        first = assessor.export_as_dict_cached(report)
+
+        assert assessor.export_as_dict_cached(report) is first
+        assert first == assessor.export_as_dict(report)
+
+    def test_least_recently_used_export_is_evicted(
+        self, assessor: LiabilityAssessor, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """A full cache drops the export used least recently."""
+        monkeypatch.setattr(liability_assessor, "_EXPORT_CACHE_SIZE", 2)
+        first, second, third = (assessor.assess(f"system-{i}", "customer_service_chatbot", "US") for i in range(3))
+        first_export = assessor.export_as_dict_cached(first)
+        second_export = assessor.export_as_dict_cached(second)
+        assessor.export_as_dict_cached(first)
+        assessor.export_as_dict_cached(third)
+
+        assert assessor.export_as_dict_cached(first) is first_export
+        assert assessor.export_as_dict_cached(second) is not second_export
+
+    def test_caches_are_per_assessor(self) -> None:
+        """Each assessor keeps its own export cache."""
+        first_assessor = LiabilityAssessor()
+        second_assessor = LiabilityAssessor()
+        report = first_assessor.assess("chatbot", "customer_service_chatbot", "US")
+
+        exported = first_assessor.export_as_dict_cached(report)
+
+        assert second_assessor.export_as_dict_cached(report) is not exported
+        assert second_assessor.export_as_dict_cached(report) == exported
+
+
+class TestBatchExport:
+    """Tests that export_batch carries the same data as export_as_dict per report."""
+
+    @staticmethod
+    def _resolve(shared: dict[str, Any], exported: dict[str, Any]) -> dict[str, Any]:
+        """Inline the shared reference data a batch-exported report points to."""
+        resolved = dict(exported)
+        mitigation_ref = resolved.pop("mitigation_ref", None)
+        if mitigation_ref is not None:
+            resolved["mitigation_strategies"] = shared["mitigation_strategies"][mitigation_ref]
+            resolved["insurance_requirements"] = shared["insurance_requirements"][mitigation_ref]
+        jurisdiction_ref = resolved.pop("jurisdiction_ref", None)
+        if jurisdiction_ref is not None:
+            resolved["jurisdiction_rules"] = shared["jurisdiction_rules"][jurisdiction_ref]
+        return resolved
+
+    def test_batch_resolves_to_per_report_exports(self, assessor: LiabilityAssessor) -> None:
+        """Every batch entry, with references resolved, equals export_as_dict."""
+        reports = [
+            assessor.assess("triage-bot", "medical_diagnosis", "EU", is_autonomous=True),
+            assessor.assess("chatbot", "customer_service_chatbot", "US"),
+            assessor.assess("scorer", "financial_lending", "EU", high_stakes_decisions=True),
+            assessor.assess("router", "customer_service_chatbot", "US-CA"),
+        ]
+        # Same risk level and jurisdiction keys, but distinct reference objects.
+        reports.append(replace(
+            reports[1],
+            mitigation_strategies=(*reports[1].mitigation_strategies, "Extra control."),
+            jurisdiction_rules=dict(reports[1].jurisdiction_rules),
+        ))
+
+        batch = assessor.export_batch(reports)
+
+        assert [self._resolve(batch["_shared"], exported) for exported in batch["reports"]] == [
+            assessor.export_as_dict(report) for report in reports
+        ]
+        assert "mitigation_ref" in batch["reports"][1]
+        assert "mitigation_ref" not in batch["reports"][4]
+        assert "jurisdiction_ref" not in batch["reports"][4]
+
+
+class TestExposureEstimation:
+    """Tests that estimate_exposure_batch matches estimate_exposure per system."""
+
+    def test_batch_matches_scalar_estimates(self, assessor: LiabilityAssessor) -> None:
+        """Element i of every batch column equals the scalar estimate for system i."""
+        risk_levels = ["critical", "high", "medium", "low", "unknown", "high"]
+        revenues = [12_500_000.0, 0.0, 1_234_567.89, 250.5, 99_999.99, 3_000_000.0]
+        users = [100_000, 5, 0, 42, 1_000, 7_500]
+        jurisdictions = ["EU", "US", "US-CA", "UK", "XX", "EU"]
+
+        batch = assessor.estimate_exposure_batch(risk_levels, revenues, users, jurisdictions)
+
+        for index, args in enumerate(zip(risk_levels, revenues, users, jurisdictions, strict=True)):
+            scalar = assessor.estimate_exposure(*args)
+            for key, column in batch.items():
+                assert int(column[index]) == scalar[key], (index, key)
+        assert set(batch) == set(scalar) - {"notes"}
+
+    def test_batch_rejects_mismatched_lengths(self, assessor: LiabilityAssessor) -> None:
+        """Input sequences of different lengths must raise ValueError."""
+        with pytest.raises(ValueError, match="same length"):
+            assessor.estimate_exposure_batch(["high"], [1.0, 2.0], [1], ["US"])
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_does_not_reuse_parent_assessment_ids() -> None:
+    """A child forked after ids were pooled must draw different ids from the parent."""
+    liability_assessor._next_assessment_id()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        os.close(read_fd)
+        os.write(write_fd, liability_assessor._next_assessment_id().encode())
+        os._exit(0)
+    os.close(write_fd)
+    with os.fdopen(read_fd, "rb") as reader:
+        child_id = reader.read().decode()
+    os.waitpid(pid, 0)
+
+    assert child_id
+    assert child_id != liability_assessor._next_assessment_id()
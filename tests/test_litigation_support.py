@@ -0,0 +1,195 @@
+"""Unit tests for LitigationSupport adapter.
+
+Tests document collection, TAR classification, and production packaging
+without any infrastructure dependencies.
+"""
+
+import hashlib
+from collections import Counter
+from datetime import datetime, timezone
+
+import numpy as np
+import pytest
+
+from aumos_legal_overlay.adapters import litigation_support
+from aumos_legal_overlay.adapters.litigation_support import DocumentRecord, LitigationSupport
+
+_START = datetime(2024, 1, 1, tzinfo=timezone.utc)
+_END = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+_DOCUMENTS = (
+    ("email", "Re: Project Agreement Terms"),
+    ("memo", "Status Update"),
+    ("spreadsheet", "Invoice #1042"),
+    ("contract", "Breach of contract claim"),
+    ("chat_message", "Lunch plans"),
+)
+
+
+@pytest.fixture
+def support() -> LitigationSupport:
+    """Provide a seeded LitigationSupport instance for testing.
+
+    Returns:
+        LitigationSupport for a test case.
+    """
+    return LitigationSupport(case_number="CASE-1", bates_prefix="ACME", seed=7)
+
+
+def _run_case(support: LitigationSupport) -> tuple[list[tuple[float, str]], int]:
+    """Collect documents one by one and in a batch, then produce them.
+
+    Args:
+        support: Handler to run the case on.
+
+    Returns:
+        Tuple of ((tar_confidence, tar_tier) per document, produced page count).
+    """
+    records = [support.collect_document("Alice", doc_type, subject, _START) for doc_type, subject in _DOCUMENTS]
+    records += support.collect_batch(["Alice", "Bob"], 50, _START, _END)
+    package = support.create_production()
+    return [(record.tar_confidence, record.tar_tier) for record in records], package.total_pages
+
+
+class TestSeededCollection:
+    """Tests that a seed makes every simulated draw reproducible."""
+
+    def test_same_seed_reproduces_case(self) -> None:
+        """Two handlers with the same seed score and produce identically."""
+        first = _run_case(LitigationSupport(case_number="CASE-1", seed=7))
+        second = _run_case(LitigationSupport(case_number="CASE-1", seed=7))
+
+        assert first == second
+
+    def test_different_seeds_differ(self) -> None:
+        """Different seeds draw different TAR scores."""
+        first, _ = _run_case(LitigationSupport(case_number="CASE-1", seed=7))
+        second, _ = _run_case(LitigationSupport(case_number="CASE-1", seed=8))
+
+        assert first != second
+
+    def test_collect_document_matches_batch_classifier(self, support: LitigationSupport) -> None:
+        """Scalar TAR scoring draws the same scores as the batch classifier."""
+        records = [support.collect_document("Alice", doc_type, subject, _START) for doc_type, subject in _DOCUMENTS]
+
+        confidences, tiers = litigation_support._classify_tar_batch(
+            np.random.default_rng(7),
+            [doc_type for doc_type, _ in _DOCUMENTS],
+            [subject for _, subject in _DOCUMENTS],
+        )
+
+        assert [record.tar_confidence for record in records] == confidences
+        assert [record.tar_tier for record in records] == tiers
+        assert all(isinstance(record.tar_confidence, float) for record in records)
+
+
+class TestCollection:
+    """Tests for Bates numbering across scalar and batch collection."""
+
+    def test_bates_numbers_continue_across_batch_and_scalar(self, support: LitigationSupport) -> None:
+        """Batch and single collection share one Bates sequence."""
+        batch = support.collect_batch(["Alice"], 3, _START, _END)
+        single = support.collect_document("Bob", "memo", "Status Update", _START)
+
+        assert [record.bates_number for record in batch] == ["ACME0000001", "ACME0000002", "ACME0000003"]
+        assert single.bates_number == "ACME0000004"
+        assert support.get_case_statistics()["total_collected"] == 4
+
+
+class TestColumnarStore:
+    """Tests that column scans agree with a scan over the document records."""
+
+    @staticmethod
+    def _scan_responsive(records: list[DocumentRecord], confidence_threshold: float) -> list[str]:
+        """Return ids of non-privileged records at or above a TAR confidence, in collection order."""
+        return [r.document_id for r in records if r.tar_confidence >= confidence_threshold and not r.is_privileged]
+
+    @staticmethod
+    def _scan_statistics(records: list[DocumentRecord]) -> dict[str, object]:
+        """Recompute the column-backed statistics from the records themselves."""
+        return {
+            "total_collected": len(records),
+            "privileged_count": sum(r.is_privileged for r in records),
+            "responsive_count": sum(r.is_responsive for r in records),
+            "produced_count": sum(r.production_status == "produced" for r in records),
+            "tar_tier_distribution": dict(Counter(r.tar_tier for r in records)),
+        }
+
+    def _reviewed_case(self, support: LitigationSupport) -> list[DocumentRecord]:
+        """Collect past the initial column capacity and privilege-review some documents."""
+        records = support.collect_batch(["Alice", "Bob", "Carol"], 1500, _START, _END, privilege_rate=0.1)
+        records.append(support.collect_document("Dana", "memo", "Breach of contract claim", _START))
+        responsive = [r for r in records if r.tar_confidence >= 0.65 and not r.is_privileged]
+        for record in responsive[:25]:
+            support.apply_privilege_review(record.document_id, ["work_product"], "J. Doe")
+        cleared = next(r for r in records if r.is_privileged)
+        support.apply_privilege_review(cleared.document_id, [], "J. Doe")
+        return records
+
+    def test_responsive_documents_match_record_scan(self, support: LitigationSupport) -> None:
+        """The responsive filter follows privilege reviews at every threshold."""
+        records = self._reviewed_case(support)
+
+        for threshold in (0.0, 0.3, 0.65, 0.85, 1.0):
+            found = [r.document_id for r in support.identify_responsive_documents(threshold)]
+            assert found == self._scan_responsive(records, threshold), threshold
+
+    def test_statistics_match_record_scan(self, support: LitigationSupport) -> None:
+        """Privilege, responsiveness, tier, and production counts match the records."""
+        records = self._reviewed_case(support)
+        support.create_production()
+
+        statistics = support.get_case_statistics()
+
+        assert {key: statistics[key] for key in self._scan_statistics(records)} == self._scan_statistics(records)
+        assert statistics["produced_count"] == len(self._scan_responsive(records, 0.65))
+
+    def test_privilege_review_removes_document_from_production(self, support: LitigationSupport) -> None:
+        """A document tagged privileged after collection is withheld from production."""
+        record = support.collect_document("Alice", "contract", "Breach of contract claim", _START)
+        assert [r.document_id for r in support.identify_responsive_documents(0.0)] == [record.document_id]
+
+        support.apply_privilege_review(record.document_id, ["attorney_client"], "J. Doe")
+        package = support.create_production()
+
+        assert record.production_status == "withheld_privilege"
+        assert package.document_count == 0
+        assert support.get_case_statistics()["privileged_count"] == 1
+
+
+class TestProduction:
+    """Tests for the production package create_production builds."""
+
+    def test_integrity_hash_is_sha256_of_joined_bates_manifest(self, support: LitigationSupport) -> None:
+        """The streamed manifest hash equals hashing the "|"-joined Bates numbers."""
+        support.collect_batch(["Alice", "Bob"], 200, _START, _END)
+        support.collect_document("Carol", "contract", "Breach of contract claim", _START)
+
+        package = support.create_production()
+
+        bates = [entry["bates_number"] for entry in package.production_log]
+        assert package.document_count == len(bates) > 1
+        assert package.integrity_hash == hashlib.sha256("|".join(bates).encode()).hexdigest()
+
+    def test_empty_production_hashes_empty_manifest(self, support: LitigationSupport) -> None:
+        """A production with no documents hashes the empty manifest."""
+        package = support.create_production()
+
+        assert package.document_count == 0
+        assert package.integrity_hash == hashlib.sha256(b"").hexdigest()
+
+    def test_production_log_hex_encodes_stored_digests(self, support: LitigationSupport) -> None:
+        """Each logged file_hash is the 64-character hex of the record's 32-byte digest."""
+        records = support.collect_batch(["Alice", "Bob"], 200, _START, _END)
+        records.append(support.collect_document("Carol", "contract", "Breach of contract claim", _START))
+        by_id = {record.document_id: record for record in records}
+
+        package = support.create_production()
+
+        assert package.production_log
+        for entry in package.production_log:
+            digest = by_id[entry["document_id"]].file_hash
+            assert isinstance(digest, bytes)
+            assert len(digest) == 32
+            assert entry["file_hash"] == digest.hex()
+            assert len(entry["file_hash"]) == 64
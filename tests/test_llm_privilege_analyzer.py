@@ -0,0 +1,202 @@
+"""Unit tests for LLMPrivilegeAnalyzer adapter.
+
+Tests LLM classification, result caching, and pattern fallback against an
+in-process mock of aumos-llm-serving, without any infrastructure dependencies.
+"""
+
+import asyncio
+import json
+from unittest.mock import MagicMock
+
+import httpx
+import pytest
+
+from aumos_legal_overlay.adapters.llm_privilege_analyzer import LLMPrivilegeAnalyzer, PrivilegeType
+
+_METADATA = {"type": "email", "from": "counsel@firm.com", "to": "ceo@acme.com"}
+
+
+class _FakeLLMServing:
+    """Answers completion requests, failing for excerpts marked OFFLINE."""
+
+    def __init__(self) -> None:
+        """Start with no requests seen."""
+        self.requests = 0
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        """Classify the prompt as privileged if it mentions legal advice."""
+        self.requests += 1
+        prompt = json.loads(request.content)["prompt"]
+        if "OFFLINE" in prompt:
+            raise httpx.ConnectError("llm-serving unavailable", request=request)
+        privileged = "legal advice" in prompt
+        answer = {
+            "is_privileged": privileged,
+            "privilege_type": "attorney_client" if privileged else "not_privileged",
+            "confidence_score": 0.95 if privileged else 0.1,
+            "reasoning": "Request for legal advice." if privileged else "Routine business email.",
+        }
+        return httpx.Response(200, json={"choices": [{"text": json.dumps(answer)}]})
+
+
+@pytest.fixture
+def llm_serving() -> _FakeLLMServing:
+    """Provide the mock LLM serving endpoint.
+
+    Returns:
+        _FakeLLMServing that counts requests.
+    """
+    return _FakeLLMServing()
+
+
+def _make_analyzer(llm_serving: _FakeLLMServing, cache_size: int = 4096) -> LLMPrivilegeAnalyzer:
+    """Build an analyzer whose HTTP client is served by llm_serving.
+
+    Args:
+        llm_serving: Mock endpoint answering completion requests.
+        cache_size: Maximum number of cached LLM results.
+
+    Returns:
+        LLMPrivilegeAnalyzer with a pattern fallback that scores 0.9.
+    """
+    fallback = MagicMock()
+    fallback.score_document.return_value = 0.9
+    return LLMPrivilegeAnalyzer(
+        llm_serving_url="http://llm-serving",
+        llm_model_id="privilege-v1",
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(llm_serving)),
+        fallback_analyzer=fallback,
+        cache_size=cache_size,
+    )
+
+
+class TestResultCache:
+    """Tests for memoization of LLM classifications."""
+
+    async def test_repeat_document_is_served_from_cache(self, llm_serving: _FakeLLMServing) -> None:
+        """A repeated document skips the LLM and is marked llm_cached."""
+        analyzer = _make_analyzer(llm_serving)
+
+        first = await analyzer.analyze("doc-1", _METADATA, "Please give legal advice on the merger.")
+        second = await analyzer.analyze("doc-2", _METADATA, "Please give legal advice on the merger.")
+
+        assert first.analysis_method == "llm"
+        assert first.privilege_type == PrivilegeType.ATTORNEY_CLIENT
+        assert second.analysis_method == "llm_cached"
+        assert second.model_dump(exclude={"analysis_method"}) == first.model_dump(exclude={"analysis_method"})
+        assert llm_serving.requests == 1
+        assert analyzer.cache_info() == {"hits": 1, "misses": 1, "hit_rate": 0.5, "size": 1}
+
+    async def test_different_metadata_is_a_cache_miss(self, llm_serving: _FakeLLMServing) -> None:
+        """The same excerpt under different metadata is classified again."""
+        analyzer = _make_analyzer(llm_serving)
+
+        await analyzer.analyze("doc-1", _METADATA, "Quarterly numbers attached.")
+        await analyzer.analyze("doc-2", {**_METADATA, "to": "cfo@acme.com"}, "Quarterly numbers attached.")
+
+        assert llm_serving.requests == 2
+        assert analyzer.cache_info()["size"] == 2
+
+    async def test_pattern_fallback_is_not_cached(self, llm_serving: _FakeLLMServing) -> None:
+        """Fallback results are retried against the LLM on the next call."""
+        analyzer = _make_analyzer(llm_serving)
+
+        first = await analyzer.analyze("doc-1", _METADATA, "OFFLINE legal advice")
+        second = await analyzer.analyze("doc-1", _METADATA, "OFFLINE legal advice")
+
+        assert first.analysis_method == second.analysis_method == "pattern_fallback"
+        assert llm_serving.requests == 2
+        assert analyzer.cache_info()["size"] == 0
+
+    async def test_least_recently_used_result_is_evicted(self, llm_serving: _FakeLLMServing) -> None:
+        """A full cache drops its least recently used entry."""
+        analyzer = _make_analyzer(llm_serving, cache_size=2)
+
+        await analyzer.analyze("doc-a", _METADATA, "A")
+        await analyzer.analyze("doc-b", _METADATA, "B")
+        await analyzer.analyze("doc-a", _METADATA, "A")
+        await analyzer.analyze("doc-c", _METADATA, "C")
+        requests_before = llm_serving.requests
+        await analyzer.analyze("doc-a", _METADATA, "A")
+        await analyzer.analyze("doc-b", _METADATA, "B")
+
+        assert llm_serving.requests == requests_before + 1
+        assert analyzer.cache_info()["size"] == 2
+
+    async def test_zero_cache_size_disables_caching(self, llm_serving: _FakeLLMServing) -> None:
+        """With cache_size=0 every call reaches the LLM."""
+        analyzer = _make_analyzer(llm_serving, cache_size=0)
+
+        await analyzer.analyze("doc-1", _METADATA, "A")
+        result = await analyzer.analyze("doc-1", _METADATA, "A")
+
+        assert result.analysis_method == "llm"
+        assert llm_serving.requests == 2
+        assert analyzer.cache_info()["size"] == 0
+
+
+class _SlowLLMServing(_FakeLLMServing):
+    """Answers after a pause, recording the most requests seen in flight."""
+
+    def __init__(self) -> None:
+        """Start with nothing in flight."""
+        super().__init__()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:  # type: ignore[override]
+        """Yield to other requests before answering."""
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(0.01)
+            return super().__call__(request)
+        finally:
+            self.in_flight -= 1
+
+
+class TestAnalyzeMany:
+    """Tests that analyze_many matches sequential analyze calls."""
+
+    _DOCUMENTS = (
+        ("doc-1", _METADATA, "Please give legal advice on the merger."),
+        ("doc-2", _METADATA, "Quarterly numbers attached."),
+        ("doc-3", _METADATA, "Please give legal advice on the merger."),
+        ("doc-4", _METADATA, "OFFLINE legal advice"),
+        ("doc-5", {**_METADATA, "to": "cfo@acme.com"}, "Quarterly numbers attached."),
+        ("doc-6", _METADATA, "Quarterly numbers attached."),
+    )
+
+    async def test_matches_sequential_analysis(self) -> None:
+        """Results, LLM requests, and cache counters equal one-by-one analysis."""
+        sequential_serving = _FakeLLMServing()
+        sequential_analyzer = _make_analyzer(sequential_serving)
+        sequential = [await sequential_analyzer.analyze(*document) for document in self._DOCUMENTS]
+        batch_serving = _SlowLLMServing()
+        batch_analyzer = _make_analyzer(batch_serving)
+
+        batch = await batch_analyzer.analyze_many(self._DOCUMENTS)
+
+        assert [result.model_dump() for result in batch] == [result.model_dump() for result in sequential]
+        assert [result.analysis_method for result in batch] == [
+            "llm", "llm", "llm_cached", "pattern_fallback", "llm", "llm_cached",
+        ]
+        assert batch_serving.requests == sequential_serving.requests
+        assert batch_analyzer.cache_info() == sequential_analyzer.cache_info()
+
+    async def test_concurrency_is_bounded(self) -> None:
+        """No more than max_concurrency LLM requests are in flight at once."""
+        llm_serving = _SlowLLMServing()
+        analyzer = _make_analyzer(llm_serving)
+        documents = [(f"doc-{index}", _METADATA, f"Document {index}") for index in range(20)]
+
+        results = await analyzer.analyze_many(documents, max_concurrency=4)
+
+        assert len(results) == 20
+        assert llm_serving.requests == 20
+        assert 1 < llm_serving.max_in_flight <= 4
+
+    async def test_empty_batch_is_empty(self, llm_serving: _FakeLLMServing) -> None:
+        """An empty batch returns an empty list without calling the LLM."""
+        assert await _make_analyzer(llm_serving).analyze_many([]) == []
+        assert llm_serving.requests == 0
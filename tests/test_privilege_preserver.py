@@ -0,0 +1,81 @@
+"""Unit tests for PrivilegePreserver adapter.
+
+Tests privilege classification, privilege logging, redaction, disclosure
+detection, and clawback handling without any infrastructure dependencies.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+
+from aumos_legal_overlay.adapters.privilege_preserver import PrivilegePreserver
+
+_PRIVILEGED_EMAIL = (
+    "PRIVILEGED AND CONFIDENTIAL\n"
+    "Attorney-client communication. Our advice is to settle before trial. "
+    "Do not forward."
+)
+
+
+@pytest.fixture
+def preserver() -> PrivilegePreserver:
+    """Provide a PrivilegePreserver instance for testing.
+
+    Returns:
+        PrivilegePreserver for a test case.
+    """
+    return PrivilegePreserver(case_number="CASE-1", reviewing_firm="Firm LLP")
+
+
+class TestPrivilegeReview:
+    """Tests for the per-document privilege review paths."""
+
+    def test_classify_document_detects_attorney_client(self, preserver: PrivilegePreserver) -> None:
+        """Privilege markers plus an attorney author must classify as privileged."""
+        classification = preserver.classify_document(
+            "doc-1", _PRIVILEGED_EMAIL, "email", author="Jane Doe, Esq.", recipients=["client@example.com"]
+        )
+
+        assert classification.is_privileged
+        assert classification.privilege_type == "attorney_client"
+
+    def test_privilege_log_feeds_review_summary(self, preserver: PrivilegePreserver) -> None:
+        """Log entries are numbered sequentially and tallied in the summary."""
+        classification = preserver.classify_document("doc-1", _PRIVILEGED_EMAIL, "email", author="Jane Doe, Esq.")
+
+        first = preserver.add_to_privilege_log(classification, "email", "Settlement advice", "J. Doe")
+        second = preserver.add_to_privilege_log(
+            classification, "email", "Settlement advice", "J. Doe", is_redacted=True
+        )
+        summary = preserver.get_review_summary()
+
+        assert (first.entry_number, second.entry_number) == (1, 2)
+        assert summary["total_privileged_documents"] == 2
+        assert summary["redacted_count"] == 1
+        assert summary["withheld_count"] == 1
+        assert summary["privilege_type_breakdown"] == {"attorney_client": 2}
+
+    def test_redact_document_replaces_advice_and_header(self, preserver: PrivilegePreserver) -> None:
+        """Header and advice spans are redacted and reported in ascending order."""
+        redacted, spans = preserver.redact_document(_PRIVILEGED_EMAIL, "attorney_client")
+
+        assert "settle" not in redacted
+        assert "PRIVILEGED AND CONFIDENTIAL" not in redacted
+        assert spans == sorted(spans)
+
+    def test_detect_inadvertent_disclosure_flags_privileged_text(self, preserver: PrivilegePreserver) -> None:
+        """Privilege indicators in disclosed text must be reported."""
+        result = preserver.detect_inadvertent_disclosure("doc-1", _PRIVILEGED_EMAIL, "opposing@example.com")
+
+        assert result["is_inadvertent_disclosure"]
+
+    def test_clawback_and_waiver_risk(self, preserver: PrivilegePreserver) -> None:
+        """A clawback is recorded as pending and waiver risk is assessed."""
+        request = preserver.initiate_clawback(
+            "doc-1", "opposing@example.com", "attorney_client", datetime(2024, 1, 1, tzinfo=timezone.utc)
+        )
+        waiver = preserver.assess_waiver_risk("doc-1", ["voluntary disclosure"], "attorney_client")
+
+        assert request.status == "pending"
+        assert preserver.get_review_summary()["clawback_pending"] == 1
+        assert waiver["document_id"] == "doc-1"